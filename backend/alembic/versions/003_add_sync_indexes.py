@@ -0,0 +1,29 @@
+"""Add (user_id, updated_at) indexes for delta sync
+
+Revision ID: 003
+Revises: 292e86eacc7f
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: str | None = "292e86eacc7f"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLES = ("exercises", "workout_plans", "workout_entries")
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.create_index(f"ix_{table}_user_id_updated_at", table, ["user_id", "updated_at"])
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.drop_index(f"ix_{table}_user_id_updated_at", table_name=table)
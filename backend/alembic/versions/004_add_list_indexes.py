@@ -0,0 +1,51 @@
+"""Add composite partial indexes for list endpoints
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: str | None = "003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Each list endpoint filters on user_id and NOT is_deleted, then sorts
+LIST_INDEXES = {
+    "exercises": ["user_id", "name"],
+    "workout_plans": ["user_id", sa.text("date DESC"), sa.text("id DESC")],
+    "workout_entries": ["user_id", sa.text("date DESC"), sa.text("id DESC")],
+}
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for table, columns in LIST_INDEXES.items():
+            op.create_index(
+                f"ix_{table}_user_id_list",
+                table,
+                columns,
+                postgresql_where=sa.text("NOT is_deleted"),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in LIST_INDEXES:
+            op.drop_index(
+                f"ix_{table}_user_id_list",
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,108 @@
+"""Add exercise_stats table derived from logged sets
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: str | None = "005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "exercise_stats",
+        sa.Column("user_id", sa.String(36), primary_key=True),
+        sa.Column(
+            "exercise_id",
+            sa.String(36),
+            sa.ForeignKey("exercises.id"),
+            primary_key=True,
+        ),
+        sa.Column("max_weight", sa.Float(), nullable=True),
+        sa.Column("best_e1rm", sa.Float(), nullable=True),
+        sa.Column("best_set_volume", sa.Float(), nullable=True),
+        sa.Column("max_reps", sa.Integer(), nullable=True),
+        sa.Column("rep_records", postgresql.JSONB(), nullable=False),
+        sa.Column("total_sets", sa.Integer(), nullable=False),
+        sa.Column("total_reps", sa.Integer(), nullable=False),
+        sa.Column("total_volume", sa.Float(), nullable=False),
+        sa.Column("entry_count", sa.Integer(), nullable=False),
+        sa.Column("last_performed", sa.Date(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+    )
+
+    # Backfill from existing entries (same rules as app/services/exercise_stats.py at
+    # this revision; set values that are not numbers within bounds count as missing)
+    op.execute(
+        """
+        WITH counted AS (
+            SELECT we.user_id,
+                   we.id AS entry_id,
+                   we.exercise_id,
+                   we.date,
+                   CASE WHEN jsonb_typeof(s.value -> 'weight') = 'number' THEN
+                       CASE WHEN abs((s.value -> 'weight')::numeric) <= 100000
+                            THEN (s.value -> 'weight')::numeric::float END
+                   END AS weight,
+                   CASE WHEN jsonb_typeof(s.value -> 'reps') = 'number' THEN
+                       CASE WHEN abs((s.value -> 'reps')::numeric) <= 10000
+                            THEN (s.value -> 'reps')::numeric::int END
+                   END AS reps
+            FROM workout_entries AS we
+            CROSS JOIN LATERAL jsonb_array_elements(
+                CASE WHEN jsonb_typeof(we.sets) = 'array' THEN we.sets ELSE '[]'::jsonb END
+            ) AS s(value)
+            WHERE NOT we.is_deleted
+              AND coalesce(s.value ->> 'completed', 'true') <> 'false'
+        ),
+        rep_bests AS (
+            SELECT user_id, exercise_id, jsonb_object_agg(reps::text, best) AS rep_records
+            FROM (
+                SELECT user_id, exercise_id, reps, max(weight) AS best
+                FROM counted
+                WHERE reps > 0 AND weight IS NOT NULL
+                GROUP BY user_id, exercise_id, reps
+            ) AS by_reps
+            GROUP BY user_id, exercise_id
+        )
+        INSERT INTO exercise_stats (
+            user_id, exercise_id, max_weight, best_e1rm, best_set_volume, max_reps,
+            rep_records, total_sets, total_reps, total_volume, entry_count, last_performed,
+            updated_at
+        )
+        SELECT c.user_id,
+               c.exercise_id,
+               max(c.weight),
+               max(CASE WHEN c.reps = 1 THEN c.weight ELSE c.weight * (1 + c.reps / 30.0) END),
+               max(c.weight * c.reps),
+               max(c.reps),
+               coalesce(r.rep_records, '{}'::jsonb),
+               count(*),
+               coalesce(sum(c.reps), 0),
+               coalesce(sum(c.weight * c.reps), 0),
+               count(DISTINCT c.entry_id),
+               max(c.date),
+               now() AT TIME ZONE 'utc'
+        FROM counted AS c
+        JOIN exercises AS e ON e.id = c.exercise_id
+        LEFT JOIN rep_bests AS r
+            ON r.user_id = c.user_id AND r.exercise_id = c.exercise_id
+        GROUP BY c.user_id, c.exercise_id, r.rep_records
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("exercise_stats")
@@ -0,0 +1,83 @@
+"""Add volume_rollups table for per-muscle-group volume trends
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: str | None = "006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    muscle_group_enum = postgresql.ENUM(name="musclegroup", create_type=False)
+
+    op.create_table(
+        "volume_rollups",
+        sa.Column("user_id", sa.String(36), primary_key=True),
+        sa.Column("granularity", sa.String(5), primary_key=True),
+        sa.Column("period_start", sa.Date(), primary_key=True),
+        sa.Column("muscle_group", muscle_group_enum, primary_key=True),
+        sa.Column("entry_count", sa.Integer(), nullable=False),
+        sa.Column("set_count", sa.Integer(), nullable=False),
+        sa.Column("total_reps", sa.Integer(), nullable=False),
+        sa.Column("volume", sa.Float(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+    )
+
+    # Backfill from existing entries (same rules as app/services/volume_rollups.py;
+    # `python -m scripts.rebuild_rollups` recomputes them later if needed)
+    op.execute(
+        """
+        WITH per_entry AS (
+            SELECT we.user_id, we.date, e.muscle_group,
+                   count(s.value) AS set_count,
+                   coalesce(sum(s.reps), 0) AS total_reps,
+                   coalesce(sum(s.weight * s.reps), 0) AS volume
+            FROM workout_entries AS we
+            JOIN exercises AS e ON e.id = we.exercise_id
+            LEFT JOIN LATERAL (
+                SELECT value,
+                       CASE WHEN jsonb_typeof(value -> 'weight') = 'number' THEN
+                           CASE WHEN abs((value -> 'weight')::numeric) <= 100000
+                                THEN (value -> 'weight')::numeric::float END
+                       END AS weight,
+                       CASE WHEN jsonb_typeof(value -> 'reps') = 'number' THEN
+                           CASE WHEN abs((value -> 'reps')::numeric) <= 10000
+                                THEN (value -> 'reps')::numeric::int END
+                       END AS reps
+                FROM jsonb_array_elements(
+                    CASE WHEN jsonb_typeof(we.sets) = 'array' THEN we.sets ELSE '[]'::jsonb END
+                ) AS elements(value)
+                WHERE coalesce(value ->> 'completed', 'true') <> 'false'
+            ) AS s ON true
+            WHERE NOT we.is_deleted
+            GROUP BY we.id, we.user_id, we.date, e.muscle_group
+        )
+        INSERT INTO volume_rollups (
+            user_id, granularity, period_start, muscle_group,
+            entry_count, set_count, total_reps, volume, updated_at
+        )
+        SELECT p.user_id, g.granularity, date_trunc(g.granularity, p.date)::date,
+               p.muscle_group, count(*), sum(p.set_count), sum(p.total_reps), sum(p.volume),
+               now() AT TIME ZONE 'utc'
+        FROM per_entry AS p
+        CROSS JOIN (VALUES ('day'), ('week'), ('month')) AS g(granularity)
+        GROUP BY 1, 2, 3, 4
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("volume_rollups")
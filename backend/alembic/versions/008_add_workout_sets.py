@@ -0,0 +1,89 @@
+"""Add workout_sets table mirroring workout_entries.sets
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "008"
+down_revision: str | None = "007"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "workout_sets",
+        sa.Column(
+            "entry_id",
+            sa.String(36),
+            sa.ForeignKey("workout_entries.id"),
+            primary_key=True,
+        ),
+        sa.Column("ordinal", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.String(36), nullable=False),
+        sa.Column("set_id", sa.String(36), nullable=True),
+        sa.Column("weight", sa.Float(), nullable=True),
+        sa.Column("reps", sa.Integer(), nullable=True),
+        sa.Column("time_minutes", sa.Float(), nullable=True),
+        sa.Column("distance", sa.Float(), nullable=True),
+        sa.Column("rpe", sa.Float(), nullable=True),
+        sa.Column("completed", sa.Boolean(), nullable=False),
+    )
+
+    # Backfill from every entry, deleted ones included (same rules as
+    # app/services/workout_sets.py), before building the secondary index. Legacy
+    # rows may hold any JSON in a set; values that are not numbers within bounds
+    # are stored as NULL rather than failing the cast.
+    op.execute(
+        """
+        INSERT INTO workout_sets (
+            entry_id, ordinal, user_id, set_id,
+            weight, reps, time_minutes, distance, rpe, completed
+        )
+        SELECT we.id,
+               s.ordinal - 1,
+               we.user_id,
+               left(s.value ->> 'id', 36),
+               CASE WHEN jsonb_typeof(s.value -> 'weight') = 'number' THEN
+                   CASE WHEN abs((s.value -> 'weight')::numeric) <= 100000
+                        THEN (s.value -> 'weight')::numeric::float END
+               END,
+               CASE WHEN jsonb_typeof(s.value -> 'reps') = 'number' THEN
+                   CASE WHEN abs((s.value -> 'reps')::numeric) <= 10000
+                        THEN (s.value -> 'reps')::numeric::int END
+               END,
+               CASE WHEN jsonb_typeof(s.value -> 'timeMinutes') = 'number' THEN
+                   CASE WHEN abs((s.value -> 'timeMinutes')::numeric) <= 1000000000000000
+                        THEN (s.value -> 'timeMinutes')::numeric::float END
+               END,
+               CASE WHEN jsonb_typeof(s.value -> 'distance') = 'number' THEN
+                   CASE WHEN abs((s.value -> 'distance')::numeric) <= 1000000000000000
+                        THEN (s.value -> 'distance')::numeric::float END
+               END,
+               CASE WHEN jsonb_typeof(s.value -> 'rpe') = 'number' THEN
+                   CASE WHEN abs((s.value -> 'rpe')::numeric) <= 1000000000000000
+                        THEN (s.value -> 'rpe')::numeric::float END
+               END,
+               coalesce(s.value ->> 'completed', 'true') <> 'false'
+        FROM workout_entries AS we
+        CROSS JOIN LATERAL jsonb_array_elements(
+            CASE WHEN jsonb_typeof(we.sets) = 'array' THEN we.sets ELSE '[]'::jsonb END
+        ) WITH ORDINALITY AS s(value, ordinal)
+        """
+    )
+
+    op.create_index("ix_workout_sets_user_id", "workout_sets", ["user_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_workout_sets_user_id", table_name="workout_sets")
+    op.drop_table("workout_sets")
@@ -0,0 +1,133 @@
+import asyncio
+import gzip
+import hashlib
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.services.compressed_cache import compressed_cache
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/")
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 4  # Dynamic content: most of the size win at a fraction of q11's CPU
+
+
+def negotiate(accept_encoding: str) -> str | None:
+    """Pick ``br`` or ``gzip`` from an Accept-Encoding header by q-value; Brotli wins ties."""
+    weights: dict[str, float] = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        weight = 1.0
+        if params.strip().startswith("q="):
+            try:
+                weight = float(params.strip()[2:])
+            except ValueError:
+                weight = 0.0
+        if name:
+            weights[name.strip()] = weight
+
+    wildcard = weights.get("*", 0.0)
+    encodings = ("br", "gzip") if brotli is not None else ("gzip",)
+    best = max(encodings, key=lambda encoding: weights.get(encoding, wildcard))
+    return best if weights.get(best, wildcard) > 0 else None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+class CompressionMiddleware:
+    """
+    Compress complete JSON and text responses with Brotli or gzip.
+
+    Bodies under ``minimum_size`` go out as-is, bodies of at least
+    ``offload_size`` are compressed on a worker thread so the event loop keeps
+    serving other requests, and results for responses with an ETag are kept in
+    the compressed body cache. Streaming responses pass through untouched.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int, offload_size: int) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.offload_size = offload_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        await self.app(scope, receive, _Responder(self, encoding, send).send)
+
+    async def encode(self, body: bytes, encoding: str, etag: str | None) -> bytes:
+        digest = None
+        if etag and compressed_cache.enabled:
+            digest = hashlib.blake2b(body, digest_size=16).digest()
+            cached = compressed_cache.get(etag, encoding, digest)
+            if cached is not None:
+                return cached
+
+        if len(body) >= self.offload_size:
+            compressed = await asyncio.to_thread(compress, body, encoding)
+        else:
+            compressed = compress(body, encoding)
+
+        if digest is not None:
+            compressed_cache.put(etag, encoding, digest, compressed)
+        return compressed
+
+
+class _Responder:
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send) -> None:
+        self.middleware = middleware
+        self.encoding = encoding
+        self.send_downstream = send
+        self.start: Message | None = None
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if self.passthrough:
+            await self.send_downstream(message)
+            return
+
+        if message["type"] == "http.response.start":
+            self.start = message
+            return
+
+        if message["type"] != "http.response.body" or self.start is None:
+            await self.send_downstream(message)
+            return
+
+        start, self.start = self.start, None
+        body = message.get("body", b"")
+        headers = MutableHeaders(scope=start)
+
+        if (
+            message.get("more_body", False)
+            or len(body) < self.middleware.minimum_size
+            or "content-encoding" in headers
+            or not headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+        ):
+            self.passthrough = message.get("more_body", False)
+            await self.send_downstream(start)
+            await self.send_downstream(message)
+            return
+
+        compressed = await self.middleware.encode(body, self.encoding, headers.get("etag"))
+        headers["Content-Encoding"] = self.encoding
+        headers["Content-Length"] = str(len(compressed))
+        headers.add_vary_header("Accept-Encoding")
+        await self.send_downstream(start)
+        await self.send_downstream({"type": "http.response.body", "body": compressed})
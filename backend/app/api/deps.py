@@ -1,17 +1,33 @@
 from collections.abc import AsyncGenerator
+from dataclasses import dataclass
 from datetime import datetime
 
 from fastapi import Depends, HTTPException, status
 from sqlalchemy import select
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth import get_current_user
-from app.database import AsyncSessionLocal
+from app.config import settings
+from app.database import AsyncSessionLocal, ReadSessionLocal
 from app.models import User
+from app.services.known_users import known_users
+from app.services.last_login import last_login_writer
+from app.services.read_replica import replica_router
+from app.services.warmup import warmup
+
+
+@dataclass(frozen=True, slots=True)
+class AuthenticatedUser:
+    """Identity of the caller, taken from verified token claims."""
+
+    id: str
+    email: str | None
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Dependency for getting async database session."""
+    await warmup.wait()
     async with AsyncSessionLocal() as session:
         try:
             yield session
@@ -19,6 +35,36 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def get_read_db(
+    current_user: dict[str, str] = Depends(get_current_user),
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for read-only handlers: a replica session when one is usable.
+
+    Falls back to the primary when no replica is configured, when it is down or
+    lagging, and for users who wrote within the last few seconds.
+    """
+    await warmup.wait()
+    session = None
+    if replica_router.use_replica(current_user["id"]):
+        session = ReadSessionLocal()
+        try:
+            await session.connection()
+        except (OSError, TimeoutError, DBAPIError):
+            await session.close()
+            replica_router.mark_down()
+            session = None
+
+    if session is None:
+        session = AsyncSessionLocal()
+
+    async with session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
 async def get_current_user_with_db(
     db: AsyncSession = Depends(get_db),
     current_user: dict[str, str] = Depends(get_current_user),
@@ -45,3 +91,37 @@ async def get_current_user_with_db(
     await db.commit()
 
     return user
+
+
+async def get_authenticated_user(
+    db: AsyncSession = Depends(get_db),
+    current_user: dict[str, str] = Depends(get_current_user),
+) -> AuthenticatedUser:
+    """
+    Get current user for protected data endpoints.
+
+    With AUTH_TRUST_TOKEN enabled the verified token claims are trusted, and the
+    users table is only queried the first time this process sees a user ID.
+    last_login_at is recorded by the debounced background writer instead of a
+    commit on every request.
+    """
+    if not settings.AUTH_TRUST_TOKEN:
+        user = await get_current_user_with_db(db, current_user)
+        return AuthenticatedUser(id=user.id, email=user.email)
+
+    user_id = current_user["id"]
+
+    if user_id not in known_users:
+        result = await db.execute(select(User.id).where(User.id == user_id))
+        if result.scalar_one_or_none() is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found. Please register first.",
+            )
+        # Release the connection; the handler starts its own transaction
+        await db.commit()
+        known_users.add(user_id)
+
+    last_login_writer.touch(user_id)
+
+    return AuthenticatedUser(id=user_id, email=current_user.get("email"))
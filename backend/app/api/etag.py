@@ -0,0 +1,63 @@
+import hashlib
+
+from fastapi import Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories import get_data_version
+
+CACHE_CONTROL = "private, no-cache"
+
+DATA_VERSION_HEADER = "X-Data-Version"
+
+
+def _tags(header: str) -> list[str]:
+    # Weak comparison: W/"x" and "x" match each other
+    return [tag.strip().removeprefix("W/") for tag in header.split(",")]
+
+
+def collection_etag(data_version: int, model, user_id: str, request: Request) -> str:
+    """
+    Weak ETag for a user's collection, derived without loading any rows.
+
+    The user's data_version changes with every write, so it validates all of
+    their collections at once. Versions start at 0 for everyone, so the user ID
+    goes into the variant hash: otherwise two users with the same version and
+    query would share a tag. Query parameters are folded in because filters
+    and pages produce different bodies.
+    """
+    params = "&".join(sorted(f"{k}={v}" for k, v in request.query_params.multi_items()))
+    variant = hashlib.blake2b(
+        f"{user_id}/{model.__tablename__}?{params}".encode(), digest_size=6
+    ).hexdigest()
+    return f'W/"{data_version}-{variant}"'
+
+
+async def conditional_list(
+    request: Request, response: Response, db: AsyncSession, model, user_id: str
+) -> Response | None:
+    """
+    Attach the collection ETag and data version to ``response``.
+
+    Returns a ready 304 response when the client's If-None-Match already
+    matches, so the caller can skip loading and serializing rows.
+    """
+    data_version = await get_data_version(db, user_id)
+    etag = collection_etag(data_version, model, user_id, request)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": CACHE_CONTROL,
+        DATA_VERSION_HEADER: str(data_version),
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (
+        if_none_match.strip() == "*" or etag.removeprefix("W/") in _tags(if_none_match)
+    ):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={**headers, "Vary": "Authorization"}
+        )
+
+    response.headers.update(headers)
+    # The body depends on who is asking, so shared caches must key on the token
+    response.headers.add_vary_header("Authorization")
+    return None
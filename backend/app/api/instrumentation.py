@@ -0,0 +1,214 @@
+import time
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.api.query_guard import (
+    QueryBudgetExceeded,
+    budget_for,
+    log_slow_query,
+    normalize_sql,
+    report_request,
+)
+from app.config import settings
+from app.services.metrics import (
+    LATENCY_BUCKETS,
+    QUERY_COUNT_BUCKETS,
+    Collected,
+    Counter,
+    Gauge,
+    Histogram,
+    registry,
+)
+
+_UNRESOLVED = object()
+
+
+class QueryRecorder:
+    """
+    Statements run on behalf of one request.
+
+    Besides the totals for metrics, it logs slow statements and, while the
+    route has a query budget, tallies statement shapes so overruns and N+1
+    patterns can be reported when the request finishes. With
+    QUERY_BUDGET_ENFORCE the statement that breaks the budget raises instead.
+    """
+
+    __slots__ = ("scope", "count", "seconds", "shapes", "_budget")
+
+    def __init__(self, scope: Scope) -> None:
+        self.scope = scope
+        self.count = 0
+        self.seconds = 0.0
+        self.shapes: dict[str, int] = {}
+        self._budget = _UNRESOLVED
+
+    @property
+    def budget(self) -> int | None:
+        # Resolved on first use: the route is only known once routing has run
+        if self._budget is _UNRESOLVED:
+            self._budget = budget_for(route_endpoint(self.scope))
+        return self._budget
+
+    @property
+    def route(self) -> str:
+        return f"{self.scope['method']} {route_label(self.scope)}"
+
+    def record(self, statement: str, parameters, executemany: bool, elapsed: float) -> None:
+        self.count += 1
+        self.seconds += elapsed
+
+        if settings.SLOW_QUERY_MS and elapsed * 1000 >= settings.SLOW_QUERY_MS:
+            log_slow_query(self.route, statement, parameters, executemany, elapsed)
+
+        if self.budget is None:
+            return
+        shape = normalize_sql(statement)
+        self.shapes[shape] = self.shapes.get(shape, 0) + 1
+        if settings.QUERY_BUDGET_ENFORCE and self.count > self.budget:
+            raise QueryBudgetExceeded(
+                f"{self.route} ran {self.count} statements, "
+                f"over its budget of {self.budget}: {shape}"
+            )
+
+    def report(self) -> None:
+        if self.count and self.budget is not None:
+            report_request(self.route, self.count, self.budget, self.shapes)
+
+
+current_queries: ContextVar[QueryRecorder | None] = ContextVar("current_queries", default=None)
+
+requests_total = registry.register(
+    Counter(
+        "http_requests_total", "HTTP requests by route and status.", ("method", "route", "status")
+    )
+)
+requests_in_flight = registry.register(
+    Gauge("http_requests_in_flight", "HTTP requests being served.")
+)
+request_duration = registry.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "HTTP request latency, including streaming the body.",
+        LATENCY_BUCKETS,
+        ("method", "route"),
+    )
+)
+request_queries = registry.register(
+    Histogram(
+        "db_queries_per_request",
+        "Database statements executed per request.",
+        QUERY_COUNT_BUCKETS,
+        ("method", "route"),
+    )
+)
+request_db_time = registry.register(
+    Histogram(
+        "db_time_per_request_seconds",
+        "Time spent executing database statements per request.",
+        LATENCY_BUCKETS,
+        ("method", "route"),
+    )
+)
+
+
+def route_label(scope: Scope) -> str:
+    """Route template such as ``/api/v1/entries/{entry_id}``, keeping label cardinality bounded."""
+    # Newer FastAPI resolves included routers lazily; the matched route then
+    # carries its path relative to the router, and the full template lives here.
+    route = scope.get("fastapi", {}).get("effective_route_context") or scope.get("route")
+    return getattr(route, "path", "unmatched")
+
+
+def route_endpoint(scope: Scope):
+    route = scope.get("fastapi", {}).get("effective_route_context") or scope.get("route")
+    return getattr(route, "endpoint", None)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Attribute statements executed on ``engine`` to the request running them."""
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _started(conn, cursor, statement, parameters, context, executemany):
+        conn.info["query_started"] = time.perf_counter()
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def _finished(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.pop("query_started", None)
+        if started is None:
+            return
+        elapsed = time.perf_counter() - started
+        queries = current_queries.get()
+        if queries is not None:
+            queries.record(statement, parameters, executemany, elapsed)
+        elif settings.SLOW_QUERY_MS and elapsed * 1000 >= settings.SLOW_QUERY_MS:
+            log_slow_query("background task", statement, parameters, executemany, elapsed)
+
+
+def register_pool_metrics(engines: dict[str, AsyncEngine]) -> None:
+    """Expose connection pool state for each named engine."""
+
+    def collect(key: str):
+        return lambda: [((name,), engine.pool.stats()[key]) for name, engine in engines.items()]
+
+    labels = ("engine",)
+    for name, key, help, kind in (
+        ("db_pool_size", "size", "Connections the pool keeps open.", "gauge"),
+        ("db_pool_checked_out", "checked_out", "Connections in use.", "gauge"),
+        ("db_pool_overflow", "overflow", "Connections open beyond the pool size.", "gauge"),
+        ("db_pool_waiting", "waiting", "Checkouts waiting for a connection.", "gauge"),
+        ("db_pool_checkouts_total", "checkouts", "Connection checkouts.", "counter"),
+        ("db_pool_timeouts_total", "timeouts", "Checkouts that timed out.", "counter"),
+        (
+            "db_pool_checkout_wait_seconds_total",
+            "wait_seconds_total",
+            "Time spent waiting for connections.",
+            "counter",
+        ),
+    ):
+        registry.register(Collected(name, help, collect(key), labels, kind))
+
+
+class InstrumentationMiddleware:
+    """
+    Record latency, status and database work for every HTTP request.
+
+    Runs outermost so rejected and compressed responses are measured too. Routes
+    are labelled by template, and requests that match no route share one label.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        queries = QueryRecorder(scope)
+        token = current_queries.set(queries)
+        requests_in_flight.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            requests_in_flight.dec()
+            current_queries.reset(token)
+            queries.report()
+
+            method, route = scope["method"], route_label(scope)
+            requests_total.inc(method, route, status_code)
+            request_duration.observe(method, route, value=elapsed)
+            request_queries.observe(method, route, value=queries.count)
+            request_db_time.observe(method, route, value=queries.seconds)
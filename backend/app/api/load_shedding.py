@@ -0,0 +1,39 @@
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class LoadSheddingMiddleware:
+    """
+    Reject new API requests with 503 while the connection pool is saturated.
+
+    Once more than ``max_waiters`` checkouts are queued, every request admitted
+    would only wait behind them until it timed out, so it is turned away with a
+    Retry-After instead. Requests already in flight are unaffected, and routes
+    outside ``/api`` (health checks) are never shed.
+    """
+
+    def __init__(self, app: ASGIApp, engine: AsyncEngine, max_waiters: int, retry_after: int):
+        self.app = app
+        self.engine = engine
+        self.max_waiters = max_waiters
+        self.retry_after = retry_after
+        self.rejected = 0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] == "http"
+            and self.max_waiters > 0
+            and self.engine.pool.waiting > self.max_waiters
+            and scope["path"].startswith("/api/")
+        ):
+            self.rejected += 1
+            response = JSONResponse(
+                {"detail": "Server is busy, please retry shortly"},
+                status_code=503,
+                headers={"Retry-After": str(self.retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
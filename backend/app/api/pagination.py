@@ -0,0 +1,57 @@
+from datetime import date
+
+from fastapi import HTTPException, Query, status
+from sqlalchemy import Select, tuple_
+
+from app.api.cursors import decode_cursor, encode_cursor
+
+MAX_PAGE_SIZE = 500
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class DatePage:
+    """Query parameters for date-range filtering and (date, id) keyset pagination."""
+
+    def __init__(
+        self,
+        date_from: date | None = Query(None, alias="from"),
+        date_to: date | None = Query(None, alias="to"),
+        limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+        cursor: str | None = None,
+    ) -> None:
+        self.date_from = date_from
+        self.date_to = date_to
+        self.limit = limit
+        self.after = self._decode(cursor) if cursor else None
+
+    @staticmethod
+    def _decode(cursor: str) -> tuple[date, str]:
+        cursor_date, cursor_id = decode_cursor(cursor, 2)
+        try:
+            return date.fromisoformat(cursor_date), cursor_id
+        except ValueError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+    def apply(self, query: Select, model) -> Select:
+        """Filter by date range, seek past the cursor and order newest first."""
+        if self.date_from is not None:
+            query = query.where(model.date >= self.date_from)
+        if self.date_to is not None:
+            query = query.where(model.date <= self.date_to)
+        if self.after is not None:
+            query = query.where(tuple_(model.date, model.id) < self.after)
+
+        query = query.order_by(model.date.desc(), model.id.desc())
+        if self.limit is not None:
+            # One extra row tells us whether another page exists
+            query = query.limit(self.limit + 1)
+        return query
+
+    def split(self, rows: list) -> tuple[list, str | None]:
+        """Trim the look-ahead row and build the cursor for the next page."""
+        if self.limit is None or len(rows) <= self.limit:
+            return rows, None
+        rows = rows[: self.limit]
+        last = rows[-1]
+        return rows, encode_cursor(last.date.isoformat(), last.id)
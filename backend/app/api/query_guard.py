@@ -0,0 +1,96 @@
+import logging
+import re
+from collections.abc import Callable
+from functools import lru_cache
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_PLACEHOLDER = re.compile(
+    r"\$\d+(?:::(?:TIMESTAMP(?: WITH(?:OUT)? TIME ZONE)?|\w+(?:\(\d+(?:, \d+)?\))?)(?:\[\])?)?"
+)
+_PLACEHOLDER_LIST = re.compile(r"\(\?(?:, \?)*\)")
+_ROW_LIST = re.compile(r"\(\?\.\.\.\)(?:, \(\?\.\.\.\))+")
+_WHITESPACE = re.compile(r"\s+")
+
+_BUDGET_ATTRIBUTE = "__query_budget__"
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """Raised when QUERY_BUDGET_ENFORCE is on and a request runs too many statements."""
+
+
+@lru_cache(maxsize=512)
+def normalize_sql(statement: str) -> str:
+    """
+    Statement text with bind placeholders and their expansions collapsed.
+
+    ``IN ($1::VARCHAR, $2::VARCHAR)`` and multi-row VALUES lists normalize to the
+    same text whatever their length, so repeats of one query shape compare equal.
+    """
+    text = _WHITESPACE.sub(" ", statement).strip()
+    text = _PLACEHOLDER.sub("?", text)
+    text = _PLACEHOLDER_LIST.sub("(?...)", text)
+    return _ROW_LIST.sub("(?...), ...", text)
+
+
+def bind_shape(parameters, executemany: bool) -> str:
+    """Types of the bound values, never the values themselves."""
+    if executemany:
+        rows = list(parameters)
+        return f"{len(rows)} x {bind_shape(rows[0], False)}" if rows else "0 rows"
+    if isinstance(parameters, dict):
+        parameters = parameters.values()
+    return "(" + ", ".join(type(value).__name__ for value in parameters or ()) + ")"
+
+
+def query_budget(limit: int | None) -> Callable:
+    """
+    Declare how many statements a route's handler may run per request.
+
+    The user lookup done by authentication is allowed on top, so the number is
+    the handler's own round trips. ``None`` exempts routes whose statement
+    count grows with the input, such as batch and import. Routes without a
+    declaration get QUERY_BUDGET.
+    """
+
+    def decorate(endpoint: Callable) -> Callable:
+        setattr(endpoint, _BUDGET_ATTRIBUTE, limit)
+        return endpoint
+
+    return decorate
+
+
+def budget_for(endpoint: Callable | None) -> int | None:
+    """Statement budget for a route's endpoint; None means unlimited."""
+    limit = getattr(endpoint, _BUDGET_ATTRIBUTE, settings.QUERY_BUDGET or None)
+    if limit is None:
+        return None
+    # Known users cost one lookup the first time; without AUTH_TRUST_TOKEN every
+    # request selects the user and updates last_login_at
+    return limit + (1 if settings.AUTH_TRUST_TOKEN else 2)
+
+
+def log_slow_query(route: str, statement: str, parameters, executemany: bool, elapsed: float):
+    logger.warning(
+        "Slow query (%.0f ms) on %s: %s %s",
+        elapsed * 1000,
+        route,
+        normalize_sql(statement),
+        bind_shape(parameters, executemany),
+    )
+
+
+def report_request(route: str, count: int, budget: int, shapes: dict[str, int]) -> None:
+    """Log a budget overrun and any statement repeated often enough to look like N+1."""
+    if count > budget:
+        logger.warning(
+            "Query budget exceeded on %s: %d statements, budget %d", route, count, budget
+        )
+    threshold = settings.N_PLUS_ONE_THRESHOLD
+    if not threshold:
+        return
+    for statement, repeats in shapes.items():
+        if repeats >= threshold:
+            logger.warning("Possible N+1 on %s: ran %d times: %s", route, repeats, statement)
@@ -0,0 +1,55 @@
+from datetime import date, timedelta
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import AuthenticatedUser, get_authenticated_user, get_read_db
+from app.api.query_guard import query_budget
+from app.models import MuscleGroup, VolumeRollup
+from app.schemas import Granularity, VolumeSeriesResponse
+
+router = APIRouter(prefix="/analytics", tags=["analytics"])
+
+
+def period_start(day: date, granularity: Granularity) -> date:
+    """First day of the period containing ``day``, matching Postgres date_trunc."""
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())
+    if granularity == "month":
+        return day.replace(day=1)
+    return day
+
+
+@router.get("/volume", response_model=VolumeSeriesResponse)
+@query_budget(1)
+async def get_volume(
+    granularity: Granularity = "week",
+    date_from: date | None = Query(None, alias="from"),
+    date_to: date | None = Query(None, alias="to"),
+    muscle_group: MuscleGroup | None = None,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: AuthenticatedUser = Depends(get_authenticated_user),
+):
+    """
+    Training volume and frequency per muscle group over time.
+
+    Reads the pre-aggregated rollups, so the cost depends on the number of
+    periods returned rather than on the user's history. ``from``/``to`` select
+    the periods that contain those dates.
+    """
+    query = select(VolumeRollup).where(
+        VolumeRollup.user_id == current_user.id,
+        VolumeRollup.granularity == granularity,
+        VolumeRollup.entry_count > 0,
+    )
+    if date_from is not None:
+        query = query.where(VolumeRollup.period_start >= period_start(date_from, granularity))
+    if date_to is not None:
+        query = query.where(VolumeRollup.period_start <= date_to)
+    if muscle_group is not None:
+        query = query.where(VolumeRollup.muscle_group == muscle_group)
+    query = query.order_by(VolumeRollup.period_start, VolumeRollup.muscle_group)
+
+    result = await db.execute(query)
+    return VolumeSeriesResponse(granularity=granularity, points=result.scalars().all())
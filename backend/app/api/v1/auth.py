@@ -5,9 +5,11 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_db
-from app.auth import create_access_token, get_current_user, hash_password, verify_password
+from app.auth import create_access_token, get_current_user
 from app.models import User
 from app.schemas import TokenResponse, UserInfo, UserLogin, UserRegister
+from app.services.known_users import known_users
+from app.services.password_hasher import password_hasher
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -29,12 +31,13 @@ async def register(
     # Create user
     user = User(
         email=user_in.email,
-        password_hash=hash_password(user_in.password),
+        password_hash=await password_hasher.hash(user_in.password),
         created_at=datetime.utcnow(),
     )
     db.add(user)
     await db.commit()
     await db.refresh(user)
+    known_users.add(user.id)
 
     # Create token
     access_token = create_access_token(user.id, user.email)
@@ -51,7 +54,7 @@ async def login(
     result = await db.execute(select(User).where(User.email == user_in.email))
     user = result.scalar_one_or_none()
 
-    if not user or not verify_password(user_in.password, user.password_hash):
+    if not user or not await password_hasher.verify(user_in.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
@@ -60,6 +63,7 @@ async def login(
     # Update last login
     user.last_login_at = datetime.utcnow()
     await db.commit()
+    known_users.add(user.id)
 
     # Create token
     access_token = create_access_token(user.id, user.email)
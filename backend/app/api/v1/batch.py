@@ -0,0 +1,277 @@
+from collections.abc import Awaitable, Callable
+from typing import Any, NamedTuple
+
+from fastapi import APIRouter, Depends, Response, status
+from pydantic import ValidationError
+from sqlalchemy.exc import DataError, DBAPIError, IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import AuthenticatedUser, get_authenticated_user, get_db
+from app.api.etag import DATA_VERSION_HEADER
+from app.api.query_guard import query_budget
+from app.repositories import (
+    bump_data_version,
+    entry_repository,
+    exercise_repository,
+    plan_repository,
+)
+from app.schemas import (
+    BatchRequest,
+    BatchResponse,
+    BatchResult,
+    ExerciseCreate,
+    ExerciseUpdate,
+    WorkoutEntryCreate,
+    WorkoutEntryUpdate,
+    WorkoutPlanCreate,
+    WorkoutPlanUpdate,
+)
+
+router = APIRouter(prefix="/batch", tags=["batch"])
+
+RESOURCES = {
+    "exercises": (exercise_repository, ExerciseCreate, ExerciseUpdate, "Exercise"),
+    "plans": (plan_repository, WorkoutPlanCreate, WorkoutPlanUpdate, "Plan"),
+    "entries": (entry_repository, WorkoutEntryCreate, WorkoutEntryUpdate, "Entry"),
+}
+
+# Results for operations whose own data the database rejected
+ERROR_DETAILS = {
+    status.HTTP_409_CONFLICT: "Operation violates a database constraint",
+    status.HTTP_422_UNPROCESSABLE_CONTENT: "Operation has a value the database cannot store",
+}
+
+
+class _Pending(NamedTuple):
+    index: int
+    id: str
+    values: dict[str, Any]
+
+
+class _Group(NamedTuple):
+    op: str
+    resource: str
+    items: list[_Pending]
+
+
+class _BatchPlan:
+    """
+    Validated operations in queue order, grouped for set-based execution.
+
+    Consecutive operations with the same op and resource form one group, so a
+    run of creates is a single statement, but an operation never moves past
+    one queued before it.
+    """
+
+    def __init__(self) -> None:
+        self.groups: list[_Group] = []
+
+    def add(self, op: str, resource: str, pending: _Pending) -> None:
+        if self.groups and self.groups[-1][:2] == (op, resource):
+            self.groups[-1].items.append(pending)
+        else:
+            self.groups.append(_Group(op, resource, [pending]))
+
+
+def _payload_error_status(error: DBAPIError) -> int | None:
+    """
+    Status for an error caused by an operation's own data, None for anything else.
+
+    Values Postgres cannot store are 422 and constraint violations 409. asyncpg
+    errors mostly reach SQLAlchemy as a bare DBAPIError, so the SQLSTATE class
+    (22 data exception, 23 integrity violation) decides when the type does not.
+    """
+    if isinstance(error, DataError):
+        return status.HTTP_422_UNPROCESSABLE_CONTENT
+    if isinstance(error, IntegrityError):
+        return status.HTTP_409_CONFLICT
+    sqlstate = getattr(error.orig, "sqlstate", None) or ""
+    return {
+        "22": status.HTTP_422_UNPROCESSABLE_CONTENT,
+        "23": status.HTTP_409_CONFLICT,
+    }.get(sqlstate[:2])
+
+
+def _plan_batch(batch: BatchRequest, results: dict[int, BatchResult]) -> _BatchPlan:
+    plan = _BatchPlan()
+    created_ids: set[tuple[str, str]] = set()
+
+    for index, operation in enumerate(batch.operations):
+        _, create_schema, update_schema, label = RESOURCES[operation.resource]
+        data = operation.data or {}
+
+        try:
+            if operation.op == "create":
+                values = create_schema.model_validate({**data, "id": operation.id}).model_dump()
+            elif operation.op == "update":
+                values = update_schema.model_validate(data).model_dump(exclude_unset=True)
+            else:
+                values = {}
+        except ValidationError as e:
+            results[index] = BatchResult(
+                index=index,
+                id=operation.id,
+                status=422,
+                detail=e.errors(include_url=False, include_context=False),
+            )
+            continue
+
+        pending = _Pending(index, operation.id, values)
+        if operation.op == "create":
+            key = (operation.resource, operation.id)
+            if key in created_ids:
+                results[index] = BatchResult(
+                    index=index,
+                    id=operation.id,
+                    status=status.HTTP_409_CONFLICT,
+                    detail=f"{label} with this ID already exists",
+                )
+                continue
+            created_ids.add(key)
+        plan.add(operation.op, operation.resource, pending)
+
+    return plan
+
+
+async def _run(
+    db: AsyncSession,
+    items: list[_Pending],
+    execute: Callable[[list[_Pending]], Awaitable[set[str]]],
+    isolate: bool,
+) -> tuple[set[str], dict[int, int]]:
+    """
+    Execute a group of operations, returning affected IDs and failure statuses.
+
+    Normally the whole group is one statement and a payload error aborts the
+    batch. In isolated mode each item gets its own savepoint so one bad row only
+    fails itself.
+    """
+    if not isolate:
+        return await execute(items), {}
+
+    affected: set[str] = set()
+    failed: dict[int, int] = {}
+    for item in items:
+        try:
+            async with db.begin_nested():
+                affected |= await execute([item])
+        except DBAPIError as e:
+            if (error_status := _payload_error_status(e)) is None:
+                raise
+            failed[item.index] = error_status
+    return affected, failed
+
+
+async def _apply(
+    db: AsyncSession, user_id: str, plan: _BatchPlan, isolate: bool
+) -> dict[int, BatchResult]:
+    results: dict[int, BatchResult] = {}
+
+    def record(items, affected, failed, ok_status, missing_status, missing_detail):
+        for item in items:
+            error_status = failed.get(item.index)
+            if error_status is not None:
+                results[item.index] = BatchResult(
+                    index=item.index,
+                    id=item.id,
+                    status=error_status,
+                    detail=ERROR_DETAILS[error_status],
+                )
+            elif item.id in affected:
+                results[item.index] = BatchResult(index=item.index, id=item.id, status=ok_status)
+            else:
+                results[item.index] = BatchResult(
+                    index=item.index, id=item.id, status=missing_status, detail=missing_detail
+                )
+
+    for op, resource, items in plan.groups:
+        repository, _, _, label = RESOURCES[resource]
+
+        if op == "create":
+
+            async def create(group, repository=repository):
+                rows = await repository.create_many(db, user_id, [item.values for item in group])
+                return {row.id for row in rows}
+
+            affected, failed = await _run(db, items, create, isolate)
+            record(
+                items,
+                affected,
+                failed,
+                status.HTTP_201_CREATED,
+                status.HTTP_409_CONFLICT,
+                f"{label} with this ID already exists",
+            )
+        elif op == "update":
+
+            async def update_one(group, repository=repository):
+                affected = set()
+                for item in group:
+                    if await repository.update(db, user_id, item.id, item.values) is not None:
+                        affected.add(item.id)
+                return affected
+
+            affected, failed = await _run(db, items, update_one, isolate)
+            record(
+                items,
+                affected,
+                failed,
+                status.HTTP_200_OK,
+                status.HTTP_404_NOT_FOUND,
+                f"{label} not found",
+            )
+        else:
+
+            async def soft_delete(group, repository=repository):
+                return await repository.soft_delete(db, user_id, [item.id for item in group])
+
+            affected, failed = await _run(db, items, soft_delete, isolate)
+            record(
+                items,
+                affected,
+                failed,
+                status.HTTP_204_NO_CONTENT,
+                status.HTTP_404_NOT_FOUND,
+                f"{label} not found",
+            )
+
+    return results
+
+
+@router.post("", response_model=BatchResponse)
+@query_budget(None)
+async def apply_batch(
+    batch: BatchRequest,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    current_user: AuthenticatedUser = Depends(get_authenticated_user),
+):
+    """
+    Apply a list of create/update/delete operations in one transaction.
+
+    Operations run in queue order. Consecutive creates or deletes of the same
+    resource are grouped into one set-based statement; updates run one by one.
+    Every operation gets a result with the status its single-item endpoint would
+    have returned.
+    """
+    results: dict[int, BatchResult] = {}
+    plan = _plan_batch(batch, results)
+
+    try:
+        results.update(await _apply(db, current_user.id, plan, isolate=False))
+    except DBAPIError as e:
+        if _payload_error_status(e) is None:
+            raise
+        # Something in a grouped statement was rejected; redo the batch with a
+        # savepoint per operation so only the offending ones fail.
+        await db.rollback()
+        results.update(await _apply(db, current_user.id, plan, isolate=True))
+
+    if any(result.status < 300 for result in results.values()):
+        version = await bump_data_version(db, current_user.id)
+        await db.commit()
+        response.headers[DATA_VERSION_HEADER] = str(version)
+    else:
+        await db.rollback()
+
+    return BatchResponse(results=[results[index] for index in sorted(results)])
@@ -0,0 +1,54 @@
+from datetime import date, datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import AuthenticatedUser, get_authenticated_user, get_read_db
+from app.api.etag import DATA_VERSION_HEADER
+from app.api.query_guard import query_budget
+from app.repositories import get_data_version
+from app.schemas import CalendarResponse
+from app.services.calendar import calendar_cache
+
+router = APIRouter(prefix="/calendar", tags=["calendar"])
+
+
+@router.get("", response_model=CalendarResponse)
+@query_budget(3)
+async def get_calendar(
+    response: Response,
+    month: str | None = Query(None, pattern=r"^\d{4}-(0[1-9]|1[0-2])$"),
+    today: date | None = None,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: AuthenticatedUser = Depends(get_authenticated_user),
+):
+    """
+    Per-day training summary for one month plus the current and longest streak.
+
+    ``month`` defaults to the current one. Pass the client's local ``today`` so
+    the current streak is judged in its timezone rather than UTC. Results are
+    cached per user until their next write.
+    """
+    today = today or datetime.utcnow().date()
+    month = month or today.strftime("%Y-%m")
+    year, number = map(int, month.split("-"))
+    # Year 0 is not a date, and the query ends at the first of the next month
+    if year < date.min.year or (year, number) >= (date.max.year, 12):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail="Month out of range"
+        )
+    start = date(year, number, 1)
+    end = date(year + number // 12, number % 12 + 1, 1)
+
+    data_version = await get_data_version(db, current_user.id)
+    days = await calendar_cache.month(db, current_user.id, data_version, month, start, end)
+    streaks = await calendar_cache.streaks(db, current_user.id, data_version)
+    response.headers[DATA_VERSION_HEADER] = str(data_version)
+
+    return CalendarResponse(
+        month=month,
+        days=days,
+        current_streak=streaks.current(today),
+        longest_streak=streaks.longest,
+        last_workout=streaks.last_day,
+    )
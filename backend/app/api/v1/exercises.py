@@ -1,37 +1,57 @@
-from datetime import datetime
-
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user_with_db, get_db
-from app.models import Exercise, User
-from app.schemas import ExerciseCreate, ExerciseResponse, ExerciseUpdate
+from app.api.deps import AuthenticatedUser, get_authenticated_user, get_db, get_read_db
+from app.api.etag import DATA_VERSION_HEADER, conditional_list
+from app.api.fast_json import RowSerializer
+from app.api.query_guard import query_budget
+from app.config import settings
+from app.models import Exercise, ExerciseStats
+from app.repositories import bump_data_version, exercise_repository
+from app.schemas import ExerciseCreate, ExerciseResponse, ExerciseStatsResponse, ExerciseUpdate
 
 router = APIRouter(prefix="/exercises", tags=["exercises"])
 
+# Opt-in fast path for the list endpoint (FAST_LIST_RESPONSES)
+fast_rows = RowSerializer(Exercise, ExerciseResponse)
+
+
+def list_query(user_id: str, include_deleted: bool = False):
+    """The statement behind GET /exercises."""
+    return Exercise.owned_by(user_id, include_deleted).order_by(Exercise.name)
+
 
 @router.get("", response_model=list[ExerciseResponse])
+@query_budget(2)
 async def list_exercises(
+    request: Request,
+    response: Response,
     include_deleted: bool = False,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user_with_db),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: AuthenticatedUser = Depends(get_authenticated_user),
 ):
     """List all exercises for the current user."""
-    query = select(Exercise).where(Exercise.user_id == current_user.id)
-    if not include_deleted:
-        query = query.where(Exercise.is_deleted == False)  # noqa: E712
-    query = query.order_by(Exercise.name)
+    not_modified = await conditional_list(request, response, db, Exercise, current_user.id)
+    if not_modified:
+        return not_modified
+
+    query = list_query(current_user.id, include_deleted)
+
+    if settings.FAST_LIST_RESPONSES:
+        result = await db.execute(fast_rows.select(query))
+        return fast_rows.response(result.all(), response)
 
     result = await db.execute(query)
     return result.scalars().all()
 
 
 @router.get("/{exercise_id}", response_model=ExerciseResponse)
+@query_budget(1)
 async def get_exercise(
     exercise_id: str,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user_with_db),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: AuthenticatedUser = Depends(get_authenticated_user),
 ):
     """Get a single exercise by ID."""
     result = await db.execute(
@@ -48,86 +68,94 @@ async def get_exercise(
     return exercise
 
 
+@router.get("/{exercise_id}/stats", response_model=ExerciseStatsResponse)
+@query_budget(1)
+async def get_exercise_stats(
+    exercise_id: str,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: AuthenticatedUser = Depends(get_authenticated_user),
+):
+    """Get personal records and totals for an exercise from its logged sets."""
+    result = await db.execute(
+        select(Exercise.id, ExerciseStats)
+        .outerjoin(
+            ExerciseStats,
+            (ExerciseStats.exercise_id == Exercise.id) & (ExerciseStats.user_id == current_user.id),
+        )
+        .where(Exercise.id == exercise_id, Exercise.user_id == current_user.id)
+    )
+    row = result.one_or_none()
+
+    if not row:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Exercise not found")
+
+    _, stats = row
+    if stats is None:
+        return ExerciseStatsResponse(exercise_id=exercise_id)
+    return stats
+
+
 @router.post("", response_model=ExerciseResponse, status_code=status.HTTP_201_CREATED)
+@query_budget(2)
 async def create_exercise(
     exercise_in: ExerciseCreate,
+    response: Response,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user_with_db),
+    current_user: AuthenticatedUser = Depends(get_authenticated_user),
 ):
     """Create a new exercise."""
-    # Check if ID already exists
-    result = await db.execute(select(Exercise).where(Exercise.id == exercise_in.id))
-    if result.scalar_one_or_none():
+    exercise = await exercise_repository.create(db, current_user.id, exercise_in.model_dump())
+    if exercise is None:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Exercise with this ID already exists",
         )
 
-    exercise = Exercise(
-        **exercise_in.model_dump(),
-        user_id=current_user.id,
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow(),
-    )
-    db.add(exercise)
+    version = await bump_data_version(db, current_user.id)
     await db.commit()
-    await db.refresh(exercise)
+    response.headers[DATA_VERSION_HEADER] = str(version)
 
     return exercise
 
 
 @router.put("/{exercise_id}", response_model=ExerciseResponse)
+@query_budget(4)
 async def update_exercise(
     exercise_id: str,
     exercise_in: ExerciseUpdate,
+    response: Response,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user_with_db),
+    current_user: AuthenticatedUser = Depends(get_authenticated_user),
 ):
     """Update an exercise."""
-    result = await db.execute(
-        select(Exercise).where(
-            Exercise.id == exercise_id,
-            Exercise.user_id == current_user.id,
-        )
+    exercise = await exercise_repository.update(
+        db, current_user.id, exercise_id, exercise_in.model_dump(exclude_unset=True)
     )
-    exercise = result.scalar_one_or_none()
 
     if not exercise:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Exercise not found")
 
-    # Update fields
-    update_data = exercise_in.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(exercise, field, value)
-
-    exercise.updated_at = datetime.utcnow()
-
+    version = await bump_data_version(db, current_user.id)
     await db.commit()
-    await db.refresh(exercise)
+    response.headers[DATA_VERSION_HEADER] = str(version)
 
     return exercise
 
 
 @router.delete("/{exercise_id}", status_code=status.HTTP_204_NO_CONTENT)
+@query_budget(2)
 async def delete_exercise(
     exercise_id: str,
+    response: Response,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user_with_db),
+    current_user: AuthenticatedUser = Depends(get_authenticated_user),
 ):
     """Soft-delete an exercise."""
-    result = await db.execute(
-        select(Exercise).where(
-            Exercise.id == exercise_id,
-            Exercise.user_id == current_user.id,
-        )
-    )
-    exercise = result.scalar_one_or_none()
+    deleted = await exercise_repository.soft_delete(db, current_user.id, [exercise_id])
 
-    if not exercise:
+    if not deleted:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Exercise not found")
 
-    exercise.is_deleted = True
-    exercise.deleted_at = datetime.utcnow()
-    exercise.updated_at = datetime.utcnow()
-
+    version = await bump_data_version(db, current_user.id)
     await db.commit()
+    response.headers[DATA_VERSION_HEADER] = str(version)
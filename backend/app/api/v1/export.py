@@ -0,0 +1,177 @@
+import zlib
+from collections.abc import AsyncIterator
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.types import Receive, Scope, Send
+
+from app.api.deps import AuthenticatedUser, get_authenticated_user, get_db
+from app.api.fast_json import RowSerializer, dumps
+from app.api.query_guard import query_budget
+from app.config import settings
+from app.database import async_engine
+from app.models import Exercise, WorkoutEntry, WorkoutPlan
+from app.schemas import ExerciseResponse, WorkoutEntryResponse, WorkoutPlanResponse
+
+router = APIRouter(prefix="/export", tags=["export"])
+
+EXPORT_FORMAT_VERSION = 1
+
+# Record type, model, line schema and an order served by the model's list index
+SECTIONS = (
+    ("exercise", Exercise, RowSerializer(Exercise, ExerciseResponse), (Exercise.name,)),
+    (
+        "plan",
+        WorkoutPlan,
+        RowSerializer(WorkoutPlan, WorkoutPlanResponse),
+        (WorkoutPlan.date.desc(), WorkoutPlan.id.desc()),
+    ),
+    (
+        "entry",
+        WorkoutEntry,
+        RowSerializer(WorkoutEntry, WorkoutEntryResponse),
+        (WorkoutEntry.date.desc(), WorkoutEntry.id.desc()),
+    ),
+)
+
+_active_exports = 0
+
+
+class _ExportSlot:
+    """One of the EXPORT_MAX_CONCURRENT places, taken on creation and given back once."""
+
+    def __init__(self) -> None:
+        global _active_exports
+        _active_exports += 1
+        self.held = True
+
+    def release(self) -> None:
+        global _active_exports
+        if self.held:
+            self.held = False
+            _active_exports -= 1
+
+
+class _ExportResponse(StreamingResponse):
+    """
+    Streams an export and gives its slot back however the response ends.
+
+    The body generators release the slot when they finish, but they never run
+    if the client is gone before the first chunk, and one abandoned mid-stream
+    is only closed when it is garbage collected. Closing the body here frees
+    both the slot and the database connection straight away.
+    """
+
+    def __init__(self, body: AsyncIterator[bytes], slot: _ExportSlot, **kwargs) -> None:
+        super().__init__(body, **kwargs)
+        self.slot = slot
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            await self.body_iterator.aclose()
+            self.slot.release()
+
+
+async def _ndjson(user_id: str, slot: _ExportSlot) -> AsyncIterator[bytes]:
+    """
+    Yield the user's live rows as NDJSON, one cursor batch per chunk.
+
+    Everything is read from one read-only REPEATABLE READ transaction so the
+    sections are mutually consistent, and the connection goes back to the pool
+    as soon as the last row is fetched.
+    """
+    try:
+        yield (
+            dumps(
+                {
+                    "type": "export",
+                    "version": EXPORT_FORMAT_VERSION,
+                    "user_id": user_id,
+                    "exported_at": datetime.utcnow(),
+                }
+            )
+            + b"\n"
+        )
+
+        async with async_engine.connect() as conn:
+            conn = await conn.execution_options(
+                isolation_level="REPEATABLE READ", postgresql_readonly=True
+            )
+            async with conn.begin():
+                for kind, model, serializer, order in SECTIONS:
+                    query = serializer.select(
+                        select(model)
+                        .where(model.user_id == user_id, model.is_deleted == False)  # noqa: E712
+                        .order_by(*order)
+                    ).execution_options(yield_per=settings.EXPORT_BATCH_SIZE)
+
+                    result = await conn.stream(query)
+                    async for batch in result.partitions():
+                        yield b"".join(
+                            dumps({"type": kind, "data": serializer.as_dict(row)}) + b"\n"
+                            for row in batch
+                        )
+    finally:
+        slot.release()
+
+
+async def _gzip(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(wbits=31)  # gzip container
+    try:
+        async for chunk in chunks:
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
+    finally:
+        await chunks.aclose()
+
+
+@router.get("")
+@query_budget(3)
+async def export_history(
+    gzip: bool = False,
+    db: AsyncSession = Depends(get_db),
+    current_user: AuthenticatedUser = Depends(get_authenticated_user),
+):
+    """
+    Stream the user's exercises, plans and entries as NDJSON.
+
+    The first line is an ``export`` header; every other line is
+    ``{"type": "exercise" | "plan" | "entry", "data": {...}}`` with ``data`` in
+    the same shape as the list endpoints. Memory stays flat regardless of
+    history size. ``gzip=true`` compresses the download on the fly.
+    """
+    if _active_exports >= settings.EXPORT_MAX_CONCURRENT:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many exports in progress, please retry shortly",
+            headers={"Retry-After": "5"},
+        )
+
+    # Taken before the next await, so a burst of requests cannot all pass the check
+    slot = _ExportSlot()
+    try:
+        # The stream uses its own connection; don't keep the request's one checked out
+        await db.close()
+    except BaseException:
+        slot.release()
+        raise
+
+    filename = "titantrack-export.ndjson"
+    body = _ndjson(current_user.id, slot)
+    media_type = "application/x-ndjson"
+    if gzip:
+        body, media_type, filename = _gzip(body), "application/gzip", filename + ".gz"
+
+    return _ExportResponse(
+        body,
+        slot,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -0,0 +1,380 @@
+import csv
+import json
+import tempfile
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Any, NamedTuple
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import AuthenticatedUser, get_authenticated_user, get_db
+from app.api.etag import DATA_VERSION_HEADER
+from app.api.fast_json import dumps
+from app.api.query_guard import query_budget
+from app.config import settings
+from app.repositories import bump_data_version
+from app.schemas import (
+    ExerciseCreate,
+    ImportResponse,
+    ImportRowError,
+    WorkoutEntryCreate,
+    WorkoutPlanCreate,
+)
+from app.schemas.imports import MAX_REPORTED_IMPORT_ERRORS
+from app.services import exercise_stats, volume_rollups, workout_sets
+
+router = APIRouter(prefix="/import", tags=["import"])
+
+# CSV cells holding nested values are JSON-encoded
+JSON_COLUMNS = {"sets", "tags", "exercises"}
+
+# Received bodies beyond this spill from memory to a temporary file
+SPOOL_MEMORY_BYTES = 8 * 1024 * 1024
+READ_CHUNK_BYTES = 64 * 1024
+
+
+class _Staging(NamedTuple):
+    schema: type[BaseModel]
+    label: str
+    table: str
+    columns: str  # Staging column definitions, "line" first
+    merge: str  # Inserts staged rows; returns (line, id, created, detail) per staged row
+
+    @property
+    def names(self) -> list[str]:
+        return [column.split()[0] for column in self.columns.split(",")]
+
+
+# Merged in this order so entries can reference exercises and plans from the
+# same import. Only the first occurrence of a duplicated ID is inserted.
+STAGING = {
+    "exercise": _Staging(
+        ExerciseCreate,
+        "Exercise",
+        "import_exercises",
+        "line int, id varchar(36), name varchar(255), muscle_group text, "
+        "equipment varchar(255), notes text, personal_best float8",
+        """
+        WITH staged AS (
+            SELECT DISTINCT ON (id) * FROM import_exercises ORDER BY id, line
+        ),
+        inserted AS (
+            INSERT INTO exercises (id, user_id, name, muscle_group, equipment, notes,
+                                   personal_best, created_at, updated_at, is_deleted)
+            SELECT id, :user_id, name, muscle_group::musclegroup, equipment, notes,
+                   personal_best, :now, :now, false
+            FROM staged
+            ON CONFLICT (id) DO NOTHING
+            RETURNING id
+        )
+        SELECT s.line, s.id, i.id IS NOT NULL AND st.line = s.line, NULL
+        FROM import_exercises AS s
+        JOIN staged AS st ON st.id = s.id
+        LEFT JOIN inserted AS i ON i.id = s.id
+        ORDER BY s.line
+        """,
+    ),
+    "plan": _Staging(
+        WorkoutPlanCreate,
+        "Plan",
+        "import_plans",
+        "line int, id varchar(36), date date, title varchar(255), tags text[], "
+        "exercises jsonb, is_completed boolean",
+        """
+        WITH staged AS (
+            SELECT DISTINCT ON (id) * FROM import_plans ORDER BY id, line
+        ),
+        inserted AS (
+            INSERT INTO workout_plans (id, user_id, date, title, tags, exercises, is_completed,
+                                       created_at, updated_at, is_deleted)
+            SELECT id, :user_id, date, title, tags, exercises, is_completed, :now, :now, false
+            FROM staged
+            ON CONFLICT (id) DO NOTHING
+            RETURNING id
+        )
+        SELECT s.line, s.id, i.id IS NOT NULL AND st.line = s.line, NULL
+        FROM import_plans AS s
+        JOIN staged AS st ON st.id = s.id
+        LEFT JOIN inserted AS i ON i.id = s.id
+        ORDER BY s.line
+        """,
+    ),
+    "entry": _Staging(
+        WorkoutEntryCreate,
+        "Entry",
+        "import_entries",
+        "line int, id varchar(36), date date, exercise_id varchar(36), "
+        "workout_type varchar(100), sets jsonb, plan_id varchar(36)",
+        """
+        WITH staged AS (
+            SELECT DISTINCT ON (st.id) st.*,
+                   e.id IS NULL AS missing_exercise,
+                   st.plan_id IS NOT NULL AND p.id IS NULL AS missing_plan
+            FROM import_entries AS st
+            LEFT JOIN exercises AS e ON e.id = st.exercise_id AND e.user_id = :user_id
+            LEFT JOIN workout_plans AS p ON p.id = st.plan_id AND p.user_id = :user_id
+            ORDER BY st.id, st.line
+        ),
+        inserted AS (
+            INSERT INTO workout_entries (id, user_id, date, exercise_id, workout_type, sets,
+                                         plan_id, created_at, updated_at, is_deleted)
+            SELECT id, :user_id, date, exercise_id, workout_type, sets, plan_id,
+                   :now, :now, false
+            FROM staged
+            WHERE NOT missing_exercise AND NOT missing_plan
+            ON CONFLICT (id) DO NOTHING
+            RETURNING id
+        )
+        SELECT s.line, s.id, i.id IS NOT NULL AND st.line = s.line,
+               CASE WHEN st.line = s.line AND st.missing_exercise THEN 'Exercise not found'
+                    WHEN st.line = s.line AND st.missing_plan THEN 'Plan not found' END
+        FROM import_entries AS s
+        JOIN staged AS st ON st.id = s.id
+        LEFT JOIN inserted AS i ON i.id = s.id
+        ORDER BY s.line
+        """,
+    ),
+}
+
+
+class _Record(NamedTuple):
+    line: int
+    type: str | None
+    data: dict[str, Any] | None
+    error: str | None = None  # Set when the line could not be parsed
+
+
+async def _receive(request: Request) -> tempfile.SpooledTemporaryFile:
+    """
+    Read the whole upload before the handler touches the database.
+
+    A client can take minutes to send a large file, and a pool connection held
+    while waiting on it is one fewer for everyone else.
+    """
+    body = tempfile.SpooledTemporaryFile(max_size=SPOOL_MEMORY_BYTES)
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > settings.IMPORT_MAX_BYTES:
+            body.close()
+            raise HTTPException(
+                status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+                detail=f"Imports are limited to {settings.IMPORT_MAX_BYTES} bytes",
+            )
+        body.write(chunk)
+    body.seek(0)
+    return body
+
+
+async def _lines(body: tempfile.SpooledTemporaryFile) -> AsyncIterator[str]:
+    """Decode the received body into lines, closing it once read."""
+    with body:
+        pending = b""
+        while chunk := body.read(READ_CHUNK_BYTES):
+            *complete, pending = (pending + chunk).split(b"\n")
+            for line in complete:
+                yield line.decode("utf-8-sig", errors="replace").rstrip("\r")
+        if pending:
+            yield pending.decode("utf-8-sig", errors="replace").rstrip("\r")
+
+
+async def _ndjson_records(lines: AsyncIterator[str]) -> AsyncIterator[_Record]:
+    """Parse ``{"type": ..., "data": {...}}`` lines, the format GET /export writes."""
+    number = 0
+    async for line in lines:
+        number += 1
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            yield _Record(number, None, None, "Invalid JSON")
+            continue
+        if not isinstance(record, dict) or not isinstance(record.get("data"), dict | None):
+            yield _Record(number, None, None, "Expected an object with 'type' and 'data'")
+            continue
+        if record.get("type") != "export":  # Header line of an export file
+            yield _Record(number, record.get("type"), record.get("data") or {})
+
+
+async def _csv_records(lines: AsyncIterator[str]) -> AsyncIterator[_Record]:
+    """Parse CSV with a header row, a ``type`` column and JSON-encoded nested cells."""
+    header: list[str] | None = None
+    number = 0
+    buffered: list[str] = []
+    async for line in lines:
+        # A quoted cell may contain newlines; wait until the quotes balance
+        buffered.append(line)
+        if sum(part.count('"') for part in buffered) % 2:
+            continue
+        row = next(csv.reader(["\n".join(buffered)]), [])
+        buffered = []
+
+        if header is None:
+            header = [name.strip() for name in row]
+            continue
+        number += 1
+        if not any(cell.strip() for cell in row):
+            continue
+        if len(row) != len(header):
+            yield _Record(number, None, None, f"Expected {len(header)} columns, got {len(row)}")
+            continue
+
+        data: dict[str, Any] = {}
+        try:
+            for name, cell in zip(header, row):
+                if cell != "" and name != "type":
+                    data[name] = json.loads(cell) if name in JSON_COLUMNS else cell
+        except ValueError:
+            yield _Record(number, None, None, "Invalid JSON in a nested column")
+            continue
+        yield _Record(number, dict(zip(header, row)).get("type"), data)
+
+
+def _staging_record(line: int, record: BaseModel, staging: _Staging) -> tuple:
+    values = record.model_dump(mode="python")
+    values["line"] = line
+    if "muscle_group" in values:
+        values["muscle_group"] = values["muscle_group"].value
+    for name in ("sets", "exercises"):
+        if name in values:
+            values[name] = dumps(values[name]).decode()
+    return tuple(values.get(name) for name in staging.names)
+
+
+@router.post("", response_model=ImportResponse)
+@query_budget(None)
+async def import_history(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    current_user: AuthenticatedUser = Depends(get_authenticated_user),
+):
+    """
+    Bulk-load exercises, plans and entries from NDJSON or CSV.
+
+    NDJSON uses the ``{"type", "data"}`` lines of GET /export. Rows keep their
+    IDs, which are unique across all users, so an export only loads where its
+    IDs are free, such as a fresh database; importing it next to the rows it
+    came from reports every row as taken. CSV needs a header row with a
+    ``type`` column; ``sets``, ``tags`` and ``exercises`` cells hold JSON. The
+    body is received in full first, then rows are validated against the
+    create schemas in chunks, COPY'd into temporary staging tables and merged
+    in one transaction. Invalid rows, unknown references and taken IDs are
+    reported per line, and any of them rolls the whole import back, so a
+    corrected file can be sent again as is.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    if content_type in ("application/x-ndjson", "application/jsonl", "application/json"):
+        parse = _ndjson_records
+    elif content_type in ("text/csv", "application/csv"):
+        parse = _csv_records
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Send application/x-ndjson or text/csv",
+        )
+    records = parse(_lines(await _receive(request)))
+
+    connection = await db.connection()
+    driver = (await connection.get_raw_connection()).driver_connection
+    for staging in STAGING.values():
+        await db.execute(
+            text(f"CREATE TEMP TABLE {staging.table} ({staging.columns}) ON COMMIT DROP")
+        )
+
+    errors: list[ImportRowError] = []
+    error_count = 0
+
+    def fail(line: int, type_: str | None, id_: Any, status_code: int, detail: Any) -> None:
+        nonlocal error_count
+        error_count += 1
+        if len(errors) < MAX_REPORTED_IMPORT_ERRORS:
+            id_ = id_ if isinstance(id_, str) else None
+            errors.append(
+                ImportRowError(line=line, type=type_, id=id_, status=status_code, detail=detail)
+            )
+
+    async def flush(chunk: dict[str, list[tuple]]) -> None:
+        for type_, rows in chunk.items():
+            if rows:
+                table, names = STAGING[type_].table, STAGING[type_].names
+                await driver.copy_records_to_table(table, records=rows, columns=names)
+                rows.clear()
+
+    chunk: dict[str, list[tuple]] = {type_: [] for type_ in STAGING}
+    row_count = 0
+    async for record in records:
+        row_count += 1
+        if row_count > settings.IMPORT_MAX_ROWS:
+            raise HTTPException(
+                status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+                detail=f"Imports are limited to {settings.IMPORT_MAX_ROWS} rows",
+            )
+
+        if record.error:
+            fail(record.line, None, None, status.HTTP_400_BAD_REQUEST, record.error)
+            continue
+        staging = STAGING.get(record.type)
+        if staging is None:
+            fail(record.line, record.type, None, 422, "Unknown record type")
+            continue
+        try:
+            validated = staging.schema.model_validate(record.data)
+        except ValidationError as e:
+            detail = e.errors(include_url=False, include_context=False)
+            fail(record.line, record.type, record.data.get("id"), 422, detail)
+            continue
+
+        chunk[record.type].append(_staging_record(record.line, validated, staging))
+        if row_count % settings.IMPORT_CHUNK_ROWS == 0:
+            await flush(chunk)
+    await flush(chunk)
+
+    now = datetime.utcnow()
+    created: dict[str, int] = {}
+    created_entry_ids: list[str] = []
+    merge_errors: list[ImportRowError] = []
+    for type_, staging in STAGING.items():
+        result = await db.execute(text(staging.merge), {"user_id": current_user.id, "now": now})
+        created[type_] = 0
+        for line, id_, was_created, detail in result.all():
+            if was_created:
+                created[type_] += 1
+                if type_ == "entry":
+                    created_entry_ids.append(id_)
+                continue
+            error_count += 1
+            if len(merge_errors) < MAX_REPORTED_IMPORT_ERRORS:
+                merge_errors.append(
+                    ImportRowError(
+                        line=line,
+                        type=type_,
+                        id=id_,
+                        status=status.HTTP_404_NOT_FOUND if detail else status.HTTP_409_CONFLICT,
+                        detail=detail or f"{staging.label} with this ID already exists",
+                    )
+                )
+
+    if error_count:
+        # The merges still ran so that every row's problems are reported at once
+        await db.rollback()
+        created = dict.fromkeys(created, 0)
+    elif any(created.values()):
+        if created_entry_ids:
+            await workout_sets.insert(db, current_user.id, created_entry_ids)
+            await exercise_stats.add_entries(db, current_user.id, created_entry_ids)
+            await volume_rollups.rebuild(db, current_user.id)
+        version = await bump_data_version(db, current_user.id)
+        await db.commit()
+        response.headers[DATA_VERSION_HEADER] = str(version)
+    else:
+        await db.rollback()
+
+    errors = sorted(errors + merge_errors, key=lambda error: error.line)
+    return ImportResponse(
+        created=created, error_count=error_count, errors=errors[:MAX_REPORTED_IMPORT_ERRORS]
+    )
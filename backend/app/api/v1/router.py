@@ -1,7 +1,13 @@
 from fastapi import APIRouter
 
+from app.api.v1.analytics import router as analytics_router
 from app.api.v1.auth import router as auth_router
+from app.api.v1.batch import router as batch_router
+from app.api.v1.calendar import router as calendar_router
 from app.api.v1.exercises import router as exercises_router
+from app.api.v1.export import router as export_router
+from app.api.v1.imports import router as import_router
+from app.api.v1.sync import router as sync_router
 from app.api.v1.workout_entries import router as entries_router
 from app.api.v1.workout_plans import router as plans_router
 
@@ -11,3 +17,9 @@ api_router.include_router(auth_router)
 api_router.include_router(exercises_router)
 api_router.include_router(plans_router)
 api_router.include_router(entries_router)
+api_router.include_router(sync_router)
+api_router.include_router(batch_router)
+api_router.include_router(calendar_router)
+api_router.include_router(analytics_router)
+api_router.include_router(export_router)
+api_router.include_router(import_router)
@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.cursors import decode_cursor, encode_cursor
+from app.api.deps import AuthenticatedUser, get_authenticated_user, get_db
+from app.api.query_guard import query_budget
+from app.models import Exercise, WorkoutEntry, WorkoutPlan
+from app.schemas import SyncResponse
+
+router = APIRouter(prefix="/sync", tags=["sync"])
+
+# Rows are stamped before their transaction commits, so a write can become
+# visible with an updated_at slightly older than a cursor already handed out.
+# Re-reading a short window closes that gap; clients upsert by ID anyway.
+CURSOR_OVERLAP = timedelta(seconds=10)
+
+
+def _decode_since(since: str) -> datetime:
+    (value,) = decode_cursor(since, 1)
+    try:
+        since_at = datetime.fromisoformat(value)
+    except ValueError:
+        since_at = None
+    # Issued cursors are naive UTC like updated_at, and the overlap must not
+    # step below datetime.min
+    if since_at is None or since_at.tzinfo is not None or since_at < datetime.min + CURSOR_OVERLAP:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    return since_at
+
+
+@router.get("", response_model=SyncResponse)
+@query_budget(3)
+async def sync(
+    since: str | None = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: AuthenticatedUser = Depends(get_authenticated_user),
+):
+    """
+    Return exercises, plans and entries changed since the cursor.
+
+    Without ``since`` this is a full snapshot of live rows. With ``since`` it
+    returns every row modified after the cursor, including soft-deleted
+    tombstones, so the client can apply the change set locally.
+    """
+    since_at = _decode_since(since) if since else None
+
+    changes = {}
+    latest = since_at
+    for key, model in (("exercises", Exercise), ("plans", WorkoutPlan), ("entries", WorkoutEntry)):
+        query = select(model).where(model.user_id == current_user.id)
+        if since_at is None:
+            query = query.where(model.is_deleted == False)  # noqa: E712
+        else:
+            query = query.where(model.updated_at > since_at - CURSOR_OVERLAP)
+        query = query.order_by(model.updated_at)
+
+        result = await db.execute(query)
+        rows = result.scalars().all()
+        if rows and (latest is None or rows[-1].updated_at > latest):
+            latest = rows[-1].updated_at
+        changes[key] = rows
+
+    if latest is None:
+        latest = datetime.utcnow()
+
+    return SyncResponse(**changes, cursor=encode_cursor(latest.isoformat()))
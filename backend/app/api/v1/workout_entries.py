@@ -1,37 +1,59 @@
-from datetime import datetime
-
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user_with_db, get_db
-from app.models import User, WorkoutEntry
+from app.api.deps import AuthenticatedUser, get_authenticated_user, get_db, get_read_db
+from app.api.etag import DATA_VERSION_HEADER, conditional_list
+from app.api.fast_json import RowSerializer
+from app.api.pagination import NEXT_CURSOR_HEADER, DatePage
+from app.api.query_guard import query_budget
+from app.config import settings
+from app.models import WorkoutEntry
+from app.repositories import bump_data_version, entry_repository
 from app.schemas import WorkoutEntryCreate, WorkoutEntryResponse, WorkoutEntryUpdate
 
 router = APIRouter(prefix="/entries", tags=["workout_entries"])
 
+# Opt-in fast path for the list endpoint (FAST_LIST_RESPONSES)
+fast_rows = RowSerializer(WorkoutEntry, WorkoutEntryResponse)
+
 
 @router.get("", response_model=list[WorkoutEntryResponse])
+@query_budget(2)
 async def list_entries(
+    request: Request,
+    response: Response,
     include_deleted: bool = False,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user_with_db),
+    page: DatePage = Depends(),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: AuthenticatedUser = Depends(get_authenticated_user),
 ):
-    """List all workout entries for the current user."""
-    query = select(WorkoutEntry).where(WorkoutEntry.user_id == current_user.id)
-    if not include_deleted:
-        query = query.where(WorkoutEntry.is_deleted == False)  # noqa: E712
-    query = query.order_by(WorkoutEntry.date.desc())
+    """
+    List workout entries for the current user, newest first.
 
-    result = await db.execute(query)
-    return result.scalars().all()
+    Supports ``from``/``to`` date filters. With ``limit`` the result is one page;
+    pass the ``X-Next-Cursor`` response header back as ``cursor`` for the next one.
+    """
+    not_modified = await conditional_list(request, response, db, WorkoutEntry, current_user.id)
+    if not_modified:
+        return not_modified
+
+    query = page.apply(WorkoutEntry.owned_by(current_user.id, include_deleted), WorkoutEntry)
+
+    fast = settings.FAST_LIST_RESPONSES
+    result = await db.execute(fast_rows.select(query) if fast else query)
+    rows, next_cursor = page.split(result.all() if fast else result.scalars().all())
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return fast_rows.response(rows, response) if fast else rows
 
 
 @router.get("/{entry_id}", response_model=WorkoutEntryResponse)
+@query_budget(1)
 async def get_entry(
     entry_id: str,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user_with_db),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: AuthenticatedUser = Depends(get_authenticated_user),
 ):
     """Get a single workout entry by ID."""
     result = await db.execute(
@@ -49,85 +71,66 @@ async def get_entry(
 
 
 @router.post("", response_model=WorkoutEntryResponse, status_code=status.HTTP_201_CREATED)
+@query_budget(5)
 async def create_entry(
     entry_in: WorkoutEntryCreate,
+    response: Response,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user_with_db),
+    current_user: AuthenticatedUser = Depends(get_authenticated_user),
 ):
     """Create a new workout entry."""
-    # Check if ID already exists
-    result = await db.execute(select(WorkoutEntry).where(WorkoutEntry.id == entry_in.id))
-    if result.scalar_one_or_none():
+    entry = await entry_repository.create(db, current_user.id, entry_in.model_dump())
+    if entry is None:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Entry with this ID already exists",
         )
 
-    entry = WorkoutEntry(
-        **entry_in.model_dump(),
-        user_id=current_user.id,
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow(),
-    )
-    db.add(entry)
+    version = await bump_data_version(db, current_user.id)
     await db.commit()
-    await db.refresh(entry)
+    response.headers[DATA_VERSION_HEADER] = str(version)
 
     return entry
 
 
 @router.put("/{entry_id}", response_model=WorkoutEntryResponse)
+@query_budget(7)
 async def update_entry(
     entry_id: str,
     entry_in: WorkoutEntryUpdate,
+    response: Response,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user_with_db),
+    current_user: AuthenticatedUser = Depends(get_authenticated_user),
 ):
     """Update a workout entry."""
-    result = await db.execute(
-        select(WorkoutEntry).where(
-            WorkoutEntry.id == entry_id,
-            WorkoutEntry.user_id == current_user.id,
-        )
+    entry = await entry_repository.update(
+        db, current_user.id, entry_id, entry_in.model_dump(exclude_unset=True)
     )
-    entry = result.scalar_one_or_none()
 
     if not entry:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Entry not found")
 
-    # Update fields
-    update_data = entry_in.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(entry, field, value)
-
-    entry.updated_at = datetime.utcnow()
-
+    version = await bump_data_version(db, current_user.id)
     await db.commit()
-    await db.refresh(entry)
+    response.headers[DATA_VERSION_HEADER] = str(version)
 
     return entry
 
 
 @router.delete("/{entry_id}", status_code=status.HTTP_204_NO_CONTENT)
+@query_budget(5)
 async def delete_entry(
     entry_id: str,
+    response: Response,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user_with_db),
+    current_user: AuthenticatedUser = Depends(get_authenticated_user),
 ):
     """Soft-delete a workout entry."""
-    result = await db.execute(
-        select(WorkoutEntry).where(
-            WorkoutEntry.id == entry_id,
-            WorkoutEntry.user_id == current_user.id,
-        )
-    )
-    entry = result.scalar_one_or_none()
+    deleted = await entry_repository.soft_delete(db, current_user.id, [entry_id])
 
-    if not entry:
+    if not deleted:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Entry not found")
 
-    entry.is_deleted = True
-    entry.deleted_at = datetime.utcnow()
-    entry.updated_at = datetime.utcnow()
-
+    version = await bump_data_version(db, current_user.id)
     await db.commit()
+    response.headers[DATA_VERSION_HEADER] = str(version)
@@ -1,37 +1,59 @@
-from datetime import datetime
-
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user_with_db, get_db
-from app.models import User, WorkoutPlan
+from app.api.deps import AuthenticatedUser, get_authenticated_user, get_db, get_read_db
+from app.api.etag import DATA_VERSION_HEADER, conditional_list
+from app.api.fast_json import RowSerializer
+from app.api.pagination import NEXT_CURSOR_HEADER, DatePage
+from app.api.query_guard import query_budget
+from app.config import settings
+from app.models import WorkoutPlan
+from app.repositories import bump_data_version, plan_repository
 from app.schemas import WorkoutPlanCreate, WorkoutPlanResponse, WorkoutPlanUpdate
 
 router = APIRouter(prefix="/plans", tags=["workout_plans"])
 
+# Opt-in fast path for the list endpoint (FAST_LIST_RESPONSES)
+fast_rows = RowSerializer(WorkoutPlan, WorkoutPlanResponse)
+
 
 @router.get("", response_model=list[WorkoutPlanResponse])
+@query_budget(2)
 async def list_plans(
+    request: Request,
+    response: Response,
     include_deleted: bool = False,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user_with_db),
+    page: DatePage = Depends(),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: AuthenticatedUser = Depends(get_authenticated_user),
 ):
-    """List all workout plans for the current user."""
-    query = select(WorkoutPlan).where(WorkoutPlan.user_id == current_user.id)
-    if not include_deleted:
-        query = query.where(WorkoutPlan.is_deleted == False)  # noqa: E712
-    query = query.order_by(WorkoutPlan.date.desc())
+    """
+    List workout plans for the current user, newest first.
 
-    result = await db.execute(query)
-    return result.scalars().all()
+    Supports ``from``/``to`` date filters. With ``limit`` the result is one page;
+    pass the ``X-Next-Cursor`` response header back as ``cursor`` for the next one.
+    """
+    not_modified = await conditional_list(request, response, db, WorkoutPlan, current_user.id)
+    if not_modified:
+        return not_modified
+
+    query = page.apply(WorkoutPlan.owned_by(current_user.id, include_deleted), WorkoutPlan)
+
+    fast = settings.FAST_LIST_RESPONSES
+    result = await db.execute(fast_rows.select(query) if fast else query)
+    rows, next_cursor = page.split(result.all() if fast else result.scalars().all())
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return fast_rows.response(rows, response) if fast else rows
 
 
 @router.get("/{plan_id}", response_model=WorkoutPlanResponse)
+@query_budget(1)
 async def get_plan(
     plan_id: str,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user_with_db),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: AuthenticatedUser = Depends(get_authenticated_user),
 ):
     """Get a single workout plan by ID."""
     result = await db.execute(
@@ -49,85 +71,66 @@ async def get_plan(
 
 
 @router.post("", response_model=WorkoutPlanResponse, status_code=status.HTTP_201_CREATED)
+@query_budget(2)
 async def create_plan(
     plan_in: WorkoutPlanCreate,
+    response: Response,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user_with_db),
+    current_user: AuthenticatedUser = Depends(get_authenticated_user),
 ):
     """Create a new workout plan."""
-    # Check if ID already exists
-    result = await db.execute(select(WorkoutPlan).where(WorkoutPlan.id == plan_in.id))
-    if result.scalar_one_or_none():
+    plan = await plan_repository.create(db, current_user.id, plan_in.model_dump())
+    if plan is None:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Plan with this ID already exists",
         )
 
-    plan = WorkoutPlan(
-        **plan_in.model_dump(),
-        user_id=current_user.id,
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow(),
-    )
-    db.add(plan)
+    version = await bump_data_version(db, current_user.id)
     await db.commit()
-    await db.refresh(plan)
+    response.headers[DATA_VERSION_HEADER] = str(version)
 
     return plan
 
 
 @router.put("/{plan_id}", response_model=WorkoutPlanResponse)
+@query_budget(2)
 async def update_plan(
     plan_id: str,
     plan_in: WorkoutPlanUpdate,
+    response: Response,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user_with_db),
+    current_user: AuthenticatedUser = Depends(get_authenticated_user),
 ):
     """Update a workout plan."""
-    result = await db.execute(
-        select(WorkoutPlan).where(
-            WorkoutPlan.id == plan_id,
-            WorkoutPlan.user_id == current_user.id,
-        )
+    plan = await plan_repository.update(
+        db, current_user.id, plan_id, plan_in.model_dump(exclude_unset=True)
     )
-    plan = result.scalar_one_or_none()
 
     if not plan:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Plan not found")
 
-    # Update fields
-    update_data = plan_in.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(plan, field, value)
-
-    plan.updated_at = datetime.utcnow()
-
+    version = await bump_data_version(db, current_user.id)
     await db.commit()
-    await db.refresh(plan)
+    response.headers[DATA_VERSION_HEADER] = str(version)
 
     return plan
 
 
 @router.delete("/{plan_id}", status_code=status.HTTP_204_NO_CONTENT)
+@query_budget(2)
 async def delete_plan(
     plan_id: str,
+    response: Response,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user_with_db),
+    current_user: AuthenticatedUser = Depends(get_authenticated_user),
 ):
     """Soft-delete a workout plan."""
-    result = await db.execute(
-        select(WorkoutPlan).where(
-            WorkoutPlan.id == plan_id,
-            WorkoutPlan.user_id == current_user.id,
-        )
-    )
-    plan = result.scalar_one_or_none()
+    deleted = await plan_repository.soft_delete(db, current_user.id, [plan_id])
 
-    if not plan:
+    if not deleted:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Plan not found")
 
-    plan.is_deleted = True
-    plan.deleted_at = datetime.utcnow()
-    plan.updated_at = datetime.utcnow()
-
+    version = await bump_data_version(db, current_user.id)
     await db.commit()
+    response.headers[DATA_VERSION_HEADER] = str(version)
@@ -1,22 +1,26 @@
 from datetime import datetime, timedelta
 
-import bcrypt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
 
 from app.config import settings
+from app.services.token_cache import token_cache
 
 security = HTTPBearer()
 
 
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt."""
+    import bcrypt  # Only registration and login need it; keep it off the cold-start path
+
     return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
+    import bcrypt
+
     return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
 
 
@@ -37,6 +41,11 @@ async def verify_token(
     """Verify JWT token and return payload."""
     token = credentials.credentials
 
+    if token_cache.enabled:
+        cached = token_cache.get(token)
+        if cached is not None:
+            return dict(cached)
+
     try:
         payload = jwt.decode(
             token,
@@ -53,7 +62,11 @@ async def verify_token(
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-        return {"id": user_id, "email": email}
+        token_data = {"id": user_id, "email": email}
+        if token_cache.enabled and "exp" in payload:
+            token_cache.put(token, token_data, float(payload["exp"]))
+
+        return dict(token_data)
     except JWTError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -7,11 +7,69 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 class Settings(BaseSettings):
     # Database
     DATABASE_URL: str
+    DATABASE_READ_URL: str | None = None  # Streaming replica for GET handlers; unset reads primary
+
+    # Connection pool (the replica engine uses the same sizing)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0  # Seconds a checkout may wait before failing
+    DB_SHED_WAITERS: int = 10  # API requests get 503 + Retry-After beyond this; 0 disables
+    DB_SHED_RETRY_AFTER_SECONDS: int = 1
+
+    # Read replica routing
+    READ_YOUR_WRITES_SECONDS: float = 5.0  # Keep a user's reads on the primary after they write
+    REPLICA_MAX_LAG_SECONDS: float = 5.0  # Replay lag beyond this routes reads to the primary
+    REPLICA_CHECK_SECONDS: float = 2.0
+    REPLICA_CONNECT_TIMEOUT: float = 2.0
 
     # JWT Auth
     JWT_SECRET: str = "dev-secret-change-in-production-at-least-32-chars"
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRE_MINUTES: int = 10080  # 7 days
+    JWT_CACHE_SIZE: int = 1024  # Verified-token cache entries; 0 disables
+
+    # Auth hot path
+    AUTH_TRUST_TOKEN: bool = True  # Skip the per-request users lookup for known users
+    KNOWN_USERS_CACHE_SIZE: int = 10000
+    LAST_LOGIN_FLUSH_SECONDS: float = 30.0
+
+    # Password hashing (bcrypt runs off the event loop)
+    BCRYPT_MAX_WORKERS: int = 1
+    BCRYPT_MAX_QUEUE: int = 8  # Requests waiting beyond this get 503 + Retry-After
+    BCRYPT_RETRY_AFTER_SECONDS: int = 1
+
+    # Read caches
+    CALENDAR_CACHE_SIZE: int = 1000  # Users whose calendar summaries are kept; 0 disables
+
+    # Responses
+    FAST_LIST_RESPONSES: bool = False  # Serialize list endpoints from plain rows, skipping Pydantic
+
+    # Export
+    EXPORT_BATCH_SIZE: int = 500  # Rows fetched per round trip from the server-side cursor
+    EXPORT_MAX_CONCURRENT: int = 2  # Exports beyond this get 503 + Retry-After
+
+    # Import
+    IMPORT_MAX_ROWS: int = 200_000
+    IMPORT_MAX_BYTES: int = 100 * 1024 * 1024  # Bodies are received in full before any DB work
+    IMPORT_CHUNK_ROWS: int = 2000  # Rows validated and COPY'd to staging at a time
+
+    # Compression
+    COMPRESSION_MIN_SIZE: int = 1024  # Smaller bodies are sent uncompressed
+    COMPRESSION_OFFLOAD_SIZE: int = 64 * 1024  # Larger bodies compress on a worker thread
+    COMPRESSION_CACHE_BYTES: int = 8 * 1024 * 1024  # Compressed bodies kept by ETag; 0 disables
+
+    # Observability
+    METRICS_ENABLED: bool = True  # Request/DB instrumentation and GET /metrics
+
+    # Query guard
+    SLOW_QUERY_MS: float = 250  # Statements slower than this are logged; 0 disables
+    QUERY_BUDGET: int = 10  # Statements per request for routes without @query_budget; 0 = unlimited
+    QUERY_BUDGET_ENFORCE: bool = False  # Raise on overrun instead of logging (set in tests)
+    N_PLUS_ONE_THRESHOLD: int = 5  # One statement shape repeated this often in a request is logged
+
+    # Startup (machines scale to zero, so every cold start serves a waiting request)
+    STARTUP_WARMUP: bool = True  # Configure mappers and connect to the database at boot
+    STARTUP_WARM_TIMEOUT: float = 5.0  # Longest a request waits for warmup before going ahead
 
     # Server
     HOST: str = "0.0.0.0"
@@ -1,7 +1,10 @@
+import time
 from collections.abc import AsyncGenerator
 
+from sqlalchemy import exc
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.config import settings
 
@@ -19,16 +22,71 @@ def get_async_database_url(url: str) -> str:
     return url
 
 
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that tracks checkouts in progress and how long they take.
+
+    ``waiting`` counts callers inside a checkout. Taking an idle connection
+    never yields to the event loop, so anyone seen waiting is queued for a
+    connection or opening a new one.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.waiting = 0
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def connect(self):
+        self.waiting += 1
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            self.waiting -= 1
+            self.checkouts += 1
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+    def stats(self) -> dict:
+        return {
+            "size": self.size(),
+            "checked_out": self.checkedout(),
+            "idle": self.checkedin(),
+            "overflow": max(self.overflow(), 0),
+            "max_overflow": self._max_overflow,
+            "waiting": self.waiting,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_seconds_total": round(self.wait_seconds_total, 6),
+            "wait_seconds_max": round(self.wait_seconds_max, 6),
+        }
+
+
+_pool_options = {
+    "poolclass": InstrumentedPool,
+    "pool_size": settings.DB_POOL_SIZE,
+    "max_overflow": settings.DB_MAX_OVERFLOW,
+    "pool_timeout": settings.DB_POOL_TIMEOUT,
+}
+
+# Disable prepared statements for Supabase/pgbouncer compatibility
+_connect_args = {
+    "prepared_statement_cache_size": 0,
+    "statement_cache_size": 0,
+}
+
 async_engine = create_async_engine(
     get_async_database_url(settings.DATABASE_URL),
     echo=settings.DEBUG,
-    pool_size=5,
-    max_overflow=10,
-    # Disable prepared statements for Supabase/pgbouncer compatibility
-    connect_args={
-        "prepared_statement_cache_size": 0,
-        "statement_cache_size": 0,
-    },
+    **_pool_options,
+    connect_args=_connect_args,
 )
 
 AsyncSessionLocal = async_sessionmaker(
@@ -37,6 +95,27 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False,
 )
 
+# Optional read replica. Pre-ping catches connections a replica restart left
+# stale, and a short connect timeout lets reads fall back to the primary
+# quickly when the replica is unreachable.
+read_engine = (
+    create_async_engine(
+        get_async_database_url(settings.DATABASE_READ_URL),
+        echo=settings.DEBUG,
+        **_pool_options,
+        pool_pre_ping=True,
+        connect_args={**_connect_args, "timeout": settings.REPLICA_CONNECT_TIMEOUT},
+    )
+    if settings.DATABASE_READ_URL
+    else None
+)
+
+ReadSessionLocal = (
+    async_sessionmaker(read_engine, class_=AsyncSession, expire_on_commit=False)
+    if read_engine is not None
+    else None
+)
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
@@ -1,21 +1,45 @@
 from contextlib import asynccontextmanager
 
-from fastapi import Depends, FastAPI
+from fastapi import Depends, FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.api.compression import CompressionMiddleware
 from app.api.deps import get_current_user_with_db
+from app.api.etag import DATA_VERSION_HEADER
+from app.api.instrumentation import (
+    InstrumentationMiddleware,
+    instrument_engine,
+    register_pool_metrics,
+)
+from app.api.load_shedding import LoadSheddingMiddleware
+from app.api.pagination import NEXT_CURSOR_HEADER
 from app.api.v1 import api_router
 from app.config import settings
-from app.database import async_engine
+from app.database import async_engine, read_engine
 from app.models import User
+from app.services.last_login import last_login_writer
+from app.services.metrics import registry
+from app.services.password_hasher import password_hasher
+from app.services.read_replica import replica_router
+from app.services.warmup import warmup
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
+    if settings.STARTUP_WARMUP:
+        warmup.start()
+    last_login_writer.start()
+    replica_router.start()
     yield
     # Shutdown
+    await warmup.stop()
+    await replica_router.stop()
+    await last_login_writer.stop()
+    password_hasher.shutdown()
     await async_engine.dispose()
+    if read_engine is not None:
+        await read_engine.dispose()
 
 
 app = FastAPI(
@@ -26,6 +50,22 @@ app = FastAPI(
     redirect_slashes=False,
 )
 
+# Response compression (added first so it wraps the routes, inside CORS)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MIN_SIZE,
+    offload_size=settings.COMPRESSION_OFFLOAD_SIZE,
+)
+
+# Shed load while the database pool is saturated (outside compression, so
+# rejections are cheap)
+app.add_middleware(
+    LoadSheddingMiddleware,
+    engine=async_engine,
+    max_waiters=settings.DB_SHED_WAITERS,
+    retry_after=settings.DB_SHED_RETRY_AFTER_SECONDS,
+)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -33,15 +73,47 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, DATA_VERSION_HEADER, "ETag"],
 )
 
+# Request metrics and the query guard (outermost, so shed and compressed
+# responses are measured)
+if settings.METRICS_ENABLED or settings.SLOW_QUERY_MS or settings.QUERY_BUDGET:
+    engines = {"primary": async_engine}
+    if read_engine is not None:
+        engines["replica"] = read_engine
+    for engine in engines.values():
+        instrument_engine(engine)
+    register_pool_metrics(engines)
+    app.add_middleware(InstrumentationMiddleware)
+
 # Include API router
 app.include_router(api_router)
 
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "version": "0.1.0"}
+    health = {"status": "healthy", "version": "0.1.0", "pool": async_engine.pool.stats()}
+    if read_engine is not None:
+        health["replica"] = {**replica_router.stats(), "pool": read_engine.pool.stats()}
+    return health
+
+
+@app.get("/ready")
+async def readiness_check(response: Response):
+    """503 until startup warmup has finished, so the first request is served warm."""
+    ready = warmup.ready.is_set() or not settings.STARTUP_WARMUP
+    if not ready:
+        response.status_code = 503
+    return {"ready": ready, "warmup": warmup.stats()}
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus text exposition of request, database and pool metrics."""
+    if not settings.METRICS_ENABLED:
+        return Response(status_code=404)
+    return Response(registry.render(), media_type="text/plain; version=0.0.4")
 
 
 @app.get("/")
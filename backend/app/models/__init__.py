@@ -1,8 +1,11 @@
 from app.models.base import BaseMixin, UserOwnedMixin
 from app.models.exercise import Exercise, MuscleGroup
+from app.models.exercise_stats import ExerciseStats
 from app.models.user import User
+from app.models.volume_rollup import VolumeRollup
 from app.models.workout_entry import WorkoutEntry
 from app.models.workout_plan import WorkoutPlan
+from app.models.workout_set import WorkoutSet
 
 __all__ = [
     "BaseMixin",
@@ -10,6 +13,9 @@ __all__ = [
     "User",
     "Exercise",
     "MuscleGroup",
+    "ExerciseStats",
     "WorkoutPlan",
     "WorkoutEntry",
+    "WorkoutSet",
+    "VolumeRollup",
 ]
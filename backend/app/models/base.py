@@ -1,8 +1,8 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, String
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Boolean, DateTime, Index, Select, String, select, text
+from sqlalchemy.orm import Mapped, declared_attr, mapped_column
 
 from app.database import Base
 
@@ -32,3 +32,30 @@ class UserOwnedMixin(BaseMixin):
     """Mixin for entities owned by a user."""
 
     user_id: Mapped[str] = mapped_column(String(36), nullable=False, index=True)
+
+    # Sort order of the model's list endpoint, e.g. ("date DESC", "id DESC")
+    __list_order__: tuple[str, ...] = ()
+
+    @classmethod
+    def owned_by(cls, user_id: str, include_deleted: bool = False) -> Select:
+        """The user's rows as the list endpoints select them, live ones only by default."""
+        query = select(cls).where(cls.user_id == user_id)
+        # NOT is_deleted, spelled as in the list indexes' predicate
+        return query if include_deleted else query.where(~cls.is_deleted)
+
+    @declared_attr.directive
+    def __table_args__(cls) -> tuple:
+        table = cls.__tablename__
+        # Delta sync scans a user's rows by modification time
+        indexes = [Index(f"ix_{table}_user_id_updated_at", "user_id", "updated_at")]
+        if cls.__list_order__:
+            # List endpoints read a user's live rows already in display order
+            indexes.append(
+                Index(
+                    f"ix_{table}_user_id_list",
+                    "user_id",
+                    *(text(column) for column in cls.__list_order__),
+                    postgresql_where=text("NOT is_deleted"),
+                )
+            )
+        return tuple(indexes)
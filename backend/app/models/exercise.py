@@ -18,13 +18,21 @@ class MuscleGroup(str, enum.Enum):
     Cardio = "Cardio"
 
 
+# The database enum holds the values ("Full Body"), not the member names.
+# SQLAlchemy's default would send "Full_Body", which Postgres rejects.
+MuscleGroupType = Enum(
+    MuscleGroup, name="musclegroup", values_callable=lambda members: [m.value for m in members]
+)
+
+
 class Exercise(UserOwnedMixin, Base):
     """Exercise model."""
 
     __tablename__ = "exercises"
+    __list_order__ = ("name",)
 
     name: Mapped[str] = mapped_column(String(255), nullable=False)
-    muscle_group: Mapped[MuscleGroup] = mapped_column(Enum(MuscleGroup), nullable=False)
+    muscle_group: Mapped[MuscleGroup] = mapped_column(MuscleGroupType, nullable=False)
     equipment: Mapped[str] = mapped_column(String(255), nullable=False)
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
     personal_best: Mapped[float | None] = mapped_column(Float, nullable=True)
@@ -0,0 +1,34 @@
+from datetime import date, datetime
+
+from sqlalchemy import Date, DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class ExerciseStats(Base):
+    """Per-exercise records derived from logged sets, maintained on entry writes."""
+
+    __tablename__ = "exercise_stats"
+
+    user_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    exercise_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("exercises.id"), primary_key=True
+    )
+
+    max_weight: Mapped[float | None] = mapped_column(Float, nullable=True)
+    best_e1rm: Mapped[float | None] = mapped_column(Float, nullable=True)  # Epley estimate
+    best_set_volume: Mapped[float | None] = mapped_column(Float, nullable=True)  # weight x reps
+    max_reps: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
+    # Heaviest weight lifted for each rep count, e.g. {"5": 100.0, "8": 85.0}
+    rep_records: Mapped[dict[str, float]] = mapped_column(JSONB, nullable=False, default=dict)
+
+    total_sets: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_reps: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_volume: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    entry_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_performed: Mapped[date | None] = mapped_column(Date, nullable=True)
+
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
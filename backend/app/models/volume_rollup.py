@@ -0,0 +1,25 @@
+from datetime import date, datetime
+
+from sqlalchemy import Date, DateTime, Float, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+from app.models.exercise import MuscleGroup, MuscleGroupType
+
+
+class VolumeRollup(Base):
+    """Training volume per user, muscle group and period, maintained on entry writes."""
+
+    __tablename__ = "volume_rollups"
+
+    user_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    granularity: Mapped[str] = mapped_column(String(5), primary_key=True)  # day, week, month
+    period_start: Mapped[date] = mapped_column(Date, primary_key=True)  # Weeks start on Monday
+    muscle_group: Mapped[MuscleGroup] = mapped_column(MuscleGroupType, primary_key=True)
+
+    entry_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    set_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_reps: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    volume: Mapped[float] = mapped_column(Float, nullable=False, default=0)  # Sum of weight x reps
+
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
@@ -10,6 +10,7 @@ class WorkoutEntry(UserOwnedMixin, Base):
     """Workout log entry model."""
 
     __tablename__ = "workout_entries"
+    __list_order__ = ("date DESC", "id DESC")
 
     date: Mapped[str] = mapped_column(Date, nullable=False, index=True)
     exercise_id: Mapped[str] = mapped_column(
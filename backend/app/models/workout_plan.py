@@ -10,6 +10,7 @@ class WorkoutPlan(UserOwnedMixin, Base):
     """Workout plan model."""
 
     __tablename__ = "workout_plans"
+    __list_order__ = ("date DESC", "id DESC")
 
     date: Mapped[str] = mapped_column(Date, nullable=False, index=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -0,0 +1,28 @@
+from sqlalchemy import Boolean, Float, ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class WorkoutSet(Base):
+    """One set of a workout entry, typed for indexing and aggregation.
+
+    A normalized copy of ``WorkoutEntry.sets`` written alongside it; the JSONB
+    column stays the source of truth for the API.
+    """
+
+    __tablename__ = "workout_sets"
+
+    entry_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("workout_entries.id"), primary_key=True
+    )
+    ordinal: Mapped[int] = mapped_column(Integer, primary_key=True)  # Index in entry.sets
+    user_id: Mapped[str] = mapped_column(String(36), nullable=False, index=True)
+    set_id: Mapped[str | None] = mapped_column(String(36), nullable=True)  # Client-side ID
+
+    weight: Mapped[float | None] = mapped_column(Float, nullable=True)
+    reps: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    time_minutes: Mapped[float | None] = mapped_column(Float, nullable=True)
+    distance: Mapped[float | None] = mapped_column(Float, nullable=True)
+    rpe: Mapped[float | None] = mapped_column(Float, nullable=True)
+    completed: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
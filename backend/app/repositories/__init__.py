@@ -0,0 +1,20 @@
+from app.models import WorkoutPlan
+from app.repositories.base import OwnedRepository
+from app.repositories.exercise import ExerciseRepository
+from app.repositories.user import bump_data_version, get_data_version
+from app.repositories.workout_entry import WorkoutEntryRepository
+
+exercise_repository = ExerciseRepository()
+plan_repository = OwnedRepository(WorkoutPlan)
+entry_repository = WorkoutEntryRepository()
+
+__all__ = [
+    "OwnedRepository",
+    "ExerciseRepository",
+    "WorkoutEntryRepository",
+    "exercise_repository",
+    "plan_repository",
+    "entry_repository",
+    "bump_data_version",
+    "get_data_version",
+]
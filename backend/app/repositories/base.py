@@ -0,0 +1,124 @@
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class OwnedRepository:
+    """
+    Single-statement mutations for a user-owned model.
+
+    Every write is one INSERT or UPDATE with RETURNING, so callers learn about
+    conflicts and missing rows from the statement itself instead of a separate
+    existence SELECT and a refresh afterwards. Callers own the transaction.
+
+    Subclasses that maintain derived data override the ``on_*`` hooks, which run
+    in the same transaction as the write. Listing ``snapshot_columns`` makes
+    updates and deletes also return those columns as they were before the write.
+    """
+
+    snapshot_columns: tuple[str, ...] = ()
+
+    def __init__(self, model) -> None:
+        self.model = model
+
+    async def on_created(self, db: AsyncSession, user_id: str, rows: list) -> None:
+        pass
+
+    async def on_updated(
+        self, db: AsyncSession, user_id: str, row, previous: dict[str, Any]
+    ) -> None:
+        pass
+
+    async def on_deleted(
+        self, db: AsyncSession, user_id: str, previous: list[dict[str, Any]]
+    ) -> None:
+        pass
+
+    def _snapshot(self, user_id: str, ids: list[str]):
+        """Locked pre-write copy of the snapshot columns, joined into UPDATE ... FROM."""
+        columns = [getattr(self.model, name) for name in self.snapshot_columns]
+        return (
+            select(self.model.id, *columns)
+            .where(self.model.id.in_(ids), self.model.user_id == user_id)
+            .with_for_update()
+            .subquery("previous")
+        )
+
+    async def create(self, db: AsyncSession, user_id: str, values: dict[str, Any]):
+        """Insert one row. Returns None if the ID is already taken."""
+        created = await self.create_many(db, user_id, [values])
+        return created[0] if created else None
+
+    async def create_many(self, db: AsyncSession, user_id: str, rows: list[dict[str, Any]]) -> list:
+        """Insert rows in one statement, skipping IDs that already exist."""
+        if not rows:
+            return []
+        now = datetime.utcnow()
+        stmt = (
+            insert(self.model)
+            .values(
+                [{**row, "user_id": user_id, "created_at": now, "updated_at": now} for row in rows]
+            )
+            .on_conflict_do_nothing(index_elements=[self.model.id])
+            .returning(self.model)
+        )
+        result = await db.scalars(stmt)
+        created = list(result.all())
+        if created:
+            await self.on_created(db, user_id, created)
+        return created
+
+    async def update(self, db: AsyncSession, user_id: str, id: str, values: dict[str, Any]):
+        """Apply a partial update. Returns None if the row does not exist for this user."""
+        stmt = update(self.model).values(**values, updated_at=datetime.utcnow())
+
+        if not self.snapshot_columns:
+            stmt = stmt.where(self.model.id == id, self.model.user_id == user_id)
+            result = await db.scalars(
+                stmt.returning(self.model).execution_options(synchronize_session=False)
+            )
+            return result.one_or_none()
+
+        previous = self._snapshot(user_id, [id])
+        stmt = (
+            stmt.where(self.model.id == previous.c.id)
+            .returning(self.model, *(previous.c[name] for name in self.snapshot_columns))
+            .execution_options(synchronize_session=False)
+        )
+        result = await db.execute(stmt)
+        returned = result.one_or_none()
+        if returned is None:
+            return None
+
+        row = returned[0]
+        await self.on_updated(db, user_id, row, dict(zip(self.snapshot_columns, returned[1:])))
+        return row
+
+    async def soft_delete(self, db: AsyncSession, user_id: str, ids: Iterable[str]) -> set[str]:
+        """Mark rows deleted in one statement. Returns the IDs that were found."""
+        now = datetime.utcnow()
+        ids = list(ids)
+        stmt = update(self.model).values(is_deleted=True, deleted_at=now, updated_at=now)
+
+        if not self.snapshot_columns:
+            stmt = stmt.where(self.model.id.in_(ids), self.model.user_id == user_id)
+            result = await db.scalars(
+                stmt.returning(self.model.id).execution_options(synchronize_session=False)
+            )
+            return set(result.all())
+
+        previous = self._snapshot(user_id, ids)
+        stmt = (
+            stmt.where(self.model.id == previous.c.id)
+            .returning(previous.c.id, *(previous.c[name] for name in self.snapshot_columns))
+            .execution_options(synchronize_session=False)
+        )
+        result = await db.execute(stmt)
+        snapshots = [dict(zip(("id", *self.snapshot_columns), row)) for row in result.all()]
+        if snapshots:
+            await self.on_deleted(db, user_id, snapshots)
+        return {snapshot["id"] for snapshot in snapshots}
@@ -0,0 +1,23 @@
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Exercise
+from app.repositories.base import OwnedRepository
+from app.services import volume_rollups
+
+
+class ExerciseRepository(OwnedRepository):
+    """Exercise writes that keep volume rollups attributed to the right muscle group."""
+
+    snapshot_columns = ("muscle_group",)
+
+    def __init__(self) -> None:
+        super().__init__(Exercise)
+
+    async def on_updated(
+        self, db: AsyncSession, user_id: str, row, previous: dict[str, Any]
+    ) -> None:
+        # Rare enough that re-deriving the user's rollups beats tracking deltas
+        if row.muscle_group != previous["muscle_group"]:
+            await volume_rollups.rebuild(db, user_id)
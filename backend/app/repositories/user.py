@@ -0,0 +1,29 @@
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import User
+from app.services.read_replica import replica_router
+
+
+async def bump_data_version(db: AsyncSession, user_id: str) -> int:
+    """
+    Increment the user's data version inside the caller's transaction.
+
+    Every write goes through here, so it also pins the user's reads to the
+    primary for a few seconds so they see their own changes.
+    """
+    replica_router.note_write(user_id)
+    result = await db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(data_version=User.data_version + 1)
+        .returning(User.data_version)
+        .execution_options(synchronize_session=False)
+    )
+    return result.scalar_one()
+
+
+async def get_data_version(db: AsyncSession, user_id: str) -> int:
+    """Read the user's data version with a primary-key lookup."""
+    result = await db.execute(select(User.data_version).where(User.id == user_id))
+    return result.scalar_one_or_none() or 0
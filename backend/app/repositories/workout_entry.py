@@ -0,0 +1,57 @@
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import WorkoutEntry
+from app.repositories.base import OwnedRepository
+from app.services import exercise_stats, volume_rollups, workout_sets
+from app.services.volume_rollups import EntryChange
+
+
+class WorkoutEntryRepository(OwnedRepository):
+    """Entry writes that also keep typed sets, exercise stats and volume rollups current."""
+
+    snapshot_columns = ("exercise_id", "date", "sets", "is_deleted")
+
+    def __init__(self) -> None:
+        super().__init__(WorkoutEntry)
+
+    async def on_created(self, db: AsyncSession, user_id: str, rows: list) -> None:
+        await workout_sets.insert(db, user_id, [row.id for row in rows])
+        await exercise_stats.add_entries(db, user_id, [row.id for row in rows])
+        await volume_rollups.apply(
+            db, user_id, [EntryChange(1, row.date, row.exercise_id, row.sets) for row in rows]
+        )
+
+    async def on_updated(
+        self, db: AsyncSession, user_id: str, row, previous: dict[str, Any]
+    ) -> None:
+        if row.sets != previous["sets"]:
+            await workout_sets.replace(db, user_id, [row.id])
+
+        if (
+            row.exercise_id != previous["exercise_id"]
+            or row.date != previous["date"]
+            or row.sets != previous["sets"]
+        ):
+            await exercise_stats.recompute(db, user_id, {row.exercise_id, previous["exercise_id"]})
+
+            changes = []
+            if not previous["is_deleted"]:
+                changes.append(
+                    EntryChange(-1, previous["date"], previous["exercise_id"], previous["sets"])
+                )
+            if not row.is_deleted:
+                changes.append(EntryChange(1, row.date, row.exercise_id, row.sets))
+            await volume_rollups.apply(db, user_id, changes)
+
+    async def on_deleted(
+        self, db: AsyncSession, user_id: str, previous: list[dict[str, Any]]
+    ) -> None:
+        live = [entry for entry in previous if not entry["is_deleted"]]
+        await exercise_stats.recompute(db, user_id, {entry["exercise_id"] for entry in live})
+        await volume_rollups.apply(
+            db,
+            user_id,
+            [EntryChange(-1, e["date"], e["exercise_id"], e["sets"]) for e in live],
+        )
@@ -1,5 +1,11 @@
+from app.schemas.analytics import Granularity, VolumePoint, VolumeSeriesResponse
 from app.schemas.auth import TokenResponse, UserInfo, UserLogin, UserRegister
+from app.schemas.batch import BatchOperation, BatchRequest, BatchResponse, BatchResult
+from app.schemas.calendar import CalendarDay, CalendarResponse
 from app.schemas.exercise import ExerciseCreate, ExerciseResponse, ExerciseUpdate
+from app.schemas.exercise_stats import ExerciseStatsResponse
+from app.schemas.imports import ImportResponse, ImportRowError
+from app.schemas.sync import SyncResponse
 from app.schemas.user import UserResponse
 from app.schemas.workout_entry import (
     WorkoutEntryCreate,
@@ -21,10 +27,23 @@ __all__ = [
     "ExerciseCreate",
     "ExerciseUpdate",
     "ExerciseResponse",
+    "ExerciseStatsResponse",
     "WorkoutPlanCreate",
     "WorkoutPlanUpdate",
     "WorkoutPlanResponse",
     "WorkoutEntryCreate",
     "WorkoutEntryUpdate",
     "WorkoutEntryResponse",
+    "SyncResponse",
+    "CalendarDay",
+    "CalendarResponse",
+    "Granularity",
+    "VolumePoint",
+    "VolumeSeriesResponse",
+    "BatchOperation",
+    "BatchRequest",
+    "BatchResult",
+    "BatchResponse",
+    "ImportRowError",
+    "ImportResponse",
 ]
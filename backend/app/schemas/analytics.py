@@ -0,0 +1,24 @@
+from datetime import date as date_type
+from typing import Literal
+
+from pydantic import BaseModel
+
+from app.models.exercise import MuscleGroup
+
+Granularity = Literal["day", "week", "month"]
+
+
+class VolumePoint(BaseModel):
+    period_start: date_type
+    muscle_group: MuscleGroup
+    entry_count: int
+    set_count: int
+    total_reps: int
+    volume: float
+
+    model_config = {"from_attributes": True}
+
+
+class VolumeSeriesResponse(BaseModel):
+    granularity: Granularity
+    points: list[VolumePoint]  # Ordered by period, then muscle group
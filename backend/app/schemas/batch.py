@@ -0,0 +1,28 @@
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+
+MAX_BATCH_OPERATIONS = 500
+
+
+class BatchOperation(BaseModel):
+    op: Literal["create", "update", "delete"]
+    resource: Literal["exercises", "plans", "entries"]
+    id: str = Field(..., max_length=36)
+    # Create/update payload, same fields as the single-item endpoints
+    data: dict[str, Any] | None = None
+
+
+class BatchRequest(BaseModel):
+    operations: list[BatchOperation] = Field(..., max_length=MAX_BATCH_OPERATIONS)
+
+
+class BatchResult(BaseModel):
+    index: int
+    id: str
+    status: int  # Status the equivalent single-item request would have returned
+    detail: Any = None
+
+
+class BatchResponse(BaseModel):
+    results: list[BatchResult]
@@ -0,0 +1,19 @@
+from datetime import date as date_type
+
+from pydantic import BaseModel
+
+
+class CalendarDay(BaseModel):
+    date: date_type
+    entry_count: int
+    planned: int
+    completed: int
+    volume: float
+
+
+class CalendarResponse(BaseModel):
+    month: str  # YYYY-MM
+    days: list[CalendarDay]  # Only days with entries or plans
+    current_streak: int
+    longest_streak: int
+    last_workout: date_type | None
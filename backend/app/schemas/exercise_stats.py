@@ -0,0 +1,19 @@
+from datetime import date as date_type
+
+from pydantic import BaseModel, Field
+
+
+class ExerciseStatsResponse(BaseModel):
+    exercise_id: str
+    max_weight: float | None = None
+    best_e1rm: float | None = None
+    best_set_volume: float | None = None
+    max_reps: int | None = None
+    rep_records: dict[str, float] = Field(default_factory=dict)
+    total_sets: int = 0
+    total_reps: int = 0
+    total_volume: float = 0
+    entry_count: int = 0
+    last_performed: date_type | None = None
+
+    model_config = {"from_attributes": True}
@@ -0,0 +1,19 @@
+from typing import Any
+
+from pydantic import BaseModel
+
+MAX_REPORTED_IMPORT_ERRORS = 1000
+
+
+class ImportRowError(BaseModel):
+    line: int  # 1-based line (NDJSON) or record (CSV, header excluded) number
+    type: str | None = None
+    id: str | None = None
+    status: int  # 400 unparseable, 422 invalid, 404 unknown reference, 409 ID taken
+    detail: Any = None
+
+
+class ImportResponse(BaseModel):
+    created: dict[str, int]  # Rows inserted per record type; all 0 when any row failed
+    error_count: int
+    errors: list[ImportRowError]  # The first MAX_REPORTED_IMPORT_ERRORS, in line order
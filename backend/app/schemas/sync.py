@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+
+from app.schemas.exercise import ExerciseResponse
+from app.schemas.workout_entry import WorkoutEntryResponse
+from app.schemas.workout_plan import WorkoutPlanResponse
+
+
+class SyncResponse(BaseModel):
+    exercises: list[ExerciseResponse]
+    plans: list[WorkoutPlanResponse]
+    entries: list[WorkoutEntryResponse]
+    cursor: str  # Pass back as ?since= on the next sync
@@ -0,0 +1,164 @@
+from collections import OrderedDict
+from datetime import date
+from typing import Any, NamedTuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.services import set_values
+
+# One row per day in [start, end) that has live entries or plans. Volume counts
+# the same sets as exercise stats: numeric weight and reps within bounds, not
+# completed=false.
+_MONTH_DAYS = text(
+    f"""
+WITH entry_days AS (
+    SELECT we.date, count(*) AS entry_count, coalesce(sum(v.volume), 0) AS volume
+    FROM workout_entries AS we
+    LEFT JOIN LATERAL (
+        SELECT sum({set_values.weight()} * {set_values.reps()}) AS volume
+        FROM jsonb_array_elements(
+            CASE WHEN jsonb_typeof(we.sets) = 'array' THEN we.sets ELSE '[]'::jsonb END
+        ) AS s(value)
+        WHERE coalesce(s.value ->> 'completed', 'true') <> 'false'
+    ) AS v ON true
+    WHERE we.user_id = :user_id AND NOT we.is_deleted
+      AND we.date >= :start AND we.date < :end
+    GROUP BY we.date
+),
+plan_days AS (
+    SELECT date, count(*) AS planned, count(*) FILTER (WHERE is_completed) AS completed
+    FROM workout_plans
+    WHERE user_id = :user_id AND NOT is_deleted
+      AND date >= :start AND date < :end
+    GROUP BY date
+)
+SELECT coalesce(e.date, p.date) AS date,
+       coalesce(e.entry_count, 0) AS entry_count,
+       coalesce(p.planned, 0) AS planned,
+       coalesce(p.completed, 0) AS completed,
+       coalesce(e.volume, 0) AS volume
+FROM entry_days AS e
+FULL JOIN plan_days AS p ON p.date = e.date
+ORDER BY 1
+"""
+)
+
+# A training day has a live entry or a completed plan. Consecutive days share
+# the same date minus row number, which groups them into runs.
+_STREAK_RUNS = text(
+    """
+WITH days AS (
+    SELECT date FROM workout_entries WHERE user_id = :user_id AND NOT is_deleted
+    UNION
+    SELECT date FROM workout_plans
+    WHERE user_id = :user_id AND NOT is_deleted AND is_completed
+),
+runs AS (
+    SELECT max(date) AS last_day, count(*) AS length
+    FROM (SELECT date, date - (row_number() OVER (ORDER BY date))::int AS run FROM days) AS d
+    GROUP BY run
+)
+SELECT last_day, length, max(length) OVER () AS longest
+FROM runs
+ORDER BY last_day DESC
+LIMIT 1
+"""
+)
+
+
+class Streaks(NamedTuple):
+    last_day: date | None  # Final day of the most recent run
+    last_length: int
+    longest: int
+
+    def current(self, today: date) -> int:
+        """Length of the run still alive on ``today`` (trained today or yesterday)."""
+        if self.last_day is None or (today - self.last_day).days > 1:
+            return 0
+        return self.last_length
+
+
+async def month_days(db: AsyncSession, user_id: str, start: date, end: date) -> list[dict]:
+    result = await db.execute(_MONTH_DAYS, {"user_id": user_id, "start": start, "end": end})
+    return [dict(row) for row in result.mappings()]
+
+
+async def streaks(db: AsyncSession, user_id: str) -> Streaks:
+    row = (await db.execute(_STREAK_RUNS, {"user_id": user_id})).one_or_none()
+    if row is None:
+        return Streaks(None, 0, 0)
+    return Streaks(row.last_day, row.length, row.longest)
+
+
+class _UserCalendar:
+    __slots__ = ("data_version", "streaks", "months")
+
+    def __init__(self, data_version: int) -> None:
+        self.data_version = data_version
+        self.streaks: Streaks | None = None
+        self.months: OrderedDict[str, list[dict]] = OrderedDict()
+
+
+class CalendarCache:
+    """Bounded LRU of computed calendar data per user, valid for one data version.
+
+    Every write bumps the user's data_version, so an entry recorded under an
+    older version is dropped on the next read instead of being invalidated by
+    the writers. Each user keeps at most ``months_per_user`` months, least
+    recently viewed first out, so walking the whole date range pins nothing.
+    """
+
+    def __init__(self, maxsize: int, months_per_user: int = 24) -> None:
+        self.maxsize = maxsize
+        self.months_per_user = months_per_user
+        self._users: OrderedDict[str, _UserCalendar] = OrderedDict()
+
+    def _entry(self, user_id: str, data_version: int) -> _UserCalendar | None:
+        entry = self._users.get(user_id)
+        if entry is None or entry.data_version != data_version:
+            return None
+        self._users.move_to_end(user_id)
+        return entry
+
+    def _store(self, user_id: str, data_version: int) -> _UserCalendar:
+        entry = self._entry(user_id, data_version)
+        if entry is None:
+            entry = self._users[user_id] = _UserCalendar(data_version)
+            self._users.move_to_end(user_id)
+            while len(self._users) > self.maxsize:
+                self._users.popitem(last=False)
+        return entry
+
+    async def month(
+        self, db: AsyncSession, user_id: str, data_version: int, month: str, start: date, end: date
+    ) -> list[dict[str, Any]]:
+        entry = self._entry(user_id, data_version)
+        if entry is not None and month in entry.months:
+            entry.months.move_to_end(month)
+            return entry.months[month]
+
+        days = await month_days(db, user_id, start, end)
+        if self.maxsize > 0:
+            months = self._store(user_id, data_version).months
+            months[month] = days
+            while len(months) > self.months_per_user:
+                months.popitem(last=False)
+        return days
+
+    async def streaks(self, db: AsyncSession, user_id: str, data_version: int) -> Streaks:
+        entry = self._entry(user_id, data_version)
+        if entry is not None and entry.streaks is not None:
+            return entry.streaks
+
+        result = await streaks(db, user_id)
+        if self.maxsize > 0:
+            self._store(user_id, data_version).streaks = result
+        return result
+
+    def clear(self) -> None:
+        self._users.clear()
+
+
+calendar_cache = CalendarCache(settings.CALENDAR_CACHE_SIZE)
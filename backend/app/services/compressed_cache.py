@@ -0,0 +1,63 @@
+from collections import OrderedDict
+
+from app.config import settings
+
+
+class CompressedBodyCache:
+    """Bounded LRU of compressed response bodies, keyed by ETag and encoding.
+
+    Collection ETags are only unique per user, so every entry also stores a
+    digest of the uncompressed body and a lookup must present the same digest.
+    Hashing is far cheaper than recompressing, so a hit still saves the work.
+    """
+
+    def __init__(self, maxbytes: int) -> None:
+        self.maxbytes = maxbytes
+        self.hits = 0
+        self.misses = 0
+        self._size = 0
+        self._entries: OrderedDict[tuple[str, str], tuple[bytes, bytes]] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxbytes > 0
+
+    def get(self, etag: str, encoding: str, digest: bytes) -> bytes | None:
+        entry = self._entries.get((etag, encoding))
+        if entry is None or entry[0] != digest:
+            self.misses += 1
+            return None
+        self._entries.move_to_end((etag, encoding))
+        self.hits += 1
+        return entry[1]
+
+    def put(self, etag: str, encoding: str, digest: bytes, body: bytes) -> None:
+        if not self.enabled or len(body) > self.maxbytes // 4:
+            return
+        key = (etag, encoding)
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size -= len(previous[1])
+        self._entries[key] = (digest, body)
+        self._size += len(body)
+        while self._size > self.maxbytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._size,
+            "maxbytes": self.maxbytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+compressed_cache = CompressedBodyCache(settings.COMPRESSION_CACHE_BYTES)
@@ -0,0 +1,144 @@
+from collections.abc import Collection
+from datetime import datetime
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.types import String
+
+from app.services import set_values
+
+# Flattens the selected live entries into one row per counted set. Sets marked
+# completed=false are skipped; non-numeric or out-of-range weight/reps values
+# count as missing.
+_AGGREGATES = f"""
+WITH counted AS (
+    SELECT we.id AS entry_id,
+           we.exercise_id,
+           we.date,
+           {set_values.weight()} AS weight,
+           {set_values.reps()} AS reps
+    FROM workout_entries AS we
+    CROSS JOIN LATERAL jsonb_array_elements(
+        CASE WHEN jsonb_typeof(we.sets) = 'array' THEN we.sets ELSE '[]'::jsonb END
+    ) AS s(value)
+    WHERE we.user_id = :user_id
+      AND NOT we.is_deleted
+      AND {{scope}}
+      AND coalesce(s.value ->> 'completed', 'true') <> 'false'
+),
+per_exercise AS (
+    SELECT exercise_id,
+           max(weight) AS max_weight,
+           max(CASE WHEN reps = 1 THEN weight ELSE weight * (1 + reps / 30.0) END) AS best_e1rm,
+           max(weight * reps) AS best_set_volume,
+           max(reps) AS max_reps,
+           count(*) AS total_sets,
+           coalesce(sum(reps), 0) AS total_reps,
+           coalesce(sum(weight * reps), 0) AS total_volume,
+           count(DISTINCT entry_id) AS entry_count,
+           max(date) AS last_performed
+    FROM counted
+    GROUP BY exercise_id
+),
+rep_bests AS (
+    SELECT exercise_id, jsonb_object_agg(reps::text, best) AS rep_records
+    FROM (
+        SELECT exercise_id, reps, max(weight) AS best
+        FROM counted
+        WHERE reps > 0 AND weight IS NOT NULL
+        GROUP BY exercise_id, reps
+    ) AS by_reps
+    GROUP BY exercise_id
+)
+"""
+
+_COLUMNS = """
+    user_id, exercise_id, max_weight, best_e1rm, best_set_volume, max_reps, rep_records,
+    total_sets, total_reps, total_volume, entry_count, last_performed, updated_at
+"""
+
+_RECOMPUTE = text(
+    _AGGREGATES.format(scope="we.exercise_id = ANY(:exercise_ids)")
+    + f"""
+INSERT INTO exercise_stats ({_COLUMNS})
+SELECT :user_id, e.id, p.max_weight, p.best_e1rm, p.best_set_volume, p.max_reps,
+       coalesce(r.rep_records, '{{}}'::jsonb), coalesce(p.total_sets, 0),
+       coalesce(p.total_reps, 0), coalesce(p.total_volume, 0), coalesce(p.entry_count, 0),
+       p.last_performed, :now
+FROM exercises AS e
+LEFT JOIN per_exercise AS p ON p.exercise_id = e.id
+LEFT JOIN rep_bests AS r ON r.exercise_id = e.id
+WHERE e.id = ANY(:exercise_ids)
+ON CONFLICT (user_id, exercise_id) DO UPDATE SET
+    max_weight = excluded.max_weight,
+    best_e1rm = excluded.best_e1rm,
+    best_set_volume = excluded.best_set_volume,
+    max_reps = excluded.max_reps,
+    rep_records = excluded.rep_records,
+    total_sets = excluded.total_sets,
+    total_reps = excluded.total_reps,
+    total_volume = excluded.total_volume,
+    entry_count = excluded.entry_count,
+    last_performed = excluded.last_performed,
+    updated_at = excluded.updated_at
+"""
+).bindparams(bindparam("exercise_ids", type_=ARRAY(String)))
+
+_ACCUMULATE = text(
+    _AGGREGATES.format(scope="we.id = ANY(:entry_ids)")
+    + f"""
+INSERT INTO exercise_stats ({_COLUMNS})
+SELECT :user_id, p.exercise_id, p.max_weight, p.best_e1rm, p.best_set_volume, p.max_reps,
+       coalesce(r.rep_records, '{{}}'::jsonb), p.total_sets, p.total_reps, p.total_volume,
+       p.entry_count, p.last_performed, :now
+FROM per_exercise AS p
+LEFT JOIN rep_bests AS r ON r.exercise_id = p.exercise_id
+ON CONFLICT (user_id, exercise_id) DO UPDATE SET
+    max_weight = GREATEST(exercise_stats.max_weight, excluded.max_weight),
+    best_e1rm = GREATEST(exercise_stats.best_e1rm, excluded.best_e1rm),
+    best_set_volume = GREATEST(exercise_stats.best_set_volume, excluded.best_set_volume),
+    max_reps = GREATEST(exercise_stats.max_reps, excluded.max_reps),
+    rep_records = (
+        SELECT coalesce(jsonb_object_agg(key, best), '{{}}'::jsonb)
+        FROM (
+            SELECT key, max(value::float) AS best
+            FROM (
+                SELECT * FROM jsonb_each_text(exercise_stats.rep_records)
+                UNION ALL
+                SELECT * FROM jsonb_each_text(excluded.rep_records)
+            ) AS merged
+            GROUP BY key
+        ) AS bests
+    ),
+    total_sets = exercise_stats.total_sets + excluded.total_sets,
+    total_reps = exercise_stats.total_reps + excluded.total_reps,
+    total_volume = exercise_stats.total_volume + excluded.total_volume,
+    entry_count = exercise_stats.entry_count + excluded.entry_count,
+    last_performed = GREATEST(exercise_stats.last_performed, excluded.last_performed),
+    updated_at = excluded.updated_at
+"""
+).bindparams(bindparam("entry_ids", type_=ARRAY(String)))
+
+
+async def add_entries(db: AsyncSession, user_id: str, entry_ids: Collection[str]) -> None:
+    """Fold newly created entries into their exercises' stats in O(new sets)."""
+    if entry_ids:
+        await db.execute(
+            _ACCUMULATE,
+            {"user_id": user_id, "entry_ids": list(entry_ids), "now": datetime.utcnow()},
+        )
+
+
+async def recompute(db: AsyncSession, user_id: str, exercise_ids: Collection[str]) -> None:
+    """
+    Rebuild stats for specific exercises from their live entries.
+
+    Maxima cannot be decremented, so edits and deletes re-aggregate the affected
+    exercises. The work is bounded by those exercises' history, not the user's.
+    """
+    if exercise_ids:
+        await db.execute(
+            _RECOMPUTE,
+            {"user_id": user_id, "exercise_ids": list(exercise_ids), "now": datetime.utcnow()},
+        )
@@ -0,0 +1,35 @@
+from collections import OrderedDict
+
+from app.config import settings
+
+
+class KnownUsers:
+    """Bounded in-process record of user IDs confirmed to exist in the database.
+
+    Users are never deleted, so a positive entry never goes stale. Eviction only
+    costs one extra lookup the next time that user makes a request.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._ids: OrderedDict[str, None] = OrderedDict()
+
+    def __contains__(self, user_id: str) -> bool:
+        if user_id not in self._ids:
+            return False
+        self._ids.move_to_end(user_id)
+        return True
+
+    def add(self, user_id: str) -> None:
+        if self.maxsize <= 0:
+            return
+        self._ids[user_id] = None
+        self._ids.move_to_end(user_id)
+        while len(self._ids) > self.maxsize:
+            self._ids.popitem(last=False)
+
+    def clear(self) -> None:
+        self._ids.clear()
+
+
+known_users = KnownUsers(settings.KNOWN_USERS_CACHE_SIZE)
@@ -0,0 +1,115 @@
+import asyncio
+import contextlib
+import logging
+from datetime import datetime
+
+from sqlalchemy import case, update
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models import User
+
+logger = logging.getLogger(__name__)
+
+
+class LastLoginWriter:
+    """Debounces last_login_at updates and flushes them in batched UPDATEs.
+
+    Requests only record the latest activity time in memory; a background task
+    writes every pending user each ``interval`` seconds, ``chunk_size`` users per
+    statement to stay well under asyncpg's 32767 bind parameters. Users whose
+    timestamp failed to flush ``max_attempts`` times are dropped, so a batch
+    that can never be written does not pile up.
+    """
+
+    def __init__(self, interval: float, chunk_size: int = 1000, max_attempts: int = 3) -> None:
+        self.interval = interval
+        self.chunk_size = chunk_size
+        self.max_attempts = max_attempts
+        self._pending: dict[str, datetime] = {}
+        self._failures: dict[str, int] = {}
+        self._task: asyncio.Task | None = None
+
+    def touch(self, user_id: str) -> None:
+        """Record activity for a user; the write happens on the next flush."""
+        self._pending[user_id] = datetime.utcnow()
+
+    async def _write(self, pending: dict[str, datetime]) -> None:
+        stmt = (
+            update(User)
+            .where(User.id.in_(pending))
+            .values(last_login_at=case(pending, value=User.id))
+            .execution_options(synchronize_session=False)
+        )
+        async with AsyncSessionLocal() as session:
+            await session.execute(stmt)
+            await session.commit()
+
+    def _requeue(self, pending: dict[str, datetime]) -> None:
+        """Put unwritten timestamps back without clobbering newer activity."""
+        dropped = 0
+        for user_id, seen_at in pending.items():
+            failures = self._failures.get(user_id, 0) + 1
+            if failures >= self.max_attempts:
+                self._failures.pop(user_id, None)
+                dropped += 1
+                continue
+            self._failures[user_id] = failures
+            self._pending.setdefault(user_id, seen_at)
+        if dropped:
+            logger.warning(
+                "Dropped last_login_at for %d users after %d failed flushes",
+                dropped,
+                self.max_attempts,
+            )
+
+    async def flush(self) -> int:
+        """Write all pending timestamps. Returns the number of users flushed."""
+        if not self._pending:
+            return 0
+
+        pending, self._pending = self._pending, {}
+        user_ids = list(pending)
+        flushed = 0
+        try:
+            for start in range(0, len(user_ids), self.chunk_size):
+                chunk_ids = user_ids[start : start + self.chunk_size]
+                chunk = {user_id: pending[user_id] for user_id in chunk_ids}
+                await self._write(chunk)
+                flushed += len(chunk)
+                for user_id in chunk:
+                    self._failures.pop(user_id, None)
+        except Exception:
+            # Earlier chunks are committed; retry the rest on the next flush
+            self._requeue({user_id: pending[user_id] for user_id in user_ids[flushed:]})
+            raise
+
+        return flushed
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Failed to flush last_login_at updates")
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background task and write anything still pending."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception("Failed to flush last_login_at updates on shutdown")
+
+
+last_login_writer = LastLoginWriter(settings.LAST_LOGIN_FLUSH_SECONDS)
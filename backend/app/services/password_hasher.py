@@ -0,0 +1,67 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import HTTPException, status
+
+from app.auth import hash_password, verify_password
+from app.config import settings
+
+
+class PasswordHasher:
+    """Runs bcrypt on a dedicated bounded thread pool with admission control.
+
+    At most ``max_workers`` hashes run at once and at most ``max_queue`` more
+    wait for a worker. Anything beyond that is rejected immediately with 503 so a
+    login burst cannot stall the event loop or build an unbounded backlog.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int, retry_after: int) -> None:
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.retry_after = retry_after
+        self.rejected = 0
+        self._pending = 0
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def pending(self) -> int:
+        """Number of hashes running or queued."""
+        return self._pending
+
+    async def _run(self, func, *args):
+        if self._pending >= self.max_workers + self.max_queue:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many authentication requests, please retry shortly",
+                headers={"Retry-After": str(self.retry_after)},
+            )
+
+        self._pending += 1
+        try:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="bcrypt"
+                )
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self._pending -= 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    max_workers=settings.BCRYPT_MAX_WORKERS,
+    max_queue=settings.BCRYPT_MAX_QUEUE,
+    retry_after=settings.BCRYPT_RETRY_AFTER_SECONDS,
+)
@@ -0,0 +1,155 @@
+import asyncio
+import contextlib
+import logging
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.config import settings
+from app.database import read_engine
+
+logger = logging.getLogger(__name__)
+
+# Seconds the replica is behind: zero when pointed at a primary, or when it has
+# replayed everything it received over a live connection (an idle primary would
+# otherwise look like growing lag). A live connection hears from the primary at
+# least every half wal_receiver_timeout, when the receiver asks for a reply, so
+# a caught-up replica silent for three quarters of it may be missing WAL and
+# reports the silence as its lag. A restarted receiver reports the start of
+# the segment it resumed from as received, behind what was already replayed,
+# so that counts as caught up too. NULL when no receiver is streaming: replay
+# cannot advance, so the lag is unbounded.
+# The receiver's status and timings need pg_read_all_stats; without it they
+# read as NULL and only the replay position is checked.
+_REPLAY_LAG = text(
+    """
+    WITH receiver AS (
+        SELECT status,
+               extract(epoch FROM now() - last_msg_receipt_time) AS silent,
+               current_setting('wal_receiver_timeout')::interval AS timeout
+        FROM pg_stat_wal_receiver
+    )
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN NOT EXISTS (
+            SELECT FROM receiver WHERE status = 'streaming' OR status IS NULL
+        ) THEN NULL
+        WHEN pg_last_wal_receive_lsn() <= pg_last_wal_replay_lsn() THEN coalesce((
+            SELECT silent FROM receiver
+            WHERE timeout > interval '0' AND silent > extract(epoch FROM timeout) * 0.75
+        ), 0)
+        ELSE coalesce(extract(epoch FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """
+)
+
+
+class ReplicaRouter:
+    """Decides per request whether reads may go to the read replica.
+
+    A user is pinned to the primary for ``pin_seconds`` after each write so they
+    always read their own writes. A background task samples replay lag every
+    ``interval`` seconds and takes the replica out of rotation while it is
+    unreachable or further behind than ``max_lag`` seconds. Pins are kept in
+    process memory, which matches the single machine the API runs on.
+    """
+
+    def __init__(
+        self, engine: AsyncEngine | None, pin_seconds: float, max_lag: float, interval: float
+    ) -> None:
+        self.engine = engine
+        self.pin_seconds = pin_seconds
+        self.max_lag = max_lag
+        self.interval = interval
+        self.healthy = False  # Until the first lag check passes
+        self.lag: float | None = None
+        # Insertion order is deadline order, so expired pins are pruned from the front
+        self._pinned: dict[str, float] = {}
+        self._task: asyncio.Task | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.engine is not None
+
+    def note_write(self, user_id: str) -> None:
+        """Route this user's reads to the primary for the next ``pin_seconds``."""
+        if not self.enabled:
+            return
+        now = time.monotonic()
+        self._pinned.pop(user_id, None)
+        self._pinned[user_id] = now + self.pin_seconds
+        for pinned_user, deadline in list(self._pinned.items()):
+            if deadline > now:
+                break
+            del self._pinned[pinned_user]
+
+    def use_replica(self, user_id: str) -> bool:
+        if not self.enabled or not self.healthy:
+            return False
+        deadline = self._pinned.get(user_id)
+        return deadline is None or deadline <= time.monotonic()
+
+    def mark_down(self) -> None:
+        """Stop routing to the replica until the next successful lag check."""
+        if self.healthy:
+            logger.warning("Read replica unavailable; reading from the primary")
+        self.healthy = False
+
+    async def check(self) -> None:
+        """Sample replay lag and update whether the replica is in rotation."""
+        async with self.engine.connect() as conn:
+            lag = await conn.scalar(_REPLAY_LAG)
+
+        if lag is None:
+            self.lag = None
+            if self.healthy:
+                logger.warning("Read replica is not streaming WAL; reading from the primary")
+            self.healthy = False
+            return
+
+        self.lag = lag = float(lag)
+        healthy = lag <= self.max_lag
+        if healthy != self.healthy:
+            if healthy:
+                logger.info("Read replica back in rotation (lag %.1fs)", lag)
+            else:
+                logger.warning("Read replica lagging %.1fs; reading from the primary", lag)
+        self.healthy = healthy
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self.check(), timeout=self.interval)
+            except Exception:
+                logger.debug("Read replica lag check failed", exc_info=True)
+                self.lag = None
+                self.mark_down()
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        if self.enabled and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "healthy": self.healthy,
+            "lag_seconds": self.lag,
+            "pinned_users": len(self._pinned),
+        }
+
+
+replica_router = ReplicaRouter(
+    read_engine,
+    pin_seconds=settings.READ_YOUR_WRITES_SECONDS,
+    max_lag=settings.REPLICA_MAX_LAG_SECONDS,
+    interval=settings.REPLICA_CHECK_SECONDS,
+)
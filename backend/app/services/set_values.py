@@ -0,0 +1,34 @@
+"""SQL for reading numbers out of a logged set's JSONB.
+
+Sets are stored as the client sent them, so a field may be missing, of the
+wrong type or far too large to compute with: weight 1e308 overflows
+``weight * reps`` and reps 1e12 does not fit an integer. Every query over
+sets reads them through these expressions, which give NULL for anything that
+is not a number within bounds, so such values count as missing. Numbers are
+checked as ``numeric``, which holds any JSON number, before being cast.
+Migrations inline their own copy so they stay fixed at their revision.
+"""
+
+# Keep weight * reps, e1RM and per-exercise sums finite, and reps in an integer
+MAX_WEIGHT = 100_000
+MAX_REPS = 10_000
+# Durations, distances and RPE are only stored, never multiplied
+MAX_NUMBER = 10**15
+
+
+def number(value: str, key: str, limit: int, cast: str = "float") -> str:
+    """``value -> key`` as ``cast`` when it is a number no larger than ``limit``, else NULL."""
+    field = f"({value} -> '{key}')"
+    # Nested rather than AND-ed: Postgres may evaluate AND operands in any order
+    return (
+        f"CASE WHEN jsonb_typeof({field}) = 'number' THEN"
+        f" CASE WHEN abs({field}::numeric) <= {limit} THEN {field}::numeric::{cast} END END"
+    )
+
+
+def weight(value: str = "s.value") -> str:
+    return number(value, "weight", MAX_WEIGHT)
+
+
+def reps(value: str = "s.value") -> str:
+    return number(value, "reps", MAX_REPS, cast="int")
@@ -0,0 +1,121 @@
+import json
+from collections.abc import Iterable
+from datetime import date, datetime
+from typing import NamedTuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services import set_values
+
+GRANULARITIES = ("day", "week", "month")
+
+# Turns a "changes" CTE of (user_id, sign, date, exercise_id, sets) into signed
+# totals per user, granularity, period and muscle group. Sets are counted by
+# the same rules as exercise stats: completed=false is skipped, non-numeric or
+# out-of-range weight/reps count as missing.
+_ROLLUPS = f"""
+per_entry AS (
+    SELECT c.user_id, c.sign, c.date, e.muscle_group, v.set_count, v.total_reps, v.volume
+    FROM changes AS c
+    JOIN exercises AS e ON e.id = c.exercise_id
+    CROSS JOIN LATERAL (
+        SELECT count(*) AS set_count,
+               coalesce(sum(reps), 0) AS total_reps,
+               coalesce(sum(weight * reps), 0) AS volume
+        FROM (
+            SELECT {set_values.weight()} AS weight,
+                   {set_values.reps()} AS reps
+            FROM jsonb_array_elements(
+                CASE WHEN jsonb_typeof(c.sets) = 'array' THEN c.sets ELSE '[]'::jsonb END
+            ) AS s(value)
+            WHERE coalesce(s.value ->> 'completed', 'true') <> 'false'
+        ) AS counted
+    ) AS v
+),
+rollups AS (
+    SELECT p.user_id,
+           g.granularity,
+           date_trunc(g.granularity, p.date)::date AS period_start,
+           p.muscle_group,
+           sum(p.sign) AS entry_count,
+           sum(p.sign * p.set_count) AS set_count,
+           sum(p.sign * p.total_reps) AS total_reps,
+           sum(p.sign * p.volume) AS volume
+    FROM per_entry AS p
+    CROSS JOIN (VALUES ('day'), ('week'), ('month')) AS g(granularity)
+    GROUP BY 1, 2, 3, 4
+)
+INSERT INTO volume_rollups (
+    user_id, granularity, period_start, muscle_group,
+    entry_count, set_count, total_reps, volume, updated_at
+)
+SELECT user_id, granularity, period_start, muscle_group,
+       entry_count, set_count, total_reps, volume, :now
+FROM rollups
+ON CONFLICT (user_id, granularity, period_start, muscle_group) DO UPDATE SET
+    entry_count = volume_rollups.entry_count + excluded.entry_count,
+    set_count = volume_rollups.set_count + excluded.set_count,
+    total_reps = volume_rollups.total_reps + excluded.total_reps,
+    volume = volume_rollups.volume + excluded.volume,
+    updated_at = excluded.updated_at
+"""
+
+_APPLY = text(
+    """
+WITH changes AS (
+    SELECT CAST(:user_id AS varchar) AS user_id, c.*
+    FROM jsonb_to_recordset(CAST(:changes AS jsonb))
+        AS c(sign int, date date, exercise_id varchar, sets jsonb)
+),
+"""
+    + _ROLLUPS
+)
+
+_PRUNE = text("DELETE FROM volume_rollups WHERE user_id = :user_id AND entry_count <= 0")
+
+_REBUILD = """
+WITH changes AS (
+    SELECT user_id, 1 AS sign, date, exercise_id, sets
+    FROM workout_entries
+    WHERE NOT is_deleted AND {scope}
+),
+"""
+
+
+class EntryChange(NamedTuple):
+    """An entry's contribution being added (+1) or withdrawn (-1)."""
+
+    sign: int
+    date: date
+    exercise_id: str
+    sets: list
+
+
+async def apply(db: AsyncSession, user_id: str, changes: Iterable[EntryChange]) -> None:
+    """Add or withdraw entries' contributions to every granularity in one upsert."""
+    payload = [
+        {"sign": c.sign, "date": c.date.isoformat(), "exercise_id": c.exercise_id, "sets": c.sets}
+        for c in changes
+    ]
+    if not payload:
+        return
+    params = {"user_id": user_id, "changes": json.dumps(payload), "now": datetime.utcnow()}
+    await db.execute(_APPLY, params)
+    if any(change["sign"] < 0 for change in payload):
+        await db.execute(_PRUNE, {"user_id": user_id})
+
+
+async def rebuild(db: AsyncSession, user_id: str | None = None) -> None:
+    """
+    Recompute rollups from live entries, for one user or for everyone.
+
+    Used when an exercise changes muscle group and as the backfill/repair path;
+    normal writes go through ``apply``.
+    """
+    scope = "user_id = :user_id" if user_id else "true"
+    params = {"user_id": user_id} if user_id else {}
+    await db.execute(text(f"DELETE FROM volume_rollups WHERE {scope}"), params)
+    await db.execute(
+        text(_REBUILD.format(scope=scope) + _ROLLUPS), {**params, "now": datetime.utcnow()}
+    )
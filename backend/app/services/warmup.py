@@ -0,0 +1,130 @@
+import asyncio
+import contextlib
+import logging
+import time
+
+from jose import jwt
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import configure_mappers
+
+from app.auth import create_access_token
+from app.config import settings
+from app.database import async_engine, read_engine
+
+logger = logging.getLogger(__name__)
+
+
+class Warmup:
+    """Gets a freshly started process ready to serve its first request quickly.
+
+    Machines scale to zero, so the request that wakes one would otherwise pay
+    for mapper configuration, loading the JWT backend and connecting to
+    Postgres. At startup the CPU-bound steps run on a worker thread while
+    the first primary connection is opened, overlapping the two. The process
+    is ready once both are done; until then database dependencies wait up to
+    ``timeout`` seconds rather than racing it. The replica is connected
+    alongside but never holds readiness up.
+
+    Only one connection is opened: more would be checked out from under the
+    first requests, which then connect themselves anyway. Route building is
+    left to FastAPI, which does it per router on first use; generating the
+    OpenAPI schema up front builds every route and made the first response
+    slower, not faster.
+    """
+
+    def __init__(self, engines: dict[str, AsyncEngine], timeout: float) -> None:
+        self.engines = engines
+        self.timeout = timeout
+        self.ready = asyncio.Event()
+        self.seconds: float | None = None
+        self.steps: dict[str, float] = {}
+        self._task: asyncio.Task | None = None
+
+    def _prepare(self) -> None:
+        started = time.perf_counter()
+        configure_mappers()
+        self.steps["mappers"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        token = create_access_token("warmup", "warmup@localhost")
+        jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])
+        self.steps["jwt"] = time.perf_counter() - started
+
+    async def _open(self, step: str, engine: AsyncEngine) -> None:
+        """Open a connection and check it back into the pool."""
+        started = time.perf_counter()
+        async with engine.connect():
+            pass
+        self.steps[step] = time.perf_counter() - started
+
+    async def _connect_primary(self) -> None:
+        delay = 0.5
+        while True:
+            try:
+                await self._open("connect", self.engines["primary"])
+                return
+            except Exception:
+                logger.warning("Warmup could not reach the database; retrying", exc_info=True)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 10)
+
+    async def _open_replica(self) -> None:
+        try:
+            await self._open("replica", self.engines["replica"])
+        except Exception:
+            # The replica router keeps reads on the primary until it recovers
+            logger.info("Warmup could not reach the read replica", exc_info=True)
+
+    async def _run(self) -> None:
+        started = time.perf_counter()
+        replica = None
+        if "replica" in self.engines:
+            replica = asyncio.create_task(self._open_replica())
+        try:
+            # An engine's first connection also initialises the dialect
+            await asyncio.gather(asyncio.to_thread(self._prepare), self._connect_primary())
+            self.seconds = time.perf_counter() - started
+            self.ready.set()
+            if replica is not None:
+                await replica
+            logger.info(
+                "Ready in %.0f ms (%s)",
+                self.seconds * 1000,
+                ", ".join(
+                    f"{step} {seconds * 1000:.0f} ms" for step, seconds in self.steps.items()
+                ),
+            )
+        finally:
+            if replica is not None:
+                replica.cancel()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def wait(self) -> None:
+        """Wait for warmup to finish, for at most ``timeout`` seconds."""
+        if self.ready.is_set() or self._task is None:
+            return
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(self.ready.wait(), timeout=self.timeout)
+
+    def stats(self) -> dict:
+        return {
+            "ready": self.ready.is_set(),
+            "seconds": None if self.seconds is None else round(self.seconds, 3),
+            "steps": {step: round(seconds, 3) for step, seconds in self.steps.items()},
+        }
+
+
+warmup = Warmup(
+    {"primary": async_engine, **({"replica": read_engine} if read_engine is not None else {})},
+    timeout=settings.STARTUP_WARM_TIMEOUT,
+)
@@ -0,0 +1,53 @@
+from collections.abc import Collection
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.types import String
+
+from app.services import set_values
+
+# Unpacks the stored sets JSONB of the given entries into typed rows. Keys follow
+# the client's WorkoutSet shape; values of the wrong JSON type or out of range
+# become NULL and only an explicit completed=false marks a set as not completed.
+_INSERT = text(
+    f"""
+INSERT INTO workout_sets (
+    entry_id, ordinal, user_id, set_id,
+    weight, reps, time_minutes, distance, rpe, completed
+)
+SELECT we.id,
+       s.ordinal - 1,
+       we.user_id,
+       left(s.value ->> 'id', 36),
+       {set_values.weight()},
+       {set_values.reps()},
+       {set_values.number("s.value", "timeMinutes", set_values.MAX_NUMBER)},
+       {set_values.number("s.value", "distance", set_values.MAX_NUMBER)},
+       {set_values.number("s.value", "rpe", set_values.MAX_NUMBER)},
+       coalesce(s.value ->> 'completed', 'true') <> 'false'
+FROM workout_entries AS we
+CROSS JOIN LATERAL jsonb_array_elements(
+    CASE WHEN jsonb_typeof(we.sets) = 'array' THEN we.sets ELSE '[]'::jsonb END
+) WITH ORDINALITY AS s(value, ordinal)
+WHERE we.id = ANY(:entry_ids) AND we.user_id = :user_id
+"""
+).bindparams(bindparam("entry_ids", type_=ARRAY(String)))
+
+_DELETE = text(
+    "DELETE FROM workout_sets WHERE entry_id = ANY(:entry_ids) AND user_id = :user_id"
+).bindparams(bindparam("entry_ids", type_=ARRAY(String)))
+
+
+async def insert(db: AsyncSession, user_id: str, entry_ids: Collection[str]) -> None:
+    """Write the typed sets of newly created entries."""
+    if entry_ids:
+        await db.execute(_INSERT, {"user_id": user_id, "entry_ids": list(entry_ids)})
+
+
+async def replace(db: AsyncSession, user_id: str, entry_ids: Collection[str]) -> None:
+    """Rewrite the typed sets of entries whose sets JSONB changed."""
+    if entry_ids:
+        params = {"user_id": user_id, "entry_ids": list(entry_ids)}
+        await db.execute(_DELETE, params)
+        await db.execute(_INSERT, params)
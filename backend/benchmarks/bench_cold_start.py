@@ -0,0 +1,196 @@
+"""Startup benchmark: process start to the first authenticated response.
+
+Each run starts a fresh process and times how long until an authenticated GET
+/api/v1/exercises for a seeded user succeeds, as the request that wakes a
+stopped machine would experience it. ``--requests`` sends several at once, as
+the SPA's first load does, and also reports when the last one finished.
+
+By default the app is served by uvicorn: /health is polled until the port
+answers, then the authenticated requests are sent. ``--asgi`` instead runs the
+app in a child process without a server, sending the requests through ASGI as
+soon as the lifespan starts, which needs no uvicorn and splits out import time.
+``--no-warmup`` runs with STARTUP_WARMUP=false for comparison.
+
+Uses the first user in the seed_load_data manifest unless ``--user-id`` and
+``--email`` are given.
+
+    uv run python -m benchmarks.bench_cold_start --runs 5
+    uv run python -m benchmarks.bench_cold_start --asgi --runs 5 --no-warmup
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Only the standard library at module level: the child process imports this
+# module too, and anything heavier would be counted as app startup.
+
+PATH = "/api/v1/exercises"
+BACKEND = Path(__file__).parent.parent
+
+
+def _child(user_id: str, email: str, requests: int) -> None:
+    """Run in the spawned process: import the app and serve the requests through ASGI."""
+    from app.auth import create_access_token
+    from app.main import app
+
+    imported = time.time()
+    token = create_access_token(user_id, email)
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": PATH,
+        "raw_path": PATH.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"cold"), (b"authorization", f"Bearer {token}".encode())],
+        "client": ("127.0.0.1", 1),
+        "server": ("cold", 80),
+    }
+    result = {"imported": imported, "responded": [], "statuses": []}
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict) -> None:
+        if message["type"] == "http.response.start":
+            result["statuses"].append(message["status"])
+        elif not message.get("more_body"):
+            result["responded"].append(time.time())
+
+    async def first_load() -> None:
+        async with app.router.lifespan_context(app):
+            await asyncio.gather(*(app(dict(scope), receive, send) for _ in range(requests)))
+
+    asyncio.run(first_load())
+    print(json.dumps(result))
+
+
+def _env(warm: bool) -> dict[str, str]:
+    return {**os.environ, "PYTHONPATH": str(BACKEND), "STARTUP_WARMUP": str(warm).lower()}
+
+
+def _timings(started: float, responded: list[float]) -> dict[str, float]:
+    timings = {"first response": min(responded) - started}
+    if len(responded) > 1:
+        timings["last response"] = max(responded) - started
+    return timings
+
+
+def run_asgi(user_id: str, email: str, warm: bool, requests: int) -> dict[str, float]:
+    started = time.time()
+    command = [sys.executable, "-m", "benchmarks.bench_cold_start", "--child", user_id, email]
+    output = subprocess.run(
+        [*command, str(requests)],
+        cwd=BACKEND,
+        env=_env(warm),
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    child = json.loads(output.splitlines()[-1])
+    if any(status != 200 for status in child["statuses"]):
+        raise SystemExit(f"Requests returned {child['statuses']}")
+    return {"import": child["imported"] - started, **_timings(started, child["responded"])}
+
+
+def run_server(
+    user_id: str, email: str, warm: bool, requests: int, port: int, timeout: float
+) -> dict[str, float]:
+    import httpx
+
+    from app.auth import create_access_token
+
+    headers = {"Authorization": f"Bearer {create_access_token(user_id, email)}"}
+    command = [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port)]
+
+    async def first_load(started: float, server: subprocess.Popen) -> dict[str, float]:
+        base_url = f"http://127.0.0.1:{port}"
+        async with httpx.AsyncClient(base_url=base_url, timeout=timeout) as client:
+            while True:
+                try:
+                    await client.get("/health")
+                    break
+                except httpx.TransportError:
+                    if server.poll() is not None:
+                        raise SystemExit(f"Server exited with {server.returncode}")
+                    await asyncio.sleep(0.005)
+            listening = time.time() - started
+
+            async def request() -> float:
+                response = await client.get(PATH, headers=headers)
+                if response.status_code != 200:
+                    raise SystemExit(f"{PATH} returned {response.status_code}")
+                return time.time()
+
+            responded = await asyncio.gather(*(request() for _ in range(requests)))
+        return {"listening": listening, **_timings(started, responded)}
+
+    started = time.time()
+    server = subprocess.Popen(
+        command, cwd=BACKEND, env=_env(warm), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        return asyncio.run(asyncio.wait_for(first_load(started, server), timeout))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main() -> None:
+    if sys.argv[1:2] == ["--child"]:
+        _child(sys.argv[2], sys.argv[3], int(sys.argv[4]))
+        return
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--asgi", action="store_true", help="Skip the server; time import + ASGI")
+    parser.add_argument("--no-warmup", dest="warm", action="store_false")
+    parser.add_argument("--requests", type=int, default=1, help="Concurrent first requests")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--timeout", type=float, default=60)
+    parser.add_argument("--manifest", type=Path)
+    parser.add_argument("--user-id")
+    parser.add_argument("--email")
+    args = parser.parse_args()
+
+    from benchmarks.seed_load_data import DEFAULT_MANIFEST
+
+    user_id, email = args.user_id, args.email
+    if not user_id:
+        user = json.loads((args.manifest or DEFAULT_MANIFEST).read_text())["users"][0]
+        user_id, email = user["id"], user["email"]
+
+    samples: dict[str, list[float]] = {}
+    for run in range(args.runs):
+        if args.asgi:
+            timings = run_asgi(user_id, email, args.warm, args.requests)
+        else:
+            timings = run_server(user_id, email, args.warm, args.requests, args.port, args.timeout)
+        print(f"run {run + 1}: " + ", ".join(f"{k} {v * 1000:.0f} ms" for k, v in timings.items()))
+        for phase, seconds in timings.items():
+            samples.setdefault(phase, []).append(seconds)
+
+    mode = "ASGI" if args.asgi else "uvicorn"
+    print(
+        f"\n{mode}, warmup {'on' if args.warm else 'off'}, "
+        f"{args.requests} concurrent requests, {args.runs} runs:"
+    )
+    for phase, values in samples.items():
+        print(
+            f"  {phase:<15} min {min(values) * 1000:6.0f} ms  "
+            f"median {statistics.median(values) * 1000:6.0f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
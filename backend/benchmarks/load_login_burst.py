@@ -0,0 +1,79 @@
+"""Load test: /api/v1/entries latency while logins hammer the server.
+
+Run against a live server (e.g. ``uv run uvicorn app.main:app``). The script
+registers a throwaway user, then runs reader clients on /api/v1/entries while
+login clients submit bcrypt-bound requests as fast as they can. It reports
+p50/p95/p99 for the readers and how many logins were shed with 503.
+
+    uv run python -m benchmarks.load_login_burst --url http://localhost:8000 --seconds 20
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from collections import Counter
+
+import httpx
+
+from benchmarks.stats import percentile
+
+
+async def _reader(client: httpx.AsyncClient, token: str, deadline: float, out: list[float]):
+    headers = {"Authorization": f"Bearer {token}"}
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        response = await client.get("/api/v1/entries", headers=headers)
+        response.raise_for_status()
+        out.append((time.perf_counter() - start) * 1000)
+
+
+async def _login(client: httpx.AsyncClient, creds: dict, deadline: float, statuses: Counter):
+    while time.perf_counter() < deadline:
+        response = await client.post("/api/v1/auth/login", json=creds)
+        statuses[response.status_code] += 1
+        if response.status_code == 503:
+            await asyncio.sleep(float(response.headers.get("Retry-After", "1")))
+
+
+async def run(url: str, seconds: float, readers: int, logins: int) -> None:
+    creds = {"email": f"load-{uuid.uuid4().hex[:12]}@example.com", "password": "load-test-pw"}
+    limits = httpx.Limits(max_connections=readers + logins + 4)
+
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=30) as client:
+        response = await client.post("/api/v1/auth/register", json=creds)
+        response.raise_for_status()
+        token = response.json()["access_token"]
+
+        for phase, login_clients in (("idle", 0), ("login burst", logins)):
+            latencies: list[float] = []
+            statuses: Counter = Counter()
+            deadline = time.perf_counter() + seconds
+            await asyncio.gather(
+                *(_reader(client, token, deadline, latencies) for _ in range(readers)),
+                *(_login(client, creds, deadline, statuses) for _ in range(login_clients)),
+            )
+            print(
+                f"{phase:>12}: entries n={len(latencies)} "
+                f"p50={percentile(latencies, 50):.1f}ms "
+                f"p95={percentile(latencies, 95):.1f}ms "
+                f"p99={percentile(latencies, 99):.1f}ms "
+                f"mean={statistics.fmean(latencies) if latencies else float('nan'):.1f}ms"
+            )
+            if login_clients:
+                print(f"{'':>12}  login responses: {dict(sorted(statuses.items()))}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--seconds", type=float, default=20)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--logins", type=int, default=32)
+    args = parser.parse_args()
+    asyncio.run(run(args.url, args.seconds, args.readers, args.logins))
+
+
+if __name__ == "__main__":
+    main()
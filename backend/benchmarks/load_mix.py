@@ -0,0 +1,269 @@
+"""Load test: replay a realistic traffic mix against users from seed_load_data.
+
+Concurrent clients repeatedly pick a seeded user and run one scenario:
+
+- dashboard: the SPA's parallel first load of exercises, recent entries and
+  plans (revalidated with If-None-Match once the client has ETags), the
+  calendar and the weekly volume chart
+- logging: a workout being logged, several POST /entries ``--think-ms``
+  apart, followed by the exercise's stats
+- plans: the plan list followed by an edit, or sometimes a new plan
+
+Requests made during ``--warmup`` are discarded. The report gives throughput
+and p50/p95/p99 per route, is saved as JSON, and can be compared against a
+baseline saved from an earlier run; regressions make the exit status 1.
+
+Tokens are minted locally, so a live server must share this checkout's
+JWT_SECRET. ``--in-process`` drives the app through ASGI without a server,
+which is handy for comparing commits but includes client overhead.
+
+    uv run python -m benchmarks.seed_load_data --users 200 --reset
+    uv run python -m benchmarks.load_mix --url http://localhost:8000 --save-baseline
+    uv run python -m benchmarks.load_mix --url http://localhost:8000 --baseline
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import subprocess
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import httpx
+
+from app.auth import create_access_token
+from benchmarks.load_report import compare, print_report, summarize
+from benchmarks.seed_load_data import DEFAULT_MANIFEST, PLAN_TAGS, PLAN_TITLES, make_sets, new_id
+
+RESULTS = Path(__file__).parent / "results"
+BASELINE = Path(__file__).parent / "baseline.json"  # Committed, so every run has one
+DEFAULT_MIX = "dashboard=60,logging=25,plans=15"
+
+
+class Recorder:
+    """Latency samples per route, collected only once warmup is over."""
+
+    def __init__(self) -> None:
+        self.measuring = False
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+
+    def add(self, route: str, elapsed_ms: float, ok: bool) -> None:
+        if not self.measuring:
+            return
+        self.latencies[route].append(elapsed_ms)
+        if not ok:
+            self.errors[route] += 1
+
+
+class VirtualUser:
+    """One seeded user as a client sees it: a token, known IDs and cached ETags."""
+
+    def __init__(self, user: dict) -> None:
+        self.id = user["id"]
+        self.headers = {"Authorization": f"Bearer {create_access_token(user['id'], user['email'])}"}
+        self.exercise_ids = user["exercise_ids"]
+        self.plan_ids = list(user["plan_ids"])
+        self.etags: dict[str, str] = {}
+        self.lock = asyncio.Lock()  # One scenario per user at a time, like one device
+
+
+class Driver:
+    def __init__(self, client: httpx.AsyncClient, recorder: Recorder, rng: random.Random):
+        self.client = client
+        self.recorder = recorder
+        self.rng = rng
+
+    async def request(
+        self, vu: VirtualUser, route: str, method: str, url: str, conditional=False, **kwargs
+    ) -> httpx.Response:
+        headers = dict(vu.headers)
+        if conditional and url in vu.etags:
+            headers["If-None-Match"] = vu.etags[url]
+
+        start = time.perf_counter()
+        response = await self.client.request(method, url, headers=headers, **kwargs)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        if conditional and response.status_code == 200 and "etag" in response.headers:
+            vu.etags[url] = response.headers["etag"]
+        self.recorder.add(f"{method} {route}", elapsed_ms, response.status_code < 400)
+        return response
+
+    async def dashboard(self, vu: VirtualUser) -> None:
+        await asyncio.gather(
+            self.request(vu, "/api/v1/exercises", "GET", "/api/v1/exercises", conditional=True),
+            self.request(vu, "/api/v1/entries", "GET", "/api/v1/entries?limit=50", True),
+            self.request(vu, "/api/v1/plans", "GET", "/api/v1/plans?limit=20", True),
+            self.request(vu, "/api/v1/calendar", "GET", "/api/v1/calendar"),
+            self.request(vu, "/api/v1/analytics/volume", "GET", "/api/v1/analytics/volume"),
+        )
+
+    async def logging(self, vu: VirtualUser, think: float) -> None:
+        exercise_id = self.rng.choice(vu.exercise_ids)
+        for _ in range(self.rng.randint(3, 6)):
+            entry = {
+                "id": new_id(self.rng),
+                "date": date.today().isoformat(),
+                "exercise_id": exercise_id,
+                "workout_type": "Strength",
+                "sets": make_sets(self.rng, self.rng.choice((40, 60, 80, 100)), 1.0),
+            }
+            await self.request(vu, "/api/v1/entries", "POST", "/api/v1/entries", json=entry)
+            await asyncio.sleep(think)
+        route = "/api/v1/exercises/{exercise_id}/stats"
+        await self.request(vu, route, "GET", f"/api/v1/exercises/{exercise_id}/stats")
+
+    async def plans(self, vu: VirtualUser) -> None:
+        await self.request(vu, "/api/v1/plans", "GET", "/api/v1/plans?limit=20", conditional=True)
+        exercises = [
+            {"exerciseId": exercise_id, "sets": make_sets(self.rng, 60, 1.0)}
+            for exercise_id in self.rng.sample(vu.exercise_ids, 3)
+        ]
+        if vu.plan_ids and self.rng.random() < 0.8:
+            plan_id = self.rng.choice(vu.plan_ids)
+            body = {"title": self.rng.choice(PLAN_TITLES), "exercises": exercises}
+            await self.request(
+                vu, "/api/v1/plans/{plan_id}", "PUT", f"/api/v1/plans/{plan_id}", json=body
+            )
+            return
+
+        plan = {
+            "id": new_id(self.rng),
+            "date": (date.today() + timedelta(days=self.rng.randint(1, 7))).isoformat(),
+            "title": self.rng.choice(PLAN_TITLES),
+            "tags": self.rng.sample(PLAN_TAGS, 2),
+            "exercises": exercises,
+        }
+        response = await self.request(vu, "/api/v1/plans", "POST", "/api/v1/plans", json=plan)
+        if response.status_code == 201:
+            vu.plan_ids.append(plan["id"])
+
+
+def parse_mix(mix: str) -> dict[str, int]:
+    weights = {}
+    for part in mix.split(","):
+        name, _, weight = part.partition("=")
+        if name not in ("dashboard", "logging", "plans"):
+            raise SystemExit(f"Unknown scenario {name!r}")
+        weights[name] = int(weight)
+    return weights
+
+
+async def _client_loop(
+    driver: Driver, users: list[VirtualUser], mix: dict[str, int], deadline: float, think: float
+) -> None:
+    names, weights = list(mix), list(mix.values())
+    while time.perf_counter() < deadline:
+        vu = driver.rng.choice(users)
+        async with vu.lock:
+            scenario = driver.rng.choices(names, weights)[0]
+            if scenario == "logging":
+                await driver.logging(vu, think)
+            else:
+                await getattr(driver, scenario)(vu)
+        await asyncio.sleep(driver.rng.uniform(0, 2 * think))
+
+
+async def _drive(client: httpx.AsyncClient, args: argparse.Namespace) -> Recorder:
+    manifest = json.loads(args.manifest.read_text())
+    users = [VirtualUser(user) for user in manifest["users"]]
+    recorder = Recorder()
+    rng = random.Random(args.seed)
+    think = args.think_ms / 1000
+
+    start = time.perf_counter()
+    deadline = start + args.warmup + args.seconds
+    clients = [
+        _client_loop(
+            Driver(client, recorder, random.Random(rng.random())), users, args.mix, deadline, think
+        )
+        for _ in range(args.concurrency)
+    ]
+
+    async def start_measuring() -> None:
+        await asyncio.sleep(args.warmup)
+        recorder.measuring = True
+
+    await asyncio.gather(start_measuring(), *clients)
+    return recorder
+
+
+async def run(args: argparse.Namespace, commit: str | None) -> dict:
+    limits = httpx.Limits(max_connections=args.concurrency * 5)
+    if args.in_process:
+        from app.main import app
+
+        transport = httpx.ASGITransport(app=app)
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(transport=transport, base_url="http://load") as client:
+                recorder = await _drive(client, args)
+        target = "in-process"
+    else:
+        async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=30) as client:
+            recorder = await _drive(client, args)
+        target = args.url
+
+    routes = {
+        route: summarize(samples, recorder.errors[route], args.seconds)
+        for route, samples in recorder.latencies.items()
+    }
+    all_samples = [sample for samples in recorder.latencies.values() for sample in samples]
+    return {
+        "meta": {
+            "target": target,
+            "concurrency": args.concurrency,
+            "seconds": args.seconds,
+            "warmup": args.warmup,
+            "mix": args.mix,
+            "think_ms": args.think_ms,
+            "seed": args.seed,
+            "commit": commit,
+            "python": platform.python_version(),
+            "recorded_at": datetime.now().isoformat(timespec="seconds"),
+        },
+        "routes": routes,
+        "total": summarize(all_samples, sum(recorder.errors.values()), args.seconds),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--url", default="http://localhost:8000")
+    target.add_argument("--in-process", action="store_true", help="Drive the app without a server")
+    parser.add_argument("--manifest", type=Path, default=DEFAULT_MANIFEST)
+    parser.add_argument("--seconds", type=float, default=60)
+    parser.add_argument("--warmup", type=float, default=10)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX))
+    parser.add_argument("--think-ms", type=float, default=200, help="Mean pause between actions")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--out", type=Path, default=RESULTS / "latest.json")
+    parser.add_argument("--baseline", nargs="?", type=Path, const=BASELINE, help="Compare")
+    parser.add_argument("--save-baseline", nargs="?", type=Path, const=BASELINE, help="Store")
+    parser.add_argument("--tolerance", type=float, default=0.15)
+    args = parser.parse_args()
+
+    # Blocking, so kept out of the event loop
+    commit = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True
+    ).stdout.strip()
+    result = asyncio.run(run(args, commit or None))
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    args.out.write_text(json.dumps(result, indent=2))
+    print_report(result)
+
+    if args.save_baseline:
+        args.save_baseline.write_text(json.dumps(result, indent=2))
+        print(f"\nBaseline saved to {args.save_baseline}")
+    if args.baseline and compare(result, json.loads(args.baseline.read_text()), args.tolerance):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Per-route throughput and latency report for load_mix results.
+
+Summarizes raw samples into per-route count, throughput, error rate and
+p50/p95/p99 latency, and compares a result against a stored baseline. A route
+regresses when a latency percentile or its throughput is worse than the
+baseline by more than ``--tolerance``.
+
+    uv run python -m benchmarks.load_report benchmarks/results/latest.json \\
+        --baseline benchmarks/baseline.json
+"""
+
+import argparse
+import json
+import statistics
+from pathlib import Path
+
+from benchmarks.stats import percentile
+
+PERCENTILES = (50, 95, 99)
+
+
+def summarize(latencies: list[float], errors: int, seconds: float) -> dict:
+    """Summary of one route's latency samples in milliseconds."""
+    summary = {
+        "count": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / seconds if seconds else 0.0,
+        "mean": statistics.fmean(latencies) if latencies else float("nan"),
+    }
+    for pct in PERCENTILES:
+        summary[f"p{pct}"] = percentile(latencies, pct)
+    return summary
+
+
+def print_report(result: dict) -> None:
+    meta = result["meta"]
+    print(
+        f"{meta['target']}, {meta['concurrency']} clients, {meta['seconds']:.0f}s measured, "
+        f"{result['total']['rps']:.1f} req/s, {result['total']['errors']} errors"
+    )
+    print(f"{'route':<48} {'count':>7} {'req/s':>7} {'p50':>8} {'p95':>8} {'p99':>8} {'err':>5}")
+    for route, stats in sorted(result["routes"].items()):
+        print(
+            f"{route:<48} {stats['count']:>7} {stats['rps']:>7.1f} "
+            + " ".join(f"{stats[f'p{pct}']:>6.1f}ms" for pct in PERCENTILES)
+            + f" {stats['errors']:>5}"
+        )
+
+
+def compare(result: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Print per-route changes against the baseline and return the regressions."""
+    regressions = []
+    print(f"\nAgainst baseline ({baseline['meta'].get('recorded_at', 'unknown date')}):")
+    print(f"{'route':<48} {'req/s':>8} " + " ".join(f"{f'p{pct}':>8}" for pct in PERCENTILES))
+
+    def change(new: float, old: float) -> float:
+        return (new - old) / old if old else 0.0
+
+    for route in sorted(set(result["routes"]) | set(baseline["routes"])):
+        new, old = result["routes"].get(route), baseline["routes"].get(route)
+        if new is None or old is None:
+            print(f"{route:<48} {'only in ' + ('baseline' if new is None else 'result'):>8}")
+            continue
+
+        deltas = {"req/s": change(new["rps"], old["rps"])}
+        deltas |= {f"p{pct}": change(new[f"p{pct}"], old[f"p{pct}"]) for pct in PERCENTILES}
+        print(f"{route:<48} " + " ".join(f"{delta:>+8.0%}" for delta in deltas.values()))
+
+        worse = [name for name, delta in deltas.items() if name != "req/s" and delta > tolerance]
+        if deltas["req/s"] < -tolerance:
+            worse.append("req/s")
+        if worse:
+            regressions.append(f"{route}: {', '.join(worse)}")
+
+    if regressions:
+        print(f"\nRegressions beyond {tolerance:.0%}:")
+        for regression in regressions:
+            print(f"  {regression}")
+    else:
+        print(f"\nNo route regressed beyond {tolerance:.0%}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("result", type=Path)
+    parser.add_argument("--baseline", type=Path)
+    parser.add_argument("--tolerance", type=float, default=0.15)
+    args = parser.parse_args()
+
+    result = json.loads(args.result.read_text())
+    print_report(result)
+    if args.baseline and compare(result, json.loads(args.baseline.read_text()), args.tolerance):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
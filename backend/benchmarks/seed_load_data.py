@@ -0,0 +1,324 @@
+"""Seed a local Postgres with synthetic users for the load-test benchmark.
+
+Creates ``--users`` accounts whose history sizes are spread log-uniformly
+between ``--min-entries`` and ``--max-entries`` (most users are small, a few
+are heavy), each with an exercise library, plans and workout entries whose
+``sets`` JSONB follows the client's WorkoutSet shape. Rows are COPY'd straight
+into the tables, then workout_sets, exercise_stats and volume_rollups are
+derived with the same services the API uses, so every read path sees
+consistent data. A manifest of the seeded users is written for
+``benchmarks.load_mix``.
+
+Seeded users share the ``@load.test`` email domain; ``--reset`` deletes them
+and everything they own first, and is needed to seed again. The generated
+data, IDs included, is deterministic for a given ``--seed``.
+
+    uv run python -m benchmarks.seed_load_data --users 200 --reset
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from urllib.parse import urlparse
+
+from sqlalchemy import text
+
+from app.auth import hash_password
+from app.config import settings
+from app.database import AsyncSessionLocal, async_engine
+from app.models import MuscleGroup
+from app.services import exercise_stats, volume_rollups, workout_sets
+
+EMAIL_DOMAIN = "load.test"
+PASSWORD = "load-test-pw"
+DEFAULT_MANIFEST = Path(__file__).parent / "results" / "load_manifest.json"
+
+# (name, muscle group, equipment, typical working weight in kg; None = cardio)
+EXERCISE_LIBRARY = [
+    ("Bench Press", MuscleGroup.Chest, "Barbell", 70),
+    ("Incline Dumbbell Press", MuscleGroup.Chest, "Dumbbell", 26),
+    ("Cable Fly", MuscleGroup.Chest, "Cable", 15),
+    ("Deadlift", MuscleGroup.Back, "Barbell", 120),
+    ("Pull Up", MuscleGroup.Back, "Bodyweight", 0),
+    ("Barbell Row", MuscleGroup.Back, "Barbell", 60),
+    ("Lat Pulldown", MuscleGroup.Back, "Cable", 55),
+    ("Back Squat", MuscleGroup.Legs, "Barbell", 95),
+    ("Romanian Deadlift", MuscleGroup.Legs, "Barbell", 80),
+    ("Leg Press", MuscleGroup.Legs, "Machine", 160),
+    ("Walking Lunge", MuscleGroup.Legs, "Dumbbell", 20),
+    ("Overhead Press", MuscleGroup.Shoulders, "Barbell", 45),
+    ("Lateral Raise", MuscleGroup.Shoulders, "Dumbbell", 10),
+    ("Face Pull", MuscleGroup.Shoulders, "Cable", 20),
+    ("Barbell Curl", MuscleGroup.Arms, "Barbell", 30),
+    ("Triceps Pushdown", MuscleGroup.Arms, "Cable", 25),
+    ("Hammer Curl", MuscleGroup.Arms, "Dumbbell", 14),
+    ("Plank", MuscleGroup.Core, "Bodyweight", 0),
+    ("Hanging Leg Raise", MuscleGroup.Core, "Bodyweight", 0),
+    ("Clean and Press", MuscleGroup.Full_Body, "Barbell", 50),
+    ("Kettlebell Swing", MuscleGroup.Full_Body, "Kettlebell", 24),
+    ("Running", MuscleGroup.Cardio, "None", None),
+    ("Rowing Machine", MuscleGroup.Cardio, "Machine", None),
+    ("Cycling", MuscleGroup.Cardio, "Bike", None),
+]
+
+PLAN_TITLES = ["Push Day", "Pull Day", "Leg Day", "Upper Body", "Lower Body", "Full Body", "Cardio"]
+PLAN_TAGS = ["strength", "hypertrophy", "deload", "conditioning", "home", "gym"]
+
+
+def new_id(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def make_sets(rng: random.Random, base_weight: float | None, progress: float) -> list[dict]:
+    """Sets shaped like the client's WorkoutSet for one exercise on one day."""
+    if base_weight is None:
+        minutes = round(rng.uniform(15, 50), 1)
+        return [
+            {
+                "id": new_id(rng),
+                "weight": 0,
+                "timeMinutes": minutes,
+                "distance": round(minutes * rng.uniform(0.12, 0.2), 2),
+                "completed": True,
+            }
+        ]
+
+    sets = []
+    weight = round(base_weight * progress / 2.5) * 2.5
+    for _ in range(rng.choice((3, 3, 4, 4, 5))):
+        working_set = {
+            "id": new_id(rng),
+            "weight": weight,
+            "reps": rng.choice((5, 6, 8, 8, 10, 12)),
+            "completed": rng.random() > 0.03,
+        }
+        if rng.random() < 0.4:
+            working_set["rpe"] = rng.choice((7, 7.5, 8, 8.5, 9))
+        if rng.random() < 0.05:
+            working_set["notes"] = "felt heavy"
+        sets.append(working_set)
+    return sets
+
+
+def generate_user(rng: random.Random, index: int, min_entries: int, max_entries: int) -> dict:
+    """One user's rows, ready for COPY."""
+    user_id = new_id(rng)
+    now = datetime.utcnow()
+    entry_count = round(math.exp(rng.uniform(math.log(min_entries), math.log(max_entries))))
+
+    library = rng.sample(EXERCISE_LIBRARY, rng.randint(8, len(EXERCISE_LIBRARY)))
+    exercises = []
+    for name, muscle_group, equipment, base_weight in library:
+        exercises.append(
+            {
+                "id": new_id(rng),
+                "name": name,
+                "muscle_group": muscle_group.value,
+                "equipment": equipment,
+                "base_weight": base_weight,
+            }
+        )
+
+    # Training days going back far enough for ~4 exercises per session
+    days = max(1, math.ceil(entry_count / 4))
+    first_day = date.today() - timedelta(days=days * 2)
+    entries = []
+    plans = []
+    remaining = entry_count
+    for day_index in range(days):
+        if remaining <= 0:
+            break
+        day = first_day + timedelta(days=day_index * 2 + rng.randint(0, 1))
+        session = rng.sample(exercises, min(len(exercises), rng.randint(3, 5), remaining))
+        remaining -= len(session)
+        progress = 0.8 + 0.4 * day_index / days
+
+        plan_id = None
+        if rng.random() < 0.3:
+            plan_id = new_id(rng)
+            plans.append(
+                (
+                    plan_id,
+                    user_id,
+                    day,
+                    rng.choice(PLAN_TITLES),
+                    rng.sample(PLAN_TAGS, rng.randint(0, 2)),
+                    json.dumps(
+                        [
+                            {
+                                "exerciseId": exercise["id"],
+                                "sets": make_sets(rng, exercise["base_weight"], progress),
+                            }
+                            for exercise in session
+                        ]
+                    ),
+                    day < date.today(),
+                    now,
+                    now,
+                    False,
+                )
+            )
+
+        for exercise in session:
+            entries.append(
+                (
+                    new_id(rng),
+                    user_id,
+                    day,
+                    exercise["id"],
+                    "Cardio" if exercise["base_weight"] is None else "Strength",
+                    json.dumps(make_sets(rng, exercise["base_weight"], progress)),
+                    plan_id,
+                    now,
+                    now,
+                    False,
+                )
+            )
+
+    return {
+        "id": user_id,
+        "email": f"load-{index:05d}@{EMAIL_DOMAIN}",
+        "exercises": [
+            (
+                e["id"],
+                user_id,
+                e["name"],
+                e["muscle_group"],
+                e["equipment"],
+                None,
+                None,
+                now,
+                now,
+                False,
+            )
+            for e in exercises
+        ],
+        "plans": plans,
+        "entries": entries,
+    }
+
+
+EXERCISE_COLUMNS = (
+    "id", "user_id", "name", "muscle_group", "equipment", "notes", "personal_best",
+    "created_at", "updated_at", "is_deleted",
+)  # fmt: skip
+PLAN_COLUMNS = (
+    "id", "user_id", "date", "title", "tags", "exercises", "is_completed",
+    "created_at", "updated_at", "is_deleted",
+)  # fmt: skip
+ENTRY_COLUMNS = (
+    "id", "user_id", "date", "exercise_id", "workout_type", "sets", "plan_id",
+    "created_at", "updated_at", "is_deleted",
+)  # fmt: skip
+
+# Children first; nothing in the schema cascades
+RESET_STATEMENTS = [
+    f"DELETE FROM {table} WHERE user_id IN "
+    f"(SELECT id FROM users WHERE email LIKE '%@{EMAIL_DOMAIN}')"
+    for table in (
+        "workout_sets",
+        "volume_rollups",
+        "exercise_stats",
+        "workout_entries",
+        "workout_plans",
+        "exercises",
+    )
+] + [f"DELETE FROM users WHERE email LIKE '%@{EMAIL_DOMAIN}'"]
+
+
+def check_local(url: str, allow_remote: bool) -> None:
+    host = urlparse(url.replace("+asyncpg", "")).hostname or "localhost"
+    if host not in ("localhost", "127.0.0.1", "::1", "db", "postgres") and not allow_remote:
+        raise SystemExit(f"Refusing to seed {host}; pass --allow-remote if this is intended")
+
+
+async def seed(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    password_hash = hash_password(PASSWORD)
+    started = time.perf_counter()
+
+    async with AsyncSessionLocal() as db:
+        if args.reset:
+            for statement in RESET_STATEMENTS:
+                await db.execute(text(statement))
+            await db.commit()
+
+        connection = await db.connection()
+        driver = (await connection.get_raw_connection()).driver_connection
+
+        manifest = []
+        totals = {"exercises": 0, "plans": 0, "entries": 0}
+        for index in range(args.users):
+            user = generate_user(rng, index, args.min_entries, args.max_entries)
+            await driver.execute(
+                "INSERT INTO users (id, email, password_hash, created_at, data_version) "
+                "VALUES ($1, $2, $3, $4, 1)",
+                user["id"],
+                user["email"],
+                password_hash,
+                datetime.utcnow(),
+            )
+            for table, columns, key in (
+                ("exercises", EXERCISE_COLUMNS, "exercises"),
+                ("workout_plans", PLAN_COLUMNS, "plans"),
+                ("workout_entries", ENTRY_COLUMNS, "entries"),
+            ):
+                if user[key]:
+                    await driver.copy_records_to_table(table, records=user[key], columns=columns)
+                totals[key] += len(user[key])
+
+            entry_ids = [entry[0] for entry in user["entries"]]
+            await workout_sets.insert(db, user["id"], entry_ids)
+            await exercise_stats.add_entries(db, user["id"], entry_ids)
+            await db.commit()
+
+            manifest.append(
+                {
+                    "id": user["id"],
+                    "email": user["email"],
+                    "entries": len(user["entries"]),
+                    "exercise_ids": [exercise[0] for exercise in user["exercises"]],
+                    # Enough for plan edits without bloating the manifest
+                    "plan_ids": [plan[0] for plan in user["plans"][-50:]],
+                }
+            )
+            if (index + 1) % 25 == 0:
+                print(f"  {index + 1}/{args.users} users, {totals['entries']:,} entries")
+
+        await volume_rollups.rebuild(db)
+        await db.execute(text("ANALYZE"))
+        await db.commit()
+
+    await async_engine.dispose()
+
+    args.manifest.parent.mkdir(parents=True, exist_ok=True)
+    args.manifest.write_text(json.dumps({"password": PASSWORD, "users": manifest}))
+    print(
+        f"Seeded {args.users} users, {totals['exercises']:,} exercises, "
+        f"{totals['plans']:,} plans, {totals['entries']:,} entries "
+        f"in {time.perf_counter() - started:.1f}s; manifest at {args.manifest}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--min-entries", type=int, default=10)
+    parser.add_argument("--max-entries", type=int, default=5_000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--reset", action="store_true", help="Delete previously seeded users")
+    parser.add_argument("--manifest", type=Path, default=DEFAULT_MANIFEST)
+    parser.add_argument("--allow-remote", action="store_true")
+    args = parser.parse_args()
+    check_local(settings.DATABASE_URL, args.allow_remote)
+    asyncio.run(seed(args))
+
+
+if __name__ == "__main__":
+    main()
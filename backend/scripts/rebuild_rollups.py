@@ -0,0 +1,41 @@
+"""Rebuild the volume rollups from live workout entries.
+
+Rollups are maintained incrementally on every entry write; this recomputes
+them from scratch, for backfilling after a deploy or repairing drift.
+
+    uv run python -m scripts.rebuild_rollups            # every user
+    uv run python -m scripts.rebuild_rollups --user ID  # one user
+"""
+
+import argparse
+import asyncio
+
+from sqlalchemy import func, select
+
+from app.database import AsyncSessionLocal, async_engine
+from app.models import VolumeRollup
+from app.services import volume_rollups
+
+
+async def run(user_id: str | None) -> None:
+    async with AsyncSessionLocal() as db:
+        await volume_rollups.rebuild(db, user_id)
+        query = select(func.count()).select_from(VolumeRollup)
+        if user_id:
+            query = query.where(VolumeRollup.user_id == user_id)
+        rows = await db.scalar(query)
+        await db.commit()
+
+    await async_engine.dispose()
+    print(f"Rebuilt {rows} rollup rows for {'user ' + user_id if user_id else 'all users'}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--user", help="Only rebuild this user ID")
+    args = parser.parse_args()
+    asyncio.run(run(args.user))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+The tests drive the app in-process through ASGI against the Postgres database
+named by DATABASE_URL, migrated to head (``uv run alembic upgrade head``).
+
+Each test registers its own users and deletes their rows afterwards.
+"""
+
+import os
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable
+
+import httpx
+import pytest
+from sqlalchemy import text
+
+# Before the app reads its settings: a route over its query budget fails the test
+os.environ["QUERY_BUDGET_ENFORCE"] = "true"
+
+from app.database import AsyncSessionLocal
+from app.main import app
+
+# Children before parents, so foreign keys never block the cleanup
+USER_TABLES = (
+    "workout_sets",
+    "volume_rollups",
+    "exercise_stats",
+    "workout_entries",
+    "workout_plans",
+    "exercises",
+)
+
+
+@pytest.fixture(scope="session")
+async def client() -> AsyncIterator[httpx.AsyncClient]:
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            yield client
+
+
+@pytest.fixture
+async def register(
+    client: httpx.AsyncClient,
+) -> AsyncIterator[Callable[[], Awaitable[dict[str, str]]]]:
+    """Register a fresh user and return its Authorization header."""
+    user_ids = []
+
+    async def register() -> dict[str, str]:
+        email = f"test-{uuid.uuid4().hex[:12]}@example.com"
+        response = await client.post(
+            "/api/v1/auth/register", json={"email": email, "password": "correct horse"}
+        )
+        assert response.status_code == 201, response.text
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+        user_ids.append((await client.get("/api/v1/auth/me", headers=headers)).json()["id"])
+        return headers
+
+    yield register
+
+    async with AsyncSessionLocal() as session:
+        for table in USER_TABLES:
+            await session.execute(
+                text(f"DELETE FROM {table} WHERE user_id = ANY(:ids)"), {"ids": user_ids}
+            )
+        await session.execute(text("DELETE FROM users WHERE id = ANY(:ids)"), {"ids": user_ids})
+        await session.commit()
+
+
+@pytest.fixture
+async def user(register) -> dict[str, str]:
+    return await register()
+
+
+async def create_exercise(client: httpx.AsyncClient, headers: dict[str, str]) -> str:
+    exercise_id = str(uuid.uuid4())
+    response = await client.post(
+        "/api/v1/exercises",
+        headers=headers,
+        json={"id": exercise_id, "name": "Squat", "muscle_group": "Legs", "equipment": "Barbell"},
+    )
+    assert response.status_code == 201, response.text
+    return exercise_id
+
+
+async def create_entry(
+    client: httpx.AsyncClient,
+    headers: dict[str, str],
+    exercise_id: str,
+    sets: list[dict],
+    date: str = "2024-06-03",
+) -> str:
+    entry_id = str(uuid.uuid4())
+    response = await client.post(
+        "/api/v1/entries",
+        headers=headers,
+        json={
+            "id": entry_id,
+            "date": date,
+            "exercise_id": exercise_id,
+            "workout_type": "Strength",
+            "sets": sets,
+        },
+    )
+    assert response.status_code == 201, response.text
+    return entry_id
+
+
+async def create_plan(
+    client: httpx.AsyncClient, headers: dict[str, str], date: str = "2024-06-03"
+) -> str:
+    plan_id = str(uuid.uuid4())
+    response = await client.post(
+        "/api/v1/plans",
+        headers=headers,
+        json={"id": plan_id, "date": date, "title": "Legs"},
+    )
+    assert response.status_code == 201, response.text
+    return plan_id
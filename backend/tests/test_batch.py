@@ -0,0 +1,53 @@
+import uuid
+
+
+def _exercise(op: str, exercise_id: str, name: str = "Squat") -> dict:
+    data = {"name": name, "muscle_group": "Legs", "equipment": "Barbell"}
+    return {"op": op, "resource": "exercises", "id": exercise_id, "data": data}
+
+
+async def _batch(client, headers, operations: list[dict]) -> list[int]:
+    response = await client.post("/api/v1/batch", headers=headers, json={"operations": operations})
+    assert response.status_code == 200, response.text
+    return [result["status"] for result in response.json()["results"]]
+
+
+async def test_delete_before_create_of_the_same_id_runs_in_queue_order(client, user):
+    exercise_id = str(uuid.uuid4())
+
+    statuses = await _batch(
+        client, user, [_exercise("delete", exercise_id), _exercise("create", exercise_id)]
+    )
+
+    assert statuses == [404, 201]
+    response = await client.get(f"/api/v1/exercises/{exercise_id}", headers=user)
+    assert response.json()["is_deleted"] is False
+
+
+async def test_update_before_create_does_not_apply(client, user):
+    exercise_id = str(uuid.uuid4())
+
+    statuses = await _batch(
+        client,
+        user,
+        [
+            {"op": "update", "resource": "exercises", "id": exercise_id, "data": {"name": "Row"}},
+            _exercise("create", exercise_id),
+        ],
+    )
+
+    assert statuses == [404, 201]
+    response = await client.get(f"/api/v1/exercises/{exercise_id}", headers=user)
+    assert response.json()["name"] == "Squat"
+
+
+async def test_data_error_fails_only_its_operation(client, user):
+    good, bad = str(uuid.uuid4()), str(uuid.uuid4())
+
+    statuses = await _batch(
+        client, user, [_exercise("create", bad, name="nul\x00byte"), _exercise("create", good)]
+    )
+
+    assert statuses == [422, 201]
+    assert (await client.get(f"/api/v1/exercises/{good}", headers=user)).status_code == 200
+    assert (await client.get(f"/api/v1/exercises/{bad}", headers=user)).status_code == 404
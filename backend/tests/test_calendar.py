@@ -0,0 +1,49 @@
+import pytest
+
+from app.services import calendar
+from tests.conftest import create_entry, create_exercise
+
+
+@pytest.mark.parametrize(
+    "params", [{"month": "0000-01"}, {"month": "9999-12"}, {"today": "9999-12-31"}]
+)
+async def test_months_without_a_following_month_are_rejected(client, user, params):
+    response = await client.get("/api/v1/calendar", headers=user, params=params)
+
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize("month", ["0001-01", "9999-11"])
+async def test_edge_months(client, user, month):
+    response = await client.get("/api/v1/calendar", headers=user, params={"month": month})
+
+    assert response.status_code == 200
+    assert response.json()["days"] == []
+
+
+async def test_volume_skips_out_of_range_sets(client, user):
+    exercise_id = await create_exercise(client, user)
+    sets = [{"weight": 100, "reps": 5}, {"weight": 1e308, "reps": 5}, {"weight": 100, "reps": 1e12}]
+    await create_entry(client, user, exercise_id, sets, date="2024-06-03")
+
+    response = await client.get("/api/v1/calendar", headers=user, params={"month": "2024-06"})
+
+    assert response.status_code == 200
+    assert response.json()["days"][0]["volume"] == 500
+
+
+async def test_cached_months_per_user_are_bounded(monkeypatch):
+    computed = []
+
+    async def month_days(db, user_id, start, end):
+        computed.append(start)
+        return []
+
+    monkeypatch.setattr(calendar, "month_days", month_days)
+    cache = calendar.CalendarCache(maxsize=1, months_per_user=2)
+
+    for month in ["2024-01", "2024-02", "2024-01", "2024-03", "2024-01", "2024-02"]:
+        await cache.month(None, "user", 1, month, month, month)
+
+    assert computed == ["2024-01", "2024-02", "2024-03", "2024-02"]
+    assert list(cache._users["user"].months) == ["2024-01", "2024-02"]
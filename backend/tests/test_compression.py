@@ -0,0 +1,125 @@
+import gzip
+
+import brotli
+import httpx
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.responses import StreamingResponse
+
+from app.api import compression
+from app.api.compression import CompressionMiddleware, negotiate
+from app.config import settings
+from app.services.compressed_cache import compressed_cache
+
+LARGE = b'{"rows": [' + b",".join(b'{"weight": 60, "reps": 8}' for _ in range(500)) + b"]}"
+OFFLOAD_SIZE = len(LARGE) * 2
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+
+    @app.get("/small")
+    async def small():
+        return Response(b'{"ok": true}', media_type="application/json")
+
+    @app.get("/large")
+    async def large():
+        return Response(LARGE, media_type="application/json")
+
+    @app.get("/huge")
+    async def huge():
+        return Response(LARGE * 3, media_type="application/json")
+
+    @app.get("/etag")
+    async def tagged():
+        return Response(LARGE, media_type="application/json", headers={"ETag": 'W/"v1"'})
+
+    @app.get("/stream")
+    async def stream():
+        async def rows():
+            yield LARGE
+            yield LARGE
+
+        return StreamingResponse(rows(), media_type="application/x-ndjson")
+
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MIN_SIZE,
+        offload_size=OFFLOAD_SIZE,
+    )
+    compressed_cache.clear()
+    transport = httpx.ASGITransport(app=app)
+    return httpx.AsyncClient(transport=transport, base_url="http://test")
+
+
+async def _get(client, path: str, accept_encoding: str = "gzip, br") -> httpx.Response:
+    # Read the raw bytes; httpx would otherwise decode them
+    async with client.stream("GET", path, headers={"Accept-Encoding": accept_encoding}) as response:
+        response.raw_body = b"".join([chunk async for chunk in response.aiter_raw()])
+    return response
+
+
+@pytest.mark.parametrize(
+    ("header", "encoding"),
+    [
+        ("gzip, deflate, br", "br"),
+        ("gzip;q=1.0, br;q=0.5", "gzip"),
+        ("br;q=0.8, gzip;q=0.8", "br"),
+        ("gzip", "gzip"),
+        ("*", "br"),
+        ("br;q=0, *;q=0.5", "gzip"),
+        ("identity", None),
+        ("gzip;q=0, br;q=0", None),
+        ("", None),
+    ],
+)
+def test_negotiate(header, encoding):
+    assert negotiate(header) == encoding
+
+
+@pytest.mark.parametrize(
+    ("header", "decompress"), [("br", brotli.decompress), ("gzip", gzip.decompress)]
+)
+async def test_large_body_is_compressed(client, header, decompress):
+    response = await _get(client, "/large", header)
+    assert response.headers["Content-Encoding"] == header
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert int(response.headers["Content-Length"]) == len(response.raw_body) < len(LARGE)
+    assert decompress(response.raw_body) == LARGE
+
+
+async def test_small_body_is_sent_as_is(client):
+    response = await _get(client, "/small")
+    assert "Content-Encoding" not in response.headers
+    assert response.raw_body == b'{"ok": true}'
+
+
+async def test_streaming_response_passes_through(client):
+    response = await _get(client, "/stream")
+    assert "Content-Encoding" not in response.headers
+    assert response.raw_body == LARGE * 2
+
+
+async def test_large_body_compresses_on_a_worker_thread(client, monkeypatch):
+    offloaded = []
+    to_thread = compression.asyncio.to_thread
+
+    async def spy(func, *args):
+        offloaded.append(len(args[0]))
+        return await to_thread(func, *args)
+
+    monkeypatch.setattr(compression.asyncio, "to_thread", spy)
+    await _get(client, "/large")
+    assert offloaded == []
+    response = await _get(client, "/huge")
+    assert offloaded == [len(LARGE) * 3]
+    assert brotli.decompress(response.raw_body) == LARGE * 3
+
+
+async def test_etag_cache_hit_returns_identical_bytes(client):
+    first = await _get(client, "/etag")
+    second = await _get(client, "/etag")
+    assert compressed_cache.stats()["hits"] == 1
+    assert second.raw_body == first.raw_body
+    assert second.headers["Content-Encoding"] == first.headers["Content-Encoding"] == "br"
@@ -0,0 +1,29 @@
+async def test_fresh_users_get_different_tags(client, register):
+    alice, bob = await register(), await register()
+
+    first = await client.get("/api/v1/exercises", headers=alice)
+    second = await client.get("/api/v1/exercises", headers=bob)
+
+    assert first.headers["x-data-version"] == second.headers["x-data-version"]
+    assert first.headers["etag"] != second.headers["etag"]
+    assert "Authorization" in first.headers["vary"]
+
+
+async def test_other_users_tag_does_not_match(client, register):
+    alice, bob = await register(), await register()
+    etag = (await client.get("/api/v1/entries", headers=alice)).headers["etag"]
+
+    response = await client.get("/api/v1/entries", headers={**bob, "If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+async def test_matching_tag_returns_304(client, user):
+    etag = (await client.get("/api/v1/plans", headers=user)).headers["etag"]
+
+    response = await client.get("/api/v1/plans", headers={**user, "If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert "Authorization" in response.headers["vary"]
@@ -0,0 +1,35 @@
+import pytest
+
+from tests.conftest import create_entry, create_exercise
+
+
+@pytest.mark.parametrize(
+    "bad_set",
+    [{"weight": 100, "reps": 1e12}, {"weight": 1e308, "reps": 5}, {"weight": 100, "reps": 10**12}],
+)
+async def test_out_of_range_values_count_as_missing(client, user, bad_set):
+    exercise_id = await create_exercise(client, user)
+    await create_entry(client, user, exercise_id, [{"weight": 100, "reps": 5}, bad_set])
+
+    response = await client.get(f"/api/v1/exercises/{exercise_id}/stats", headers=user)
+
+    assert response.status_code == 200
+    stats = response.json()
+    assert stats["total_sets"] == 2
+    assert stats["max_weight"] == 100
+    assert stats["max_reps"] == 5
+    assert stats["total_volume"] == 500
+
+
+async def test_stats_after_editing_an_out_of_range_entry(client, user):
+    exercise_id = await create_exercise(client, user)
+    entry_id = await create_entry(client, user, exercise_id, [{"weight": 1e308, "reps": 1e12}])
+
+    response = await client.put(
+        f"/api/v1/entries/{entry_id}", headers=user, json={"sets": [{"weight": 60, "reps": 10}]}
+    )
+    assert response.status_code == 200
+
+    stats = (await client.get(f"/api/v1/exercises/{exercise_id}/stats", headers=user)).json()
+    assert stats["max_weight"] == 60
+    assert stats["total_volume"] == 600
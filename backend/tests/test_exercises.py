@@ -0,0 +1,17 @@
+import uuid
+
+import pytest
+
+from app.models.exercise import MuscleGroup
+
+
+@pytest.mark.parametrize("muscle_group", [group.value for group in MuscleGroup])
+async def test_every_muscle_group_round_trips(client, user, muscle_group):
+    exercise_id = str(uuid.uuid4())
+    payload = {"id": exercise_id, "name": "Lift", "muscle_group": muscle_group, "equipment": "Bar"}
+
+    created = await client.post("/api/v1/exercises", headers=user, json=payload)
+    fetched = await client.get(f"/api/v1/exercises/{exercise_id}", headers=user)
+
+    assert created.status_code == 201, created.text
+    assert fetched.json()["muscle_group"] == muscle_group
@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import ClientDisconnect
+
+from app.api.deps import AuthenticatedUser
+from app.api.v1 import export
+from app.config import settings
+from app.database import AsyncSessionLocal
+
+
+async def _receive() -> dict:
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+def _scope() -> dict:
+    return {"type": "http", "asgi": {"version": "3.0", "spec_version": "2.4"}}
+
+
+async def _start(user_id: str, **params):
+    async with AsyncSessionLocal() as db:
+        return await export.export_history(
+            db=db, current_user=AuthenticatedUser(user_id, None), **{"gzip": False, **params}
+        )
+
+
+@pytest.fixture
+def max_two(monkeypatch):
+    monkeypatch.setattr(settings, "EXPORT_MAX_CONCURRENT", 2)
+    assert export._active_exports == 0
+    yield
+    assert export._active_exports == 0
+
+
+async def test_burst_is_limited_before_any_body_starts(max_two):
+    first = await _start("burst-1")
+    second = await _start("burst-2")
+
+    with pytest.raises(HTTPException) as rejected:
+        await _start("burst-3")
+    assert rejected.value.status_code == 503
+
+    for response in (first, second):
+        chunks = []
+
+        async def send(message, chunks=chunks):
+            chunks.append(message)
+
+        await response(_scope(), _receive, send)
+        assert chunks[-1] == {"type": "http.response.body", "body": b"", "more_body": False}
+
+
+@pytest.mark.parametrize("gzip", [False, True])
+async def test_slot_is_released_when_the_body_is_never_read(max_two, gzip):
+    response = await _start("gone-early", gzip=gzip)
+
+    async def send(message):
+        raise OSError("client went away")
+
+    with pytest.raises(ClientDisconnect):
+        await response(_scope(), _receive, send)
+    assert export._active_exports == 0
+
+
+async def test_slot_is_released_when_the_client_leaves_mid_stream(max_two):
+    response = await _start("gone-midway", gzip=True)
+    sent = []
+
+    async def send(message):
+        if message["type"] == "http.response.body" and sent:
+            raise OSError("client went away")
+        sent.append(message)
+
+    with pytest.raises(ClientDisconnect):
+        await response(_scope(), _receive, send)
+    assert export._active_exports == 0
+
+
+async def test_concurrent_requests_never_exceed_the_limit(client, register, max_two, monkeypatch):
+    users = [await register() for _ in range(6)]
+    peak = 0
+    reserve = export._ExportSlot.__init__
+
+    def track(slot):
+        nonlocal peak
+        reserve(slot)
+        peak = max(peak, export._active_exports)
+
+    monkeypatch.setattr(export._ExportSlot, "__init__", track)
+    responses = await asyncio.gather(
+        *(client.get("/api/v1/export", headers=headers) for headers in users)
+    )
+
+    assert peak <= 2
+    assert {response.status_code for response in responses} <= {200, 503}
+    assert any(response.status_code == 200 for response in responses)
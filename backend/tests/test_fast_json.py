@@ -0,0 +1,53 @@
+import json
+import uuid
+
+import pytest
+
+from app.api import fast_json
+from app.config import settings
+
+EDGE_FLOATS = [
+    0.1,
+    -0.0,
+    1e16,
+    1e-7,
+    123456789.123,
+    2.0**53 + 2,
+    5e-324,
+    1.7976931348623157e308,
+]
+
+
+@pytest.mark.parametrize("value", EDGE_FLOATS)
+def test_orjson_and_fallback_parse_equal(monkeypatch, value):
+    content = [{"weight": value, "nested": {"values": [value, -value]}}]
+    fast = fast_json.dumps(content)
+    monkeypatch.setattr(fast_json, "orjson", None)
+
+    assert json.loads(fast) == json.loads(fast_json.dumps(content))
+
+
+async def test_list_endpoint_parity_over_edge_floats(client, user, monkeypatch):
+    for value in EDGE_FLOATS:
+        response = await client.post(
+            "/api/v1/exercises",
+            headers=user,
+            json={
+                "id": str(uuid.uuid4()),
+                "name": f"Lift {value!r}",
+                "muscle_group": "Full Body",
+                "equipment": "Barbell",
+                "personal_best": value,
+            },
+        )
+        assert response.status_code == 201, response.text
+
+    monkeypatch.setattr(settings, "FAST_LIST_RESPONSES", False)
+    standard = await client.get("/api/v1/exercises", headers=user)
+    monkeypatch.setattr(settings, "FAST_LIST_RESPONSES", True)
+    fast = await client.get("/api/v1/exercises", headers=user)
+
+    assert fast.status_code == standard.status_code == 200
+    assert [list(row) for row in fast.json()] == [list(row) for row in standard.json()]
+    assert fast.json() == standard.json()
+    assert {row["personal_best"] for row in fast.json()} == set(EDGE_FLOATS)
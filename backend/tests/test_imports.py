@@ -0,0 +1,100 @@
+import csv
+import io
+import json
+import uuid
+
+import pytest
+
+from app.config import settings
+from app.database import async_engine
+from tests.conftest import create_entry, create_exercise
+
+NDJSON = {"Content-Type": "application/x-ndjson"}
+CSV = {"Content-Type": "text/csv"}
+
+
+def _exercise(muscle_group: str = "Legs") -> dict[str, str]:
+    return {
+        "id": str(uuid.uuid4()),
+        "name": "Squat",
+        "muscle_group": muscle_group,
+        "equipment": "Bar",
+    }
+
+
+def _exercise_line() -> bytes:
+    return json.dumps({"type": "exercise", "data": _exercise()}).encode() + b"\n"
+
+
+def _body(content_type: dict[str, str], rows: list[dict[str, str]]) -> bytes:
+    if content_type is NDJSON:
+        return b"".join(
+            json.dumps({"type": "exercise", "data": row}).encode() + b"\n" for row in rows
+        )
+    out = io.StringIO()
+    writer = csv.DictWriter(out, ["type", *rows[0]])
+    writer.writeheader()
+    writer.writerows({"type": "exercise", **row} for row in rows)
+    return out.getvalue().encode()
+
+
+async def test_upload_is_received_before_a_connection_is_taken(client, user):
+    await client.get("/api/v1/auth/me", headers=user)
+    checked_out = []
+
+    async def slow_upload():
+        for _ in range(5):
+            yield _exercise_line()
+            checked_out.append(async_engine.pool.checkedout())
+
+    response = await client.post(
+        "/api/v1/import", headers={**user, **NDJSON}, content=slow_upload()
+    )
+
+    assert response.status_code == 200, response.text
+    assert response.json()["created"]["exercise"] == 5
+    assert checked_out == [0] * 5
+
+
+async def test_body_size_is_limited(client, user, monkeypatch):
+    monkeypatch.setattr(settings, "IMPORT_MAX_BYTES", 100)
+
+    response = await client.post(
+        "/api/v1/import", headers={**user, **NDJSON}, content=_exercise_line() * 2
+    )
+
+    assert response.status_code == 413
+
+
+async def test_export_does_not_reimport_next_to_its_source(client, register):
+    source, target = await register(), await register()
+    exercise_id = await create_exercise(client, source)
+    await create_entry(client, source, exercise_id, [{"weight": 50, "reps": 5}])
+    export = (await client.get("/api/v1/export", headers=source)).content
+
+    response = await client.post("/api/v1/import", headers={**target, **NDJSON}, content=export)
+
+    body = response.json()
+    assert body["created"] == {"exercise": 0, "plan": 0, "entry": 0}
+    assert {error["status"] for error in body["errors"]} <= {404, 409}
+    assert body["error_count"] == 2
+
+
+@pytest.mark.parametrize("content_type", [NDJSON, CSV], ids=["ndjson", "csv"])
+async def test_invalid_row_rolls_back_the_whole_import(client, user, monkeypatch, content_type):
+    monkeypatch.setattr(settings, "IMPORT_CHUNK_ROWS", 500)
+    rows = [_exercise() for _ in range(5000)]
+    rows[4320] = _exercise(muscle_group="Wings")  # Line 4321, after eight staged chunks
+
+    response = await client.post(
+        "/api/v1/import", headers={**user, **content_type}, content=_body(content_type, rows)
+    )
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["created"] == {"exercise": 0, "plan": 0, "entry": 0}
+    assert body["error_count"] == 1
+    assert [(e["line"], e["status"], e["id"]) for e in body["errors"]] == [
+        (4321, 422, rows[4320]["id"])
+    ]
+    assert (await client.get("/api/v1/exercises", headers=user)).json() == []
@@ -0,0 +1,70 @@
+import uuid
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+
+from app.database import AsyncSessionLocal
+from app.models import User
+from app.services.last_login import LastLoginWriter
+
+
+async def _last_login(user_id: str) -> datetime | None:
+    async with AsyncSessionLocal() as session:
+        return await session.scalar(select(User.last_login_at).where(User.id == user_id))
+
+
+async def test_touch_then_flush(client, user):
+    user_id = (await client.get("/api/v1/auth/me", headers=user)).json()["id"]
+    writer = LastLoginWriter(interval=30)
+    writer.touch(user_id)
+    touched_at = writer._pending[user_id]
+
+    assert await writer.flush() == 1
+    assert await _last_login(user_id) == touched_at
+    assert await writer.flush() == 0
+
+
+async def test_flush_stays_under_the_bind_limit():
+    # Three parameters per user: the IN list and the CASE's WHEN and THEN
+    writer = LastLoginWriter(interval=30)
+    for _ in range(12_000):
+        writer.touch(str(uuid.uuid4()))
+    assert await writer.flush() == 12_000
+
+
+class FailingWriter(LastLoginWriter):
+    """Fails every write from the ``fail_from``-th on, recording the chunks."""
+
+    def __init__(self, fail_from: int, **options) -> None:
+        super().__init__(interval=30, **options)
+        self.fail_from = fail_from
+        self.written: list[list[str]] = []
+
+    async def _write(self, pending):
+        if len(self.written) >= self.fail_from:
+            raise ConnectionError("database unavailable")
+        self.written.append(list(pending))
+
+
+async def test_failed_chunk_is_requeued_then_dropped():
+    writer = FailingWriter(fail_from=1, chunk_size=2, max_attempts=2)
+    for user_id in "abcde":
+        writer.touch(user_id)
+    first_seen = dict(writer._pending)
+
+    with pytest.raises(ConnectionError):
+        await writer.flush()
+    assert writer.written == [["a", "b"]]
+    assert writer._pending == {user_id: first_seen[user_id] for user_id in "cde"}
+
+    writer.touch("c")
+    writer.fail_from = 1
+    with pytest.raises(ConnectionError):
+        await writer.flush()
+    assert writer._pending == {}
+
+    writer.touch("c")
+    writer.fail_from = 2
+    assert await writer.flush() == 1
+    assert writer.written == [["a", "b"], ["c"]]
@@ -0,0 +1,46 @@
+import pytest
+
+from app.config import settings
+from app.database import async_engine
+from app.services.warmup import warmup
+
+
+class SaturatedPool:
+    """Stands in for the primary pool with more checkouts queued than allowed."""
+
+    def __init__(self, pool) -> None:
+        self.pool = pool
+        self.waiting = settings.DB_SHED_WAITERS + 1
+
+    def __getattr__(self, name: str):
+        return getattr(self.pool, name)
+
+    def stats(self) -> dict:
+        return {**self.pool.stats(), "waiting": self.waiting}
+
+
+@pytest.fixture
+def saturated(monkeypatch):
+    monkeypatch.setattr(async_engine.sync_engine, "pool", SaturatedPool(async_engine.pool))
+
+
+@pytest.mark.parametrize("path", ["/api/v1/exercises", "/api/v1/auth/login", "/api/v1/sync"])
+async def test_api_requests_are_shed(client, user, saturated, path):
+    response = await client.get(path, headers=user)
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == str(settings.DB_SHED_RETRY_AFTER_SECONDS)
+
+
+@pytest.mark.parametrize("path", ["/health", "/ready", "/metrics"])
+async def test_operational_routes_are_not_shed(client, saturated, path):
+    await warmup.wait()  # /ready is 503 until then, for its own reason
+    response = await client.get(path)
+    assert response.status_code == 200
+
+
+async def test_requests_pass_below_the_threshold(client, user, monkeypatch):
+    pool = SaturatedPool(async_engine.pool)
+    pool.waiting = settings.DB_SHED_WAITERS
+    monkeypatch.setattr(async_engine.sync_engine, "pool", pool)
+    response = await client.get("/api/v1/exercises", headers=user)
+    assert response.status_code == 200
@@ -0,0 +1,58 @@
+import re
+
+from app.config import settings
+from tests.conftest import create_exercise
+
+ROUTE = "/api/v1/exercises/{exercise_id}"
+_SAMPLE = re.compile(r"^(\w+)(\{.*\})? (\S+)$")
+
+
+async def _scrape(client) -> dict[str, float]:
+    response = await client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    samples = {}
+    for line in response.text.splitlines():
+        if line.startswith("#"):
+            continue
+        match = _SAMPLE.match(line)
+        assert match, line
+        name, labels, value = match.groups()
+        samples[name + (labels or "")] = float(value)
+    return samples
+
+
+async def test_request_is_counted_under_its_route_template(client, user):
+    exercise_id = await create_exercise(client, user)
+    labels = f'method="GET",route="{ROUTE}"'
+    before = await _scrape(client)
+
+    for _ in range(2):
+        assert (
+            await client.get(f"/api/v1/exercises/{exercise_id}", headers=user)
+        ).status_code == 200
+    after = await _scrape(client)
+
+    def delta(sample: str) -> float:
+        return after.get(sample, 0) - before.get(sample, 0)
+
+    assert delta(f'http_requests_total{{{labels},status="200"}}') == 2
+    assert delta(f"http_request_duration_seconds_count{{{labels}}}") == 2
+    assert delta(f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}}') == 2
+    assert delta(f"db_queries_per_request_count{{{labels}}}") == 2
+    assert delta(f"db_queries_per_request_sum{{{labels}}}") >= 2
+    assert not any(exercise_id in sample for sample in after)
+
+
+async def test_pool_gauges_are_exposed(client):
+    samples = await _scrape(client)
+    for gauge in ("db_pool_size", "db_pool_checked_out", "db_pool_waiting"):
+        assert f'{gauge}{{engine="primary"}}' in samples
+    assert samples['db_pool_checkouts_total{engine="primary"}'] > 0
+
+
+async def test_disabled_metrics_are_not_served(client, monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_ENABLED", False)
+    response = await client.get("/metrics")
+    assert response.status_code == 404
+    assert "/metrics" not in (await client.get("/openapi.json")).json()["paths"]
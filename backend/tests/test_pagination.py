@@ -0,0 +1,81 @@
+import pytest
+
+from app.api.cursors import encode_cursor
+from app.api.pagination import NEXT_CURSOR_HEADER
+from tests.conftest import create_entry, create_exercise, create_plan
+
+DATES = ["2024-06-01", "2024-06-03", "2024-06-03", "2024-06-03", "2024-06-05", "2024-06-05"]
+
+
+@pytest.fixture
+async def rows(client, user) -> dict[str, list[tuple[str, str]]]:
+    """(date, id) of each entry and plan created, by list path."""
+    exercise_id = await create_exercise(client, user)
+    return {
+        "/api/v1/entries": [
+            (date, await create_entry(client, user, exercise_id, [], date)) for date in DATES
+        ],
+        "/api/v1/plans": [(date, await create_plan(client, user, date)) for date in DATES],
+    }
+
+
+@pytest.mark.parametrize("path", ["/api/v1/entries", "/api/v1/plans"])
+@pytest.mark.parametrize("limit", [1, 2, 4])
+async def test_pages_yield_each_row_once(client, user, rows, path, limit):
+    seen, params = [], {"limit": limit}
+    while True:
+        response = await client.get(path, headers=user, params=params)
+        assert response.status_code == 200, response.text
+        page = response.json()
+        assert len(page) <= limit
+        seen.extend((row["date"], row["id"]) for row in page)
+        if NEXT_CURSOR_HEADER not in response.headers:
+            break
+        params = {"limit": limit, "cursor": response.headers[NEXT_CURSOR_HEADER]}
+
+    assert seen == sorted(rows[path], reverse=True)
+
+
+@pytest.mark.parametrize("path", ["/api/v1/entries", "/api/v1/plans"])
+async def test_date_bounds_are_inclusive(client, user, rows, path):
+    response = await client.get(
+        path, headers=user, params={"from": "2024-06-03", "to": "2024-06-04", "limit": 2}
+    )
+    first = response.json()
+    response = await client.get(
+        path,
+        headers=user,
+        params={
+            "from": "2024-06-03",
+            "to": "2024-06-04",
+            "limit": 2,
+            "cursor": response.headers[NEXT_CURSOR_HEADER],
+        },
+    )
+    assert NEXT_CURSOR_HEADER not in response.headers
+    dates = [row["date"] for row in first + response.json()]
+    assert dates == ["2024-06-03"] * 3
+
+
+@pytest.mark.parametrize("path", ["/api/v1/entries", "/api/v1/plans"])
+async def test_no_limit_returns_everything_without_cursor(client, user, rows, path):
+    response = await client.get(path, headers=user)
+    assert response.status_code == 200
+    assert len(response.json()) == len(DATES)
+    assert NEXT_CURSOR_HEADER not in response.headers
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not a cursor",
+        encode_cursor("2024-06-03"),  # A sync cursor
+        encode_cursor("June 3rd", "some-id"),
+        encode_cursor("2024-06-03", "some-id", "extra"),
+    ],
+)
+async def test_bad_cursor_is_rejected(client, user, cursor):
+    response = await client.get(
+        "/api/v1/entries", headers=user, params={"limit": 2, "cursor": cursor}
+    )
+    assert response.status_code == 400
@@ -0,0 +1,81 @@
+import asyncio
+import threading
+import uuid
+
+import pytest
+from sqlalchemy import text
+
+from app.api.v1 import auth as auth_api
+from app.database import AsyncSessionLocal
+from app.services import password_hasher as hasher_module
+from app.services.password_hasher import PasswordHasher
+
+
+@pytest.fixture
+def hasher(monkeypatch):
+    """One worker and one queue slot, with hashing held while ``gate`` is clear."""
+    hasher = PasswordHasher(max_workers=1, max_queue=1, retry_after=3)
+    hasher.gate = threading.Event()
+    hasher.gate.set()
+    hash_password = hasher_module.hash_password
+
+    def gated_hash(password: str) -> str:
+        hasher.gate.wait()
+        return hash_password(password)
+
+    monkeypatch.setattr(hasher_module, "hash_password", gated_hash)
+    monkeypatch.setattr(auth_api, "password_hasher", hasher)
+    yield hasher
+    hasher.gate.set()
+    hasher.shutdown()
+
+
+@pytest.fixture
+async def emails():
+    emails = []
+    yield emails
+    async with AsyncSessionLocal() as session:
+        await session.execute(
+            text("DELETE FROM users WHERE email = ANY(:emails)"), {"emails": emails}
+        )
+        await session.commit()
+
+
+def _credentials(emails: list[str]) -> dict[str, str]:
+    emails.append(f"test-{uuid.uuid4().hex[:12]}@example.com")
+    return {"email": emails[-1], "password": "correct horse"}
+
+
+async def test_full_queue_returns_503(client, hasher, emails):
+    existing = _credentials(emails)
+    assert (await client.post("/api/v1/auth/register", json=existing)).status_code == 201
+
+    hasher.gate.clear()
+    blocked = [
+        asyncio.create_task(client.post("/api/v1/auth/register", json=_credentials(emails)))
+        for _ in range(hasher.max_workers + hasher.max_queue)
+    ]
+    while hasher.pending < len(blocked):
+        await asyncio.sleep(0.01)
+
+    for path, body in (("register", _credentials(emails)), ("login", existing)):
+        response = await client.post(f"/api/v1/auth/{path}", json=body)
+        assert response.status_code == 503, path
+        assert response.headers["Retry-After"] == "3"
+    assert hasher.rejected == 2
+
+    hasher.gate.set()
+    assert [response.status_code for response in await asyncio.gather(*blocked)] == [201, 201]
+    assert hasher.pending == 0
+
+
+async def test_failed_hash_releases_its_slot(hasher, monkeypatch):
+    def broken_hash(password: str) -> str:
+        raise ValueError("bcrypt failed")
+
+    monkeypatch.setattr(hasher_module, "hash_password", broken_hash)
+    for _ in range(hasher.max_workers + hasher.max_queue + 1):
+        with pytest.raises(ValueError):
+            await hasher.hash("correct horse")
+    assert hasher.pending == 0
+    assert hasher.rejected == 0
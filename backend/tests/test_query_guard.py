@@ -0,0 +1,57 @@
+import logging
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import text
+
+from app.api.instrumentation import InstrumentationMiddleware
+from app.api.query_guard import QueryBudgetExceeded, query_budget
+from app.config import settings
+from app.database import AsyncSessionLocal
+
+
+async def _select(times: int) -> None:
+    async with AsyncSessionLocal() as session:
+        for _ in range(times):
+            await session.execute(text("SELECT 1"))
+
+
+def _client() -> httpx.AsyncClient:
+    app = FastAPI()
+
+    @app.get("/over-budget")
+    @query_budget(1)
+    async def over_budget():
+        await _select(5)
+
+    @app.get("/repeated")
+    @query_budget(20)
+    async def repeated():
+        await _select(settings.N_PLUS_ONE_THRESHOLD)
+
+    app.add_middleware(InstrumentationMiddleware)
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+def test_enforced_in_tests():
+    assert settings.QUERY_BUDGET_ENFORCE
+
+
+async def test_overrun_raises():
+    async with _client() as guarded:
+        with pytest.raises(QueryBudgetExceeded, match="GET /over-budget ran"):
+            await guarded.get("/over-budget")
+
+
+async def test_repeated_statement_logged(caplog):
+    caplog.set_level(logging.WARNING, logger="app.api.query_guard")
+    async with _client() as guarded:
+        response = await guarded.get("/repeated")
+
+    assert response.status_code == 200
+    assert any(
+        f"Possible N+1 on GET /repeated: ran {settings.N_PLUS_ONE_THRESHOLD} times: SELECT 1"
+        in record.getMessage()
+        for record in caplog.records
+    )
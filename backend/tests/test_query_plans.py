@@ -0,0 +1,82 @@
+"""
+Plan-regression check for the list endpoints.
+
+EXPLAINs the statements the list endpoints issue and fails if any of them
+falls back to a sequential scan or an explicit sort instead of walking a list
+index. A test user's handful of rows makes a bitmap scan plus an in-memory
+sort the cheapest plan, so seq scans and sorts are disabled for the
+transaction. Postgres still uses them when no index can serve the query, and
+that is the regression this catches.
+"""
+
+import json
+from datetime import date
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+
+from app.api.cursors import encode_cursor
+from app.api.pagination import DatePage
+from app.api.v1 import exercises
+from app.database import async_engine
+from app.models import WorkoutEntry, WorkoutPlan
+from tests.conftest import create_entry, create_exercise, create_plan
+
+
+def list_queries(user_id: str) -> dict[str, object]:
+    """The statements issued by the list endpoints for their common parameter shapes."""
+    queries = {"GET /exercises": exercises.list_query(user_id)}
+    pages = {
+        "": DatePage(date_from=None, date_to=None, limit=None, cursor=None),
+        "?limit=50": DatePage(date_from=None, date_to=None, limit=50, cursor=None),
+        "?limit=50&cursor": DatePage(
+            date_from=None,
+            date_to=None,
+            limit=50,
+            cursor=encode_cursor("2024-06-03", "00000000-0000-0000-0000-000000000000"),
+        ),
+        "?from&to": DatePage(
+            date_from=date(2024, 6, 1), date_to=date(2024, 6, 30), limit=None, cursor=None
+        ),
+    }
+    for path, model in (("/plans", WorkoutPlan), ("/entries", WorkoutEntry)):
+        for suffix, page in pages.items():
+            queries[f"GET {path}{suffix}"] = page.apply(model.owned_by(user_id), model)
+    return queries
+
+
+def plan_problems(plan: dict) -> list[str]:
+    """Return the offending node descriptions in an EXPLAIN (FORMAT JSON) plan."""
+    problems = []
+    node_type = plan["Node Type"]
+    if node_type == "Seq Scan":
+        problems.append(f"Seq Scan on {plan.get('Relation Name')}")
+    elif node_type in ("Sort", "Incremental Sort"):
+        problems.append(f"{node_type} on {', '.join(plan.get('Sort Key', []))}")
+    for child in plan.get("Plans", []):
+        problems.extend(plan_problems(child))
+    return problems
+
+
+@pytest.fixture
+async def user_id(client, user) -> str:
+    exercise_id = await create_exercise(client, user)
+    for day in ("2024-06-03", "2024-06-03", "2024-06-10"):
+        await create_entry(client, user, exercise_id, [{"id": "s1", "weight": 60, "reps": 8}], day)
+        await create_plan(client, user, day)
+    return (await client.get("/api/v1/auth/me", headers=user)).json()["id"]
+
+
+@pytest.mark.parametrize("name", list(list_queries("user")))
+async def test_list_query_walks_an_index(user_id, name):
+    query = list_queries(user_id)[name]
+    sql = query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    async with async_engine.connect() as conn:
+        async with conn.begin():
+            await conn.execute(text("SET LOCAL enable_seqscan = off"))
+            await conn.execute(text("SET LOCAL enable_sort = off"))
+            raw = await conn.scalar(text(f"EXPLAIN (FORMAT JSON) {sql}"))
+
+    plan = (json.loads(raw) if isinstance(raw, str) else raw)[0]["Plan"]
+    assert plan_problems(plan) == []
@@ -0,0 +1,126 @@
+import os
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.api import deps
+from app.config import settings
+from app.database import async_engine, get_async_database_url
+from app.services.read_replica import ReplicaRouter
+
+
+class _LagEngine:
+    """Stands in for the replica engine, answering the lag query with ``lag``."""
+
+    def __init__(self, lag: float | None) -> None:
+        self.lag = lag
+
+    @asynccontextmanager
+    async def connect(self):
+        engine = self
+
+        class Connection:
+            async def scalar(self, statement):
+                return engine.lag
+
+        yield Connection()
+
+
+def _router(engine=None) -> ReplicaRouter:
+    router = ReplicaRouter(
+        engine or _LagEngine(0.0),
+        pin_seconds=settings.READ_YOUR_WRITES_SECONDS,
+        max_lag=settings.REPLICA_MAX_LAG_SECONDS,
+        interval=settings.REPLICA_CHECK_SECONDS,
+    )
+    router.healthy = True
+    return router
+
+
+@asynccontextmanager
+async def _read_session(monkeypatch, router, sessions=None) -> AsyncIterator[AsyncSession]:
+    """The session get_read_db hands a handler, routed by ``router``."""
+    monkeypatch.setattr(deps, "replica_router", router)
+    if sessions is not None:
+        monkeypatch.setattr(deps, "ReadSessionLocal", sessions)
+    dependency = deps.get_read_db({"id": "reader"})
+    try:
+        yield await anext(dependency)
+    finally:
+        await dependency.aclose()
+
+
+def test_write_pins_reads_to_primary(monkeypatch):
+    router = _router()
+    router.note_write("writer")
+    assert not router.use_replica("writer")
+    assert router.use_replica("someone-else")
+
+    later = time.monotonic() + settings.READ_YOUR_WRITES_SECONDS + 0.1
+    monkeypatch.setattr(time, "monotonic", lambda: later)
+    assert router.use_replica("writer")
+
+
+def test_mark_down_reads_primary():
+    router = _router()
+    router.mark_down()
+    assert not router.use_replica("reader")
+
+
+async def test_unreachable_replica_falls_back_to_primary(monkeypatch):
+    unreachable = create_async_engine(
+        get_async_database_url("postgresql://postgres@127.0.0.1:1/titan"),
+        connect_args={"timeout": 1},
+    )
+    router = _router()
+    sessions = async_sessionmaker(unreachable, class_=AsyncSession)
+    async with _read_session(monkeypatch, router, sessions) as session:
+        assert session.bind is async_engine
+    assert not router.healthy
+    await unreachable.dispose()
+
+
+@pytest.mark.parametrize(
+    ("lag", "healthy"),
+    [
+        (0.0, True),
+        (settings.REPLICA_MAX_LAG_SECONDS, True),
+        (settings.REPLICA_MAX_LAG_SECONDS + 0.5, False),
+        (None, False),  # No WAL receiver streaming
+    ],
+)
+async def test_lag_check(lag, healthy):
+    router = _router(_LagEngine(lag))
+    await router.check()
+    assert router.healthy is healthy
+    assert router.use_replica("reader") is healthy
+
+
+async def test_no_replica_configured_reads_primary(monkeypatch):
+    router = ReplicaRouter(None, pin_seconds=5, max_lag=5, interval=2)
+    assert not router.use_replica("reader")
+    async with _read_session(monkeypatch, router) as session:
+        assert session.bind is async_engine
+
+
+@pytest.mark.skipif(
+    not os.environ.get("TEST_DATABASE_READ_URL"),
+    reason="TEST_DATABASE_READ_URL names no streaming replica of DATABASE_URL",
+)
+async def test_real_replica(monkeypatch):
+    replica = create_async_engine(get_async_database_url(os.environ["TEST_DATABASE_READ_URL"]))
+    try:
+        router = _router(replica)
+        router.healthy = False
+        await router.check()
+        assert router.healthy, f"replica lag {router.lag}"
+
+        sessions = async_sessionmaker(replica, class_=AsyncSession)
+        async with _read_session(monkeypatch, router, sessions) as session:
+            assert await session.scalar(text("SELECT pg_is_in_recovery()"))
+    finally:
+        await replica.dispose()
@@ -0,0 +1,87 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import text
+
+from app.api.cursors import decode_cursor, encode_cursor
+from app.api.v1.sync import CURSOR_OVERLAP
+from app.database import AsyncSessionLocal
+from tests.conftest import create_entry, create_exercise
+
+
+async def _sync(client, headers, since: str | None = None) -> dict:
+    response = await client.get(
+        "/api/v1/sync", headers=headers, params={"since": since} if since else None
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def _ids(rows: list[dict]) -> set[str]:
+    return {row["id"] for row in rows}
+
+
+async def test_tombstones_follow_the_snapshot(client, user):
+    exercise_id = await create_exercise(client, user)
+    kept = await create_entry(client, user, exercise_id, [])
+    deleted = await create_entry(client, user, exercise_id, [])
+    snapshot = await _sync(client, user)
+    assert _ids(snapshot["entries"]) == {kept, deleted}
+
+    response = await client.delete(f"/api/v1/entries/{deleted}", headers=user)
+    assert response.status_code == 204
+
+    changes = await _sync(client, user, snapshot["cursor"])
+    tombstones = [row for row in changes["entries"] if row["id"] == deleted]
+    assert tombstones and tombstones[0]["is_deleted"]
+    assert deleted not in _ids((await _sync(client, user))["entries"])
+
+
+async def test_cursor_round_trips(client, user):
+    first = await create_exercise(client, user)
+    snapshot = await _sync(client, user)
+    (value,) = decode_cursor(snapshot["cursor"], 1)
+    assert datetime.fromisoformat(value) == max(
+        datetime.fromisoformat(row["updated_at"]) for row in snapshot["exercises"]
+    )
+
+    second = await create_exercise(client, user)
+    changes = await _sync(client, user, snapshot["cursor"])
+    assert second in _ids(changes["exercises"])
+    # Rows inside the overlap window come back too; clients upsert by ID
+    assert _ids(changes["exercises"]) <= {first, second}
+
+    later = await _sync(client, user, changes["cursor"])
+    assert second in _ids(later["exercises"])
+    assert decode_cursor(later["cursor"], 1) == decode_cursor(changes["cursor"], 1)
+
+
+async def test_rows_stamped_at_the_cursor_are_not_dropped(client, user):
+    exercise_ids = [await create_exercise(client, user) for _ in range(3)]
+    stamped = datetime(2024, 6, 3, 12, 0, 0)
+    stamps = [stamped, stamped, stamped - CURSOR_OVERLAP * 2]
+    async with AsyncSessionLocal() as session:
+        for exercise_id, updated_at in zip(exercise_ids, stamps, strict=True):
+            await session.execute(
+                text("UPDATE exercises SET updated_at = :at WHERE id = :id"),
+                {"at": updated_at, "id": exercise_id},
+            )
+        await session.commit()
+
+    changes = await _sync(client, user, encode_cursor(stamped.isoformat()))
+    assert _ids(changes["exercises"]) == set(exercise_ids[:2])
+
+
+@pytest.mark.parametrize(
+    "since",
+    [
+        "not a cursor",
+        encode_cursor("yesterday"),
+        encode_cursor("2024-06-03", "some-id"),  # A list page cursor
+        encode_cursor("2024-06-03T12:00:00+02:00"),
+        encode_cursor("0001-01-01T00:00:00"),
+    ],
+)
+async def test_bad_cursor_is_rejected(client, user, since):
+    response = await client.get("/api/v1/sync", headers=user, params={"since": since})
+    assert response.status_code == 400
@@ -0,0 +1,110 @@
+import time
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from jose import jwt
+
+from app.auth import create_access_token, verify_token
+from app.config import settings
+from app.services.token_cache import TokenCache, token_cache
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(token_cache, "maxsize", settings.JWT_CACHE_SIZE or 1024)
+    token_cache.clear()
+    yield
+    token_cache.clear()
+
+
+def _token(expires_in: float, secret: str = settings.JWT_SECRET) -> str:
+    payload = {"sub": "user-1", "email": "a@example.com", "exp": int(time.time() + expires_in)}
+    return jwt.encode(payload, secret, algorithm=settings.JWT_ALGORITHM)
+
+
+async def _verify(token: str) -> dict:
+    return await verify_token(HTTPAuthorizationCredentials(scheme="Bearer", credentials=token))
+
+
+async def test_repeat_verification_is_served_from_cache():
+    token = create_access_token("user-1", "a@example.com")
+    assert await _verify(token) == {"id": "user-1", "email": "a@example.com"}
+    assert await _verify(token) == {"id": "user-1", "email": "a@example.com"}
+    assert token_cache.stats()["hits"] == 1
+
+
+def test_entry_expires_at_exp(monkeypatch):
+    cache = TokenCache(4)
+    now = time.time()
+    cache.put("token", {"id": "user-1"}, now + 60)
+    assert cache.get("token") == {"id": "user-1"}
+
+    monkeypatch.setattr(time, "time", lambda: now + 60)
+    assert cache.get("token") is None
+    assert cache.stats()["size"] == 0
+
+
+async def test_expired_token_is_not_served_from_cache():
+    token = _token(1)
+    await _verify(token)
+    assert token_cache.stats()["size"] == 1
+
+    # python-jose compares whole seconds, so it may still accept the token for
+    # the rest of its exp second; the cache must not serve it from exp on
+    time.sleep(max(0.0, jwt.get_unverified_claims(token)["exp"] - time.time()) + 0.05)
+    try:
+        await _verify(token)
+    except HTTPException as error:
+        assert error.status_code == 401
+    assert token_cache.stats()["hits"] == 0
+    assert token_cache.stats()["size"] == 0
+
+    with pytest.raises(HTTPException) as error:
+        await _verify(_token(-10))
+    assert error.value.status_code == 401
+    assert token_cache.stats()["size"] == 0
+
+
+async def test_tampered_token_is_rejected():
+    token = create_access_token("user-1", "a@example.com")
+    await _verify(token)
+
+    header, claims, signature = token.split(".")
+    forged = _token(3600, secret="not-the-secret")
+    for tampered in (
+        f"{header}.{forged.split('.')[1]}.{signature}",  # Other claims, cached signature
+        f"{header}.{claims}.{signature[::-1]}",
+        forged,
+    ):
+        with pytest.raises(HTTPException) as error:
+            await _verify(tampered)
+        assert error.value.status_code == 401
+    assert token_cache.stats()["hits"] == 0
+    assert token_cache.stats()["size"] == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TokenCache(2)
+    expires_at = time.time() + 60
+    cache.put("a", {"id": "a"}, expires_at)
+    cache.put("b", {"id": "b"}, expires_at)
+    cache.get("a")
+    cache.put("c", {"id": "c"}, expires_at)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"id": "a"}
+    assert cache.get("c") == {"id": "c"}
+
+
+async def test_size_zero_disables_cache(monkeypatch):
+    monkeypatch.setattr(token_cache, "maxsize", 0)
+    token = create_access_token("user-1", "a@example.com")
+    await _verify(token)
+    await _verify(token)
+    assert token_cache.stats()["size"] == 0
+    assert token_cache.stats()["hits"] == 0
+
+    cache = TokenCache(0)
+    cache.put("token", {"id": "user-1"}, time.time() + 60)
+    assert cache.get("token") is None
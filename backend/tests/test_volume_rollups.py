@@ -0,0 +1,35 @@
+from datetime import date
+
+from sqlalchemy import text
+
+from app.database import AsyncSessionLocal
+from app.services import volume_rollups
+from app.services.volume_rollups import EntryChange
+from tests.conftest import create_exercise
+
+
+async def test_out_of_range_values_count_as_missing(client, user):
+    exercise_id = await create_exercise(client, user)
+    user_id = (await client.get("/api/v1/auth/me", headers=user)).json()["id"]
+    sets = [
+        {"weight": 100, "reps": 5},
+        {"weight": 1e308, "reps": 5},
+        {"weight": 100, "reps": 1e12},
+        {"weight": 100, "reps": 10**12},
+    ]
+
+    async with AsyncSessionLocal() as session:
+        await volume_rollups.apply(
+            session, user_id, [EntryChange(1, date(2024, 6, 3), exercise_id, sets)]
+        )
+        result = await session.execute(
+            text(
+                "SELECT set_count, total_reps, volume FROM volume_rollups"
+                " WHERE user_id = :user_id AND granularity = 'day'"
+            ),
+            {"user_id": user_id},
+        )
+        rows = [tuple(row) for row in result]
+        await session.rollback()
+
+    assert rows == [(4, 10, 500.0)]
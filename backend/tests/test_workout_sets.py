@@ -0,0 +1,48 @@
+import uuid
+from datetime import date
+
+from sqlalchemy import text
+
+from app.database import AsyncSessionLocal
+from app.models import WorkoutEntry
+from app.services import workout_sets
+from tests.conftest import create_exercise
+
+
+async def test_out_of_range_values_are_stored_as_null(client, user):
+    exercise_id = await create_exercise(client, user)
+    user_id = (await client.get("/api/v1/auth/me", headers=user)).json()["id"]
+    entry = WorkoutEntry(
+        id=str(uuid.uuid4()),
+        user_id=user_id,
+        date=date(2024, 6, 3),
+        exercise_id=exercise_id,
+        workout_type="Strength",
+        sets=[
+            {"weight": 82.5, "reps": 8, "timeMinutes": 1.5, "distance": 0, "rpe": 8.5},
+            {"weight": 1e308, "reps": 1e12, "timeMinutes": 1e300, "distance": "far"},
+            {"weight": 100, "reps": 10**12},
+            "legacy",
+        ],
+    )
+
+    async with AsyncSessionLocal() as session:
+        session.add(entry)
+        await session.flush()
+        await workout_sets.insert(session, user_id, [entry.id])
+        result = await session.execute(
+            text(
+                "SELECT weight, reps, time_minutes, distance, rpe FROM workout_sets"
+                " WHERE entry_id = :entry_id ORDER BY ordinal"
+            ),
+            {"entry_id": entry.id},
+        )
+        rows = [tuple(row) for row in result]
+        await session.rollback()
+
+    assert rows == [
+        (82.5, 8, 1.5, 0.0, 8.5),
+        (None, None, None, None, None),
+        (100.0, None, None, None, None),
+        (None, None, None, None, None),
+    ]